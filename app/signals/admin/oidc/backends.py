@@ -1,12 +1,83 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2022 - 2024 Delta10 B.V., Gemeente Amsterdam
+# Copyright (C) 2022 - 2026 Delta10 B.V., Gemeente Amsterdam
+import threading
+import time
+from typing import Any
+
+import jwt
+import requests
 from amsterdam_django_oidc import OIDCAuthenticationBackend
+from django.core.exceptions import SuspiciousOperation
+from django.utils.encoding import smart_str
+
+# The JWKS is fetched again (because the keys might have been rotated) at most once per this many seconds when a
+# token is signed with an unknown key, so tokens with made up key ids cannot be used to flood the OP
+JWKS_MIN_REFRESH_INTERVAL = 60
 
 
 class AuthenticationBackend(OIDCAuthenticationBackend):
+    # The backend is instantiated for every request, the JWKS is shared by all instances in the process
+    _jwks: dict[str, Any] | None = None
+    _jwks_fetched_at: float = 0.0
+    _jwks_lock = threading.Lock()
+
     def filter_users_by_claims(self, claims):
         email = claims.get('email')
         if not email:
             return self.UserModel.objects.none()
 
         return self.UserModel.objects.filter(username__iexact=email)
+
+    def fetch_jwks(self) -> dict[str, Any]:
+        response = requests.get(
+            self.OIDC_OP_JWKS_ENDPOINT,
+            verify=self.get_settings('OIDC_VERIFY_SSL', True),
+            timeout=self.get_settings('OIDC_TIMEOUT', None),
+            proxies=self.get_settings('OIDC_PROXY', None),
+        )
+        response.raise_for_status()
+        return response.json()
+
+    def get_jwks(self, refresh: bool = False) -> dict[str, Any]:
+        """
+        Returns the JWKS of the OP, kept in memory for OIDC_JWKS_CACHE_TTL seconds
+        """
+        cls = type(self)
+        with cls._jwks_lock:
+            age = time.monotonic() - cls._jwks_fetched_at
+            if cls._jwks is None or refresh or age >= self.get_settings('OIDC_JWKS_CACHE_TTL', 3600):
+                cls._jwks = self.fetch_jwks()
+                cls._jwks_fetched_at = time.monotonic()
+            return cls._jwks
+
+    @classmethod
+    def clear_jwks(cls) -> None:
+        with cls._jwks_lock:
+            cls._jwks = None
+            cls._jwks_fetched_at = 0.0
+
+    def find_matching_jwk(self, jwks: dict[str, Any], header: dict[str, Any]) -> dict[str, Any] | None:
+        key = None
+        for jwk in jwks.get('keys', []):
+            if self.get_settings('OIDC_VERIFY_KID', True) and jwk.get('kid') != smart_str(header.get('kid')):
+                continue
+            if 'alg' in jwk and jwk['alg'] != smart_str(header.get('alg')):
+                continue
+            key = jwk
+        return key
+
+    def retrieve_matching_jwk(self, token):
+        """
+        Get the signing key from the (cached) JWKS of the OP
+
+        When no key matches the JWKS is fetched again, because the OP might have rotated its keys.
+        """
+        header = jwt.get_unverified_header(token)
+
+        key = self.find_matching_jwk(self.get_jwks(), header)
+        if key is None and time.monotonic() - type(self)._jwks_fetched_at >= JWKS_MIN_REFRESH_INTERVAL:
+            key = self.find_matching_jwk(self.get_jwks(refresh=True), header)
+
+        if key is None:
+            raise SuspiciousOperation('Could not find a valid JWKS.')
+        return jwt.PyJWK(key)
@@ -1,5 +1,10 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2022 - 2023 Delta10 B.V., Gemeente Amsterdam
+# Copyright (C) 2022 - 2026 Delta10 B.V., Gemeente Amsterdam
+import base64
+from unittest.mock import patch
+
+import jwt
+from django.core.exceptions import SuspiciousOperation
 from django.test import TestCase
 
 from signals.admin.oidc.backends import AuthenticationBackend
@@ -29,3 +34,42 @@ class BackendsTest(TestCase):
             users_from_backend = backend.filter_users_by_claims(claims)
 
             self.assertEqual(users_from_backend.count(), 0)
+
+
+def jwk(kid, secret):
+    return {'kty': 'oct', 'kid': kid, 'alg': 'HS256', 'k': base64.urlsafe_b64encode(secret).rstrip(b'=').decode()}
+
+
+class JWKSCacheTest(TestCase):
+    def setUp(self):
+        AuthenticationBackend.clear_jwks()
+        self.token = jwt.encode({'sub': 'test'}, b'secret-1', algorithm='HS256', headers={'kid': 'key-1'})
+        self.rotated_token = jwt.encode({'sub': 'test'}, b'secret-2', algorithm='HS256', headers={'kid': 'key-2'})
+
+    def tearDown(self):
+        AuthenticationBackend.clear_jwks()
+
+    def test_jwks_is_cached(self):
+        jwks = {'keys': [jwk('key-1', b'secret-1')]}
+        with patch.object(AuthenticationBackend, 'fetch_jwks', return_value=jwks) as fetch:
+            for _ in range(3):
+                key = AuthenticationBackend().retrieve_matching_jwk(self.token)
+                self.assertEqual(key.key_id, 'key-1')
+
+        fetch.assert_called_once()
+
+    def test_jwks_is_fetched_again_when_keys_are_rotated(self):
+        jwks = [{'keys': [jwk('key-1', b'secret-1')]}, {'keys': [jwk('key-2', b'secret-2')]}]
+        with patch.object(AuthenticationBackend, 'fetch_jwks', side_effect=jwks) as fetch:
+            AuthenticationBackend().retrieve_matching_jwk(self.token)
+
+            # Only when the JWKS was not fetched recently
+            with self.assertRaises(SuspiciousOperation):
+                AuthenticationBackend().retrieve_matching_jwk(self.rotated_token)
+            self.assertEqual(fetch.call_count, 1)
+
+            AuthenticationBackend._jwks_fetched_at -= 60
+            key = AuthenticationBackend().retrieve_matching_jwk(self.rotated_token)
+
+        self.assertEqual(key.key_id, 'key-2')
+        self.assertEqual(fetch.call_count, 2)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.apps import AppConfig
 
 
@@ -16,6 +16,9 @@ class ApiConfig(AppConfig):
         See: https://docs.djangoproject.com/en/3.2/ref/applications/#django.apps.AppConfig.ready
 
         In this case it is used to import the signals.auth.schema module. Which
-        is needed to register the auth drf-spectacular schema.
+        is needed to register the auth drf-spectacular schema. And to register
+        the signal receivers that invalidate the cached filter choices.
         """
         import signals.auth.schema  # noqa: F401
+
+        from . import signal_receivers  # noqa: F401
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from collections import OrderedDict
 
 from datapunt_api.serializers import LinksField
@@ -121,6 +121,10 @@ class CategoryHyperlinkedRelatedField(serializers.HyperlinkedRelatedField):
             queryset = queryset.filter(parent__slug=view_kwargs[f'{self.parent_lookup_prefix}parent__slug'])
         return queryset.get(slug=view_kwargs['slug'])
 
+    def use_pk_only_optimization(self):
+        # The Category (and its parent) are needed for the URL, use the instance (usually selected with the object)
+        return False
+
     def get_url(self, obj, view_name, request, format):
         # We want a Category instance, DRF can also return a PKOnlyObject when use_pk_only_optimization is enabled
         category = obj if isinstance(obj, Category) else self.get_queryset().get(pk=obj.pk)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 from signals.apps.api.filters.area import AreaFilterSet
 from signals.apps.api.filters.department import DepartmentFilterSet
 from signals.apps.api.filters.question import QuestionFilterSet
@@ -21,6 +21,7 @@ from signals.apps.api.filters.utils import (
     department_choices,
     feedback_choices,
     kind_choices,
+    search_mode_choices,
     source_choices,
     stadsdelen_choices,
     status_choices
@@ -46,6 +47,7 @@ __all__ = [
     'department_choices',
     'feedback_choices',
     'kind_choices',
+    'search_mode_choices',
     'status_choices',
     'source_choices',
     'stadsdelen_choices',
@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
-from django_filters.rest_framework import FilterSet, filters
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from django_filters.rest_framework import FilterSet
 
+from signals.apps.api.filters.fields import ReferenceMultipleChoiceFilter
 from signals.apps.api.filters.utils import area_code_choices, area_type_code_choices
 
 
@@ -11,5 +12,5 @@ class AreaFilterSet(FilterSet):
     - code
     - type_code
     """
-    code = filters.MultipleChoiceFilter(choices=area_code_choices)
-    type_code = filters.MultipleChoiceFilter(field_name='_type__code', choices=area_type_code_choices)
+    code = ReferenceMultipleChoiceFilter(choices=area_code_choices)
+    type_code = ReferenceMultipleChoiceFilter(field_name='_type__code', choices=area_type_code_choices)
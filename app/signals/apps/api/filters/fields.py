@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django_filters import fields
+from django_filters.rest_framework import filters
+
+
+class ReferenceChoiceFieldMixin:
+    """
+    Validates a value against the (cached) set of values of the reference choices, instead of iterating over the choices
+    """
+    def __init__(self, *args, valid_values=None, **kwargs):
+        self.valid_values = valid_values
+        super().__init__(*args, **kwargs)
+
+    def valid_value(self, value):
+        if self.valid_values is None:
+            return super().valid_value(value)
+        return str(value) in self.valid_values()
+
+
+class ReferenceChoiceField(ReferenceChoiceFieldMixin, fields.ChoiceField):
+    pass
+
+
+class ReferenceMultipleChoiceField(ReferenceChoiceFieldMixin, fields.MultipleChoiceField):
+    pass
+
+
+class ReferenceChoiceFilter(filters.ChoiceFilter):
+    """
+    A ChoiceFilter for choices decorated with reference_choices (see signals.apps.api.filters.utils)
+    """
+    field_class = ReferenceChoiceField
+
+    def __init__(self, *args, choices, **kwargs):
+        super().__init__(*args, choices=choices, valid_values=choices.values, **kwargs)
+
+
+class ReferenceMultipleChoiceFilter(filters.MultipleChoiceFilter):
+    """
+    A MultipleChoiceFilter for choices decorated with reference_choices (see signals.apps.api.filters.utils)
+    """
+    field_class = ReferenceMultipleChoiceField
+
+    def __init__(self, *args, choices, **kwargs):
+        super().__init__(*args, choices=choices, valid_values=choices.values, **kwargs)
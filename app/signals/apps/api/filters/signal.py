@@ -1,12 +1,13 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2022 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 from django.conf import settings
 from django.contrib.gis.geos import Point, Polygon
-from django.db.models import Count, F, Max, Min, Q
+from django.db.models import Count, Exists, F, Max, Min, OuterRef, Q
 from django.utils.timezone import now
 from django_filters.rest_framework import FilterSet, filters
 from rest_framework.exceptions import ValidationError
 
+from signals.apps.api.filters.fields import ReferenceChoiceFilter, ReferenceMultipleChoiceFilter
 from signals.apps.api.filters.utils import (
     _get_child_category_queryset,
     _get_parent_category_queryset,
@@ -20,22 +21,24 @@ from signals.apps.api.filters.utils import (
     feedback_choices,
     kind_choices,
     punctuality_choices,
+    search_mode_choices,
     source_choices,
     stadsdelen_choices,
     status_choices
 )
 from signals.apps.signals import workflow
-from signals.apps.signals.models import Category, Priority, Type
+from signals.apps.signals.models import Category, Note, Priority, Type
+from signals.apps.signals.models.functions.text_search import full_text_condition
 
 
 class SignalFilterSet(FilterSet):
     id = filters.NumberFilter()
-    address_text = filters.CharFilter(field_name='location__address_text', lookup_expr='icontains')
-    area_code = filters.MultipleChoiceFilter(field_name='location__area_code', choices=area_choices)
-    area_type_code = filters.ChoiceFilter(field_name='location__area_type_code', choices=area_type_choices)
-    buurt_code = filters.MultipleChoiceFilter(field_name='location__buurt_code', choices=buurt_choices)
-    category_id = filters.MultipleChoiceFilter(field_name='category_assignment__category_id',
-                                               choices=category_choices)
+    address_text = filters.CharFilter(method='address_text_filter')
+    area_code = ReferenceMultipleChoiceFilter(field_name='location__area_code', choices=area_choices)
+    area_type_code = ReferenceChoiceFilter(field_name='location__area_type_code', choices=area_type_choices)
+    buurt_code = ReferenceMultipleChoiceFilter(field_name='location__buurt_code', choices=buurt_choices)
+    category_id = ReferenceMultipleChoiceFilter(field_name='category_assignment__category_id',
+                                                choices=category_choices)
     category_slug = filters.ModelMultipleChoiceFilter(
         queryset=_get_child_category_queryset(),
         to_field_name='slug',
@@ -43,7 +46,7 @@ class SignalFilterSet(FilterSet):
     )
     contact_details = filters.MultipleChoiceFilter(method='contact_details_filter', choices=contact_details_choices)
     created_before = filters.IsoDateTimeFilter(field_name='created_at', lookup_expr='lte')
-    directing_department = filters.MultipleChoiceFilter(
+    directing_department = ReferenceMultipleChoiceFilter(
         method='directing_department_filter',
         choices=department_choices
     )
@@ -61,7 +64,7 @@ class SignalFilterSet(FilterSet):
     )
     note_keyword = filters.CharFilter(method='note_keyword_filter')
     priority = filters.MultipleChoiceFilter(field_name='priority__priority', choices=Priority.PRIORITY_CHOICES)
-    source = filters.MultipleChoiceFilter(choices=source_choices)
+    source = ReferenceMultipleChoiceFilter(choices=source_choices)
     stadsdeel = filters.MultipleChoiceFilter(field_name='location__stadsdeel', choices=stadsdelen_choices)
     status = filters.MultipleChoiceFilter(field_name='status__state', choices=status_choices)
     type = filters.MultipleChoiceFilter(field_name='type_assignment__name', choices=Type.CHOICES)
@@ -69,7 +72,8 @@ class SignalFilterSet(FilterSet):
     updated_after = filters.IsoDateTimeFilter(field_name='updated_at', lookup_expr='gte')
     assigned_user_email = filters.CharFilter(method='assigned_user_email_filter')
     reporter_email = filters.CharFilter(field_name='reporter__email', lookup_expr='iexact')
-    routing_department_code = filters.MultipleChoiceFilter(
+    search_mode = filters.ChoiceFilter(method='search_mode_filter', choices=search_mode_choices)
+    routing_department_code = ReferenceMultipleChoiceFilter(
         field_name='routing_assignment__departments__code', choices=department_choices
     )
     punctuality = filters.ChoiceFilter(method='punctuality_filter', choices=punctuality_choices, label='Punctuality')
@@ -230,8 +234,33 @@ class SignalFilterSet(FilterSet):
 
         return queryset.filter(q_filter).distinct() if q_filter else queryset
 
+    def _full_text_search(self):
+        return self.form.cleaned_data.get('search_mode') == 'fulltext'
+
+    def search_mode_filter(self, queryset, name, value):
+        # Determines how address_text and note_keyword search, see _full_text_search
+        return queryset
+
+    def address_text_filter(self, queryset, name, value):
+        """
+        By default the address contains the given text, with "search_mode=fulltext" the address matches the given
+        (web search) query
+        """
+        if self._full_text_search():
+            return queryset.filter(full_text_condition('location__address_text', value))
+        return queryset.filter(location__address_text__icontains=value)
+
     def note_keyword_filter(self, queryset, name, value):
-        return queryset.filter(notes__text__icontains=value).distinct()
+        """
+        By default one of the notes contains the given text, with "search_mode=fulltext" one of the notes matches the
+        given (web search) query
+        """
+        notes = Note.objects.filter(_signal_id=OuterRef('pk'))
+        if self._full_text_search():
+            notes = notes.filter(full_text_condition('text', value))
+        else:
+            notes = notes.filter(text__icontains=value)
+        return queryset.filter(Exists(notes))
 
     def assigned_user_email_filter(self, queryset, name, value):
         if value == 'null':
@@ -331,6 +360,7 @@ class PublicSignalGeographyFilter(FilterSet):
     bbox = filters.CharFilter()  # min_lon, min_lat, max_lon, max_lat
     lat = filters.NumberFilter()
     lon = filters.NumberFilter()
+    zoom = filters.NumberFilter(min_value=0, max_value=30)  # Zoom level of the map, used for clustering
 
     maincategory_slug = filters.ModelMultipleChoiceFilter(
         queryset=_get_parent_category_queryset(), to_field_name='slug'
@@ -365,6 +395,7 @@ class PublicSignalGeographyFilter(FilterSet):
 
         lat = self.form.cleaned_data.pop('lat', None)
         lon = self.form.cleaned_data.pop('lon', None)
+        self.form.cleaned_data.pop('zoom', None)  # Not a filter, see PublicSignalViewSet.geography
 
         geometrie_filter = Q(geometry__within=Polygon.from_bbox(bbox)) if bbox \
             else Q(geometry=Point(float(lon), float(lat), srid=4326))
@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 from django_filters.rest_framework import FilterSet, filters
 
 from signals.apps.api.filters import category_choices, status_choices
+from signals.apps.api.filters.fields import ReferenceChoiceFilter
 
 
 class StatusMessagesFilterSet(FilterSet):
     active = filters.BooleanFilter()
-    category_id = filters.ChoiceFilter(field_name='categories', choices=category_choices)
+    category_id = ReferenceChoiceFilter(field_name='categories', choices=category_choices)
     state = filters.MultipleChoiceFilter(choices=status_choices)
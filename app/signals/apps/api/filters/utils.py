@@ -1,5 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+import functools
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from signals.apps.services.domain.cache_version import CacheVersion
 from signals.apps.signals.models import (
     STADSDELEN,
     Area,
@@ -13,23 +19,106 @@ from signals.apps.signals.models import (
 )
 from signals.apps.signals.workflow import STATUS_CHOICES
 
+Choices = tuple[tuple[str, str], ...]
+
+
+class ReferenceChoices:
+    """
+    In-process cache of the choices derived from the reference tables (areas, buurten, categories, departments and
+    sources), so validating a filter does not read these tables for every request
+
+    All processes share one version in the cache, the version is replaced whenever one of the reference models is
+    saved or deleted or reference data is loaded, after which every process rebuilds its choices. The version is read
+    at most once per VERSION_CHECK_INTERVAL seconds (a filterset uses several choices). As a safeguard for data loaded
+    outside of Django (e.g. the buurten) the choices are also rebuilt after MAX_AGE seconds.
+    """
+    MAX_AGE = 15 * 60
+    VERSION_CHECK_INTERVAL = 1
+
+    cache_version = CacheVersion('signals-filter-choices-version')
+
+    _lock = threading.Lock()
+    _version: Optional[str] = None
+    _version_checked_at = 0.0
+    _choices: dict[str, tuple[Choices, frozenset[str], float]] = {}
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._version = None
+            cls._choices = {}
+        cls.cache_version.replace()
+
+    @classmethod
+    def _check_version(cls) -> None:
+        now = time.monotonic()
+        if cls._version is not None and now - cls._version_checked_at < cls.VERSION_CHECK_INTERVAL:
+            return
+
+        version = cls.cache_version.get()
+        with cls._lock:
+            if cls._version != version:
+                cls._version = version
+                cls._choices = {}
+            cls._version_checked_at = now
+
+    @classmethod
+    def _get(cls, name: str, build: Callable[[], Iterable[tuple]]) -> tuple[Choices, frozenset[str], float]:
+        cls._check_version()
+        with cls._lock:
+            entry = cls._choices.get(name)
+            if entry is None or time.monotonic() - entry[2] >= cls.MAX_AGE:
+                choices = tuple(build())
+                entry = (choices, frozenset(str(value) for value, _ in choices), time.monotonic())
+                cls._choices[name] = entry
+            return entry
+
+    @classmethod
+    def get(cls, name: str, build: Callable[[], Iterable[tuple]]) -> Choices:
+        return cls._get(name, build)[0]
+
+    @classmethod
+    def values(cls, name: str, build: Callable[[], Iterable[tuple]]) -> frozenset[str]:
+        """
+        The values of the choices as strings, to validate (query string) values against
+        """
+        return cls._get(name, build)[1]
+
+
+def reference_choices(func: Callable[[], Iterable[tuple]]) -> Callable[[], list[tuple]]:
+    """
+    Cache the choices returned by the decorated function in the ReferenceChoices, the set of valid values is available
+    as the "values" attribute of the decorated function
+    """
+    @functools.wraps(func)
+    def wrapper() -> list[tuple]:
+        return list(ReferenceChoices.get(func.__name__, func))
+
+    wrapper.values = lambda: ReferenceChoices.values(func.__name__, func)
+    return wrapper
+
+
 # Helper functions to to determine available choices used for filtering
 
 
+@reference_choices
 def area_code_choices():
     return [(area.code, area.code) for area in Area.objects.only('code').all().distinct()]
 
 
+@reference_choices
 def area_type_code_choices():
     return [(area_type.code, area_type.code) for area_type in AreaType.objects.only('code').all().distinct()]
 
 
+@reference_choices
 def area_type_choices():
     return [
         ('null', 'null'),
     ] + [(c, f'{n} ({c})') for c, n in AreaType.objects.values_list('code', 'name')]
 
 
+@reference_choices
 def area_choices():
     return [
         ('null', 'null'),
@@ -41,6 +130,7 @@ boolean_false_choices = [(False, 'False'), ('false', 'false'), ('False', 'False'
 boolean_choices = boolean_true_choices + boolean_false_choices
 
 
+@reference_choices
 def buurt_choices():
     return [(c, f'{n} ({c})') for c, n in Buurt.objects.values_list('vollcode', 'naam')]
 
@@ -49,6 +139,7 @@ def contact_details_choices():
     return (('none', 'none'), ('email', 'email'), ('phone', 'phone'), )
 
 
+@reference_choices
 def department_choices():
     return [
         ('null', 'null'),
@@ -82,10 +173,15 @@ def punctuality_choices():
     return (('on_time', 'on_time'), ('late', 'late'), ('late_factor_3', 'late_factor_3'), ('null', 'null'))
 
 
+def search_mode_choices():
+    return (('contains', 'contains'), ('fulltext', 'fulltext'), )
+
+
 def status_choices():
     return [(c, f'{n} ({c})') for c, n in STATUS_CHOICES]
 
 
+@reference_choices
 def source_choices():
     return [(choice, f'{choice}') for choice in Source.objects.order_by('name').values_list('name', flat=True).distinct()]  # noqa
 
@@ -105,6 +201,7 @@ def _get_parent_category_queryset():
     return Category.objects.filter(parent__isnull=True)
 
 
+@reference_choices
 def category_choices():
     # Only select id and name to prevent retrieving the related models as we don't need them here
     choices = [(category['id'], f'{category["name"]}') for category in Category.objects.values('id', 'name').all()]
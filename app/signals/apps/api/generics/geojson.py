@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Build GeoJSON feature collections in the database
+
+Skips the DRF serializers entirely, every feature is constructed as JSON by the
+database (JSONObject/AsGeoJSON) and a page of features is aggregated into one
+JSON array (JSONAgg). See SIG-3988 for the original implementation in the
+PrivateSignalViewSet.geography endpoint.
+"""
+from django.conf import settings
+from django.contrib.gis.db.models import Collect
+from django.contrib.gis.db.models.functions import Centroid, SnapToGrid
+from django.db.models import Case, CharField, Count, QuerySet, Value, When
+from django.db.models.functions import JSONObject
+from rest_framework.response import Response
+
+from signals.apps.api.generics.pagination import LinkHeaderPaginationForQuerysets
+from signals.apps.signals.models.aggregates.json_agg import JSONAgg
+from signals.apps.signals.models.functions.asgeojson import AsGeoJSON
+
+
+class GeoJSONFeature(JSONObject):
+    """
+    A GeoJSON Feature, the properties are given as keyword arguments (just like JSONObject)
+    """
+    def __init__(self, geometry='location__geometrie', **properties):
+        super().__init__(
+            type=Value('Feature', output_field=CharField()),
+            geometry=AsGeoJSON(geometry),
+            properties=JSONObject(**properties),
+        )
+
+
+def choice_display(field_name: str, choices: tuple) -> Case:
+    """
+    Database equivalent of the "get_FOO_display" of a model field with choices
+    """
+    return Case(
+        *[When(**{field_name: value}, then=Value(str(display))) for value, display in choices],
+        default=Value(None),
+        output_field=CharField(),
+    )
+
+
+def grid_size_for_zoom(zoom: int, cluster_size_in_pixels: int) -> float:
+    """
+    The size in degrees (longitude) of a square of the given number of pixels, on a web map (256 pixel tiles) at the
+    given zoom level
+    """
+    return 360 / 2 ** zoom * cluster_size_in_pixels / 256
+
+
+def clustered_features(features_qs: QuerySet, grid_size: float, geometry: str = 'geometry') -> QuerySet:
+    """
+    Groups the points on a grid of the given size (ST_SnapToGrid), one Feature per grid cell with the centroid of its
+    points and the number of points ("count") as property
+    """
+    return features_qs.annotate(
+        cell=SnapToGrid(geometry, grid_size),
+    ).values(
+        'cell',
+    ).annotate(
+        feature=GeoJSONFeature(geometry=Centroid(Collect(geometry)), count=Count('pk')),
+    ).order_by(
+        'cell',
+    )
+
+
+def feature_collection(features_qs: QuerySet, feature_field: str = 'feature') -> dict:
+    """
+    Aggregates the (paginated) queryset into a GeoJSON FeatureCollection using one query
+
+    Note: the features are an empty list if the queryset is empty (the JSON aggregate in the database returns null).
+    """
+    features = features_qs.aggregate(features=JSONAgg(feature_field, default=Value('[]')))['features']
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def paginated_feature_collection_response(features_qs: QuerySet, request, view, page_size: int = None,
+                                          feature_field: str = 'feature') -> Response:
+    """
+    Paginates the queryset (the pagination is done in the database) and returns
+    a Response with the GeoJSON FeatureCollection of the requested page
+    """
+    paginator = LinkHeaderPaginationForQuerysets(page_query_param='geopage',
+                                                 page_size=page_size or settings.SIGNALS_API_GEO_PAGINATE_BY)
+    page_qs = paginator.paginate_queryset(features_qs, request, view=view)
+    if page_qs is None:
+        return Response({'type': 'FeatureCollection', 'features': []})
+
+    return Response(feature_collection(page_qs, feature_field=feature_field),
+                    headers=paginator.get_pagination_headers())
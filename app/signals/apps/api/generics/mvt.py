@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Build Mapbox Vector Tiles (MVT) in the database
+
+The (filtered) queryset is used as a subquery, its points are transformed to the
+tile coordinates (ST_AsMVTGeom) and encoded as one tile (ST_AsMVT).
+"""
+import math
+
+from django.db import connection
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from rest_framework.exceptions import NotFound
+from rest_framework.negotiation import BaseContentNegotiation
+
+MVT_CONTENT_TYPE = 'application/vnd.mapbox-vector-tile'
+MVT_EXTENT = 4096  # The size of a tile in tile coordinates
+MVT_BUFFER = 64  # Features within this many tile coordinates outside the tile are included, so markers are not cut off
+
+MAX_ZOOM = 24
+
+
+class IgnoreClientContentNegotiation(BaseContentNegotiation):
+    """
+    Tiles are returned as is, errors are rendered by the first renderer (JSON)
+    """
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def tile_bbox(z: int, x: int, y: int, buffer: int = MVT_BUFFER) -> tuple[float, float, float, float]:
+    """
+    The bounding box (min_lon, min_lat, max_lon, max_lat) of a tile (z/x/y), including the buffer
+    """
+    n = 2 ** z
+    if z > MAX_ZOOM or x >= n or y >= n:
+        raise NotFound(f'Tile {z}/{x}/{y} does not exist')
+
+    margin = buffer / MVT_EXTENT
+    min_x, max_x = max(x - margin, 0), min(x + 1 + margin, n)
+    min_y, max_y = max(y - margin, 0), min(y + 1 + margin, n)
+
+    def lon(tile_x):
+        return tile_x / n * 360 - 180
+
+    def lat(tile_y):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * tile_y / n))))
+
+    return lon(min_x), lat(max_y), lon(max_x), lat(min_y)
+
+
+def mvt_tile(features_qs: QuerySet, z: int, x: int, y: int, properties: list[str], geometry: str = 'geometry',
+             layer: str = 'signals') -> bytes:
+    """
+    Encodes the features of the queryset (a values queryset with the geometry and the properties) as a vector tile
+
+    Note: the properties should be simple values (numbers, strings, booleans), anything else is encoded as a string.
+    """
+    sql, params = features_qs.query.sql_with_params()
+    columns = ', '.join(f'"features"."{name}"' for name in properties)
+    query = f'''
+        SELECT ST_AsMVT("tile", %s, %s, 'mvt_geometry') FROM (
+          SELECT
+            ST_AsMVTGeom(
+              ST_Transform("features"."{geometry}", 3857), ST_TileEnvelope(%s, %s, %s), %s, %s, true
+            ) AS "mvt_geometry",
+            {columns}
+          FROM ({sql}) AS "features"
+        ) AS "tile"
+        WHERE "tile"."mvt_geometry" IS NOT NULL
+    '''
+    with connection.cursor() as cursor:
+        cursor.execute(query, [layer, MVT_EXTENT, z, x, y, MVT_EXTENT, MVT_BUFFER, *params])
+        tile = cursor.fetchone()[0]
+    return bytes(tile) if tile else b''
+
+
+def mvt_response(tile: bytes, max_age: int, private: bool = False) -> HttpResponse:
+    """
+    Returns the tile with cache headers, a private tile is only cached by the client (per Authorization header)
+    """
+    response = HttpResponse(tile, content_type=MVT_CONTENT_TYPE)
+    if private:
+        patch_cache_control(response, private=True, max_age=max_age)
+        patch_vary_headers(response, ('Authorization', ))
+    else:
+        patch_cache_control(response, public=True, max_age=max_age)
+    return response
@@ -1,13 +1,203 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from collections import OrderedDict
+from functools import cached_property
+
 from datapunt_api.pagination import HALPagination as DataPuntHALPagination
-from django.core.paginator import InvalidPage
-from rest_framework.exceptions import NotFound
+from django.core.paginator import InvalidPage, Page, PageNotAnInteger, Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def estimated_count(queryset) -> int:
+    """
+    The number of rows the query planner expects the queryset to return, no COUNT(*) is performed
+    """
+    plan = json.loads(queryset.order_by().explain(format='json'))
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPage(Page):
+    """
+    Page of the EstimatedCountPaginator, whether there is a next page is determined by the rows and not by the count
+    """
+    def __init__(self, object_list, number, paginator, has_next: bool):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def start_index(self) -> int:
+        return (self.number - 1) * self.paginator.per_page + 1 if self.object_list else 0
+
+    def end_index(self) -> int:
+        return (self.number - 1) * self.paginator.per_page + len(self.object_list)
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses the row estimate of the query planner as count
+
+    The estimate is only used as count. A page selects one row more than the page size to determine if there is a next
+    page, the number of pages is the number of the last page requested (plus one when it has a next page). Because the
+    count is an estimate the last page is not validated against it, a page past the end of the results is just empty.
+    """
+    _page = None
+
+    @cached_property
+    def count(self) -> int:
+        return estimated_count(self.object_list)
+
+    @property
+    def num_pages(self) -> int:
+        if self._page is None:
+            # Before a page is requested (for instance for "?page=last") only the estimate is known
+            return super().num_pages
+        return self._page.number + 1 if self._page.has_next() else self._page.number
+
+    def validate_number(self, number):
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise InvalidPage('That page number is less than 1')
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        self._page = EstimatedCountPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+        return self._page
+
+
+class CursorPaginationMixin:
+    """
+    Opt-in keyset ("cursor") pagination and estimated counts for the page number paginations below
+
+    Keyset pagination is enabled with "?pagination=cursor" (or by following a link that contains a cursor). The page
+    is selected by a WHERE clause on the active ordering (and the id as tie-breaker) instead of an OFFSET, and no
+    COUNT(*) is performed. Use "?count=estimated" to get the row estimate of the query planner as count, this also
+    works for the page number pagination.
+    """
+    cursor_query_param = 'cursor'
+    pagination_mode_query_param = 'pagination'
+    count_mode_query_param = 'count'
+    cursor_ordering_fields = ('created_at', 'id', 'updated_at')
+
+    cursor_page_size = None
+    next_cursor = None
+    previous_cursor = None
+
+    def is_cursor_mode(self, request) -> bool:
+        return (request.query_params.get(self.pagination_mode_query_param) == 'cursor' or
+                self.cursor_query_param in request.query_params)
+
+    def is_estimated_count_mode(self, request) -> bool:
+        return request.query_params.get(self.count_mode_query_param) == 'estimated'
+
+    def get_cursor_ordering(self, queryset) -> tuple[str, bool]:
+        ordering = queryset.query.order_by or queryset.model._meta.ordering or ('id', )
+        if not isinstance(ordering[0], str) or ordering[0].lstrip('-') not in self.cursor_ordering_fields:
+            raise ValidationError({
+                'ordering': 'Cursor pagination is only possible when ordering on one of: '
+                            f'{", ".join(self.cursor_ordering_fields)}'
+            })
+        return ordering[0].lstrip('-'), ordering[0].startswith('-')
+
+    def decode_cursor(self, request) -> dict | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            cursor['pk'] = int(cursor['pk'])
+            cursor['reverse'] = bool(cursor.get('reverse', False))
+        except (BinasciiError, KeyError, TypeError, UnicodeError, ValueError):
+            raise NotFound('Invalid cursor')
+        return cursor
+
+    def encode_cursor(self, field: str, key: tuple, reverse: bool = False) -> str:
+        value, pk = key
+        cursor = {'pk': pk, 'reverse': reverse}
+        if field != 'id':
+            cursor['value'] = value.isoformat()
+        return urlsafe_b64encode(json.dumps(cursor).encode('utf-8')).decode('ascii')
+
+    def _keyset_condition(self, field: str, descending: bool, cursor: dict) -> Q:
+        lookup = 'lt' if descending else 'gt'
+        if field == 'id':
+            return Q(**{f'id__{lookup}': cursor['pk']})
+
+        value = parse_datetime(cursor.get('value') or '')
+        if value is None:
+            raise NotFound('Invalid cursor')
+        return Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, f'id__{lookup}': cursor['pk']})
+
+    def paginate_queryset_by_cursor(self, queryset, request, page_size: int):
+        """
+        Returns the queryset filtered and ordered for the requested page, the caller selects page_size + 1 rows (the
+        extra row is used to determine if there is a next page) and passes them to "finish_cursor_page".
+        """
+        field, descending = self.get_cursor_ordering(queryset)
+        cursor = self.decode_cursor(request)
+        reverse = cursor['reverse'] if cursor else False
+
+        # When going back we query in the opposite direction, the rows are reversed again afterwards
+        query_descending = descending != reverse
+        if cursor:
+            queryset = queryset.filter(self._keyset_condition(field, query_descending, cursor))
+
+        direction = '-' if query_descending else ''
+        ordering = (f'{direction}id', ) if field == 'id' else (f'{direction}{field}', f'{direction}id')
 
+        self.request = request
+        self.cursor_field = field
+        self.cursor_page_size = page_size
+        self.cursor = cursor
+        return queryset.order_by(*ordering)
+
+    def finish_cursor_page(self, rows: list, keys: list[tuple]) -> list:
+        """
+        Trims the extra row, restores the order of the rows and determines the next and previous cursors
+        """
+        has_more = len(rows) > self.cursor_page_size
+        rows, keys = rows[:self.cursor_page_size], keys[:self.cursor_page_size]
+
+        reverse = self.cursor['reverse'] if self.cursor else False
+        if reverse:
+            rows, keys = rows[::-1], keys[::-1]
+
+        # Coming from a cursor means there are rows in the direction we came from
+        has_next = True if reverse else has_more
+        has_previous = has_more if reverse else self.cursor is not None
+
+        self.next_cursor = self.encode_cursor(self.cursor_field, keys[-1]) if has_next and keys else None
+        self.previous_cursor = self.encode_cursor(
+            self.cursor_field, keys[0], reverse=True
+        ) if has_previous and keys else None
+        return rows
+
+    def get_cursor_link(self, cursor: str | None) -> str | None:
+        if cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, cursor)
 
-class HALPagination(DataPuntHALPagination):
+
+class HALPagination(CursorPaginationMixin, DataPuntHALPagination):
     def get_paginated_response_schema(self, schema: dict) -> dict:
         return {
             'type': 'object',
@@ -52,14 +242,46 @@ class HALPagination(DataPuntHALPagination):
                 },
                 'count': {
                     'type': 'integer',
+                    'nullable': True,
                     'example': 123,
                 },
                 'results': schema,
             },
         }
 
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.is_cursor_mode(request)
+        self.estimated_count_mode = self.is_estimated_count_mode(request)
+        if self.estimated_count_mode:
+            self.django_paginator_class = EstimatedCountPaginator
+
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view=view)
 
-class LinkHeaderPagination(PageNumberPagination):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.count = estimated_count(queryset) if self.estimated_count_mode else None
+        rows = list(self.paginate_queryset_by_cursor(queryset, request, page_size)[:page_size + 1])
+        return self.finish_cursor_page(rows, [(getattr(row, self.cursor_field), row.pk) for row in rows])
+
+    def get_paginated_response(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_response(data)
+
+        return Response(OrderedDict([
+            ('_links', OrderedDict([
+                ('self', dict(href=self.request.build_absolute_uri())),
+                ('next', dict(href=self.get_cursor_link(self.next_cursor))),
+                ('previous', dict(href=self.get_cursor_link(self.previous_cursor))),
+            ])),
+            ('count', self.count),
+            ('results', data)
+        ]))
+
+
+class LinkHeaderPagination(CursorPaginationMixin, PageNumberPagination):
     page_size_query_param = 'page_size'
 
     def __init__(self, page_query_param=None, page_size=None, *args, **kwargs):
@@ -69,6 +291,9 @@ class LinkHeaderPagination(PageNumberPagination):
         self.page_size = page_size or self.page_size
 
     def get_pagination_headers(self):
+        if getattr(self, 'cursor_mode', False):
+            return self.get_cursor_pagination_headers()
+
         headers = {'X-Total-Count': self.page.paginator.count, 'Link': []}
         next_link = self.get_next_link()
 
@@ -87,6 +312,23 @@ class LinkHeaderPagination(PageNumberPagination):
 
         return headers
 
+    def get_cursor_pagination_headers(self):
+        headers = {}
+        if self.estimated_count_mode:
+            headers['X-Total-Count'] = self.count
+
+        header_links = [f'<{self.request.build_absolute_uri()}>; rel="self"']
+        next_link = self.get_cursor_link(self.next_cursor)
+        if next_link:
+            header_links.append(f'<{next_link}>; rel="next"')
+
+        previous_link = self.get_cursor_link(self.previous_cursor)
+        if previous_link:
+            header_links.append(f'<{previous_link}>; rel="prev"')
+
+        headers['Link'] = ','.join(header_links)
+        return headers
+
     def get_paginated_response(self, data):
         return Response(data, headers=self.get_pagination_headers())
 
@@ -104,7 +346,16 @@ class LinkHeaderPaginationForQuerysets(LinkHeaderPagination):
         if not page_size:
             return None
 
-        paginator = self.django_paginator_class(queryset, page_size)
+        self.cursor_mode = self.is_cursor_mode(request)
+        self.estimated_count_mode = self.is_estimated_count_mode(request)
+        if self.cursor_mode:
+            return self._paginate_queryset_by_cursor(queryset, request, page_size)
+
+        if self.estimated_count_mode:
+            # Only the keys of the page are selected, the page itself is returned as a queryset (see below)
+            paginator = EstimatedCountPaginator(queryset.values_list('pk', flat=True), page_size)
+        else:
+            paginator = self.django_paginator_class(queryset, page_size)
         page_number = self.get_page_number(request, paginator)
 
         try:
@@ -117,4 +368,18 @@ class LinkHeaderPaginationForQuerysets(LinkHeaderPagination):
             self.display_page_controls = True
 
         self.request = request
+        if self.estimated_count_mode:
+            return queryset.filter(pk__in=self.page.object_list)
         return self.page.object_list
+
+    def _paginate_queryset_by_cursor(self, queryset, request, page_size):
+        # Only the keys of the page are selected, the page itself is returned
+        # as a queryset so it can still be aggregated in the database
+        self.count = estimated_count(queryset) if self.estimated_count_mode else None
+        keys = list(
+            self.paginate_queryset_by_cursor(queryset, request, page_size).values_list(
+                self.cursor_field, 'pk'
+            )[:page_size + 1]
+        )
+        keys = self.finish_cursor_page(keys, keys)
+        return queryset.filter(pk__in=[pk for _, pk in keys])
@@ -1,10 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2024 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
+import hashlib
 import os
 from typing import Callable
 
 from django.conf import settings
-from django.contrib.auth import login
+from django.contrib.auth import HASH_SESSION_KEY, SESSION_KEY, login
 from django.contrib.auth.models import AnonymousUser
 from django.http import HttpRequest, HttpResponse
 from django.urls import resolve
@@ -33,15 +34,42 @@ class APIVersionHeaderMiddleware:
 
 
 class SessionLoginMiddleware:
+    """
+    Establishes a session for users authenticated (with a token) on the private API
+
+    The user is only logged in when the session is not (yet) a valid session of that user for the same token, the
+    session remembers a fingerprint of the token. So the session is written once per token instead of on every request.
+    """
+    TOKEN_FINGERPRINT_SESSION_KEY = '_signals_token_fingerprint'
+
     def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
         self.get_response = get_response
 
+    @staticmethod
+    def get_token_fingerprint(request: HttpRequest) -> str | None:
+        token = getattr(request, 'auth', None)
+        if not token or not isinstance(token, str):
+            return None
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def has_valid_session(self, request: HttpRequest, fingerprint: str | None) -> bool:
+        user = request.user
+        session = request.session
+        return (
+            session.get(SESSION_KEY) == user._meta.pk.value_to_string(user) and
+            session.get(HASH_SESSION_KEY) == user.get_session_auth_hash() and
+            session.get(self.TOKEN_FINGERPRINT_SESSION_KEY) == fingerprint
+        )
+
     def __call__(self, request: HttpRequest) -> HttpResponse:
         response = self.get_response(request)
 
         if request.user and not isinstance(request.user, AnonymousUser):
             if request.path.startswith('/signals/v1/private'):
-                login(request, request.user, settings.AUTHENTICATION_BACKENDS[0])
+                fingerprint = self.get_token_fingerprint(request)
+                if not self.has_valid_session(request, fingerprint):
+                    login(request, request.user, settings.AUTHENTICATION_BACKENDS[0])
+                    request.session[self.TOKEN_FINGERPRINT_SESSION_KEY] = fingerprint
 
         return response
 
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from signals.apps.api.serializers.attachment import (
     PrivateSignalAttachmentSerializer,
     PublicSignalAttachmentSerializer
@@ -24,7 +24,6 @@ from signals.apps.api.serializers.signal import (
     SignalIdListSerializer
 )
 from signals.apps.api.serializers.signal_context import (
-    SignalContextGeoSerializer,
     SignalContextReporterSerializer,
     SignalContextSerializer
 )
@@ -33,7 +32,10 @@ from signals.apps.api.serializers.status_message_template import (
     StateStatusMessageTemplateListSerializer,
     StateStatusMessageTemplateSerializer
 )
-from signals.apps.api.serializers.stored_signal_filter import StoredSignalFilterSerializer
+from signals.apps.api.serializers.stored_signal_filter import (
+    StoredSignalFilterCountSerializer,
+    StoredSignalFilterSerializer
+)
 
 __all__ = [
     'AbridgedChildSignalSerializer',
@@ -50,12 +52,12 @@ __all__ = [
     'PublicSignalAttachmentSerializer',
     'PublicSignalCreateSerializer',
     'PublicSignalSerializerDetail',
-    'SignalContextGeoSerializer',
     'SignalContextReporterSerializer',
     'SignalContextSerializer',
     'SignalIdListSerializer',
     'StateStatusMessageTemplateListSerializer',
     'StateStatusMessageTemplateSerializer',
+    'StoredSignalFilterCountSerializer',
     'StoredSignalFilterSerializer',
     'StatusMessageSerializer',
 ]
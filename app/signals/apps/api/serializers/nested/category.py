@@ -1,10 +1,41 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from signals.apps.api.fields import CategoryHyperlinkedRelatedField
 from signals.apps.api.generics.serializers import SIAModelSerializer
-from signals.apps.signals.models import CategoryAssignment
+from signals.apps.signals.models import Category, CategoryAssignment, CategoryDepartment
+
+RESPONSIBLE_CATEGORY_DEPARTMENTS_ATTR = 'responsible_category_departments'
+
+
+def prefetch_responsible_departments(category_lookup: str) -> Prefetch:
+    """
+    Prefetch the responsible departments of the Category found at the given lookup (read by
+    get_responsible_department_codes), so listing Signals does not cost a query per Signal
+    """
+    return Prefetch(
+        f'{category_lookup}__categorydepartment_set',
+        queryset=CategoryDepartment.objects.filter(
+            is_responsible=True
+        ).select_related(
+            'department'
+        ).order_by(
+            'department__name'
+        ),
+        to_attr=RESPONSIBLE_CATEGORY_DEPARTMENTS_ATTR
+    )
+
+
+def get_responsible_department_codes(category: Category) -> str:
+    category_departments = getattr(category, RESPONSIBLE_CATEGORY_DEPARTMENTS_ATTR, None)
+    if category_departments is not None:
+        return ', '.join(category_department.department.code for category_department in category_departments)
+
+    return ', '.join(
+        category.departments.filter(categorydepartment__is_responsible=True).values_list('code', flat=True)
+    )
 
 
 class _NestedCategoryModelSerializer(SIAModelSerializer):
@@ -72,6 +103,4 @@ class _NestedCategoryModelSerializer(SIAModelSerializer):
         return super().validate(attrs=attrs)
 
     def get_departments(self, obj):
-        return ', '.join(
-            obj.category.departments.filter(categorydepartment__is_responsible=True).values_list('code', flat=True)
-        )
+        return get_responsible_department_codes(obj.category)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 import os
 
 from datapunt_api.rest import DisplayField, HALSerializer
@@ -31,6 +31,7 @@ from signals.apps.api.serializers.nested import (
     _NestedStatusModelSerializer,
     _NestedTypeModelSerializer
 )
+from signals.apps.api.serializers.nested.category import get_responsible_department_codes
 from signals.apps.api.validation.address.mixin import AddressValidationMixin
 from signals.apps.api.validation.mixin import SignalValidationMixin
 from signals.apps.api.validators.extra_properties import ExtraPropertiesValidator
@@ -216,6 +217,9 @@ class PrivateSignalSerializerDetail(HALSerializer, AddressValidationMixin):
         )
 
     def get_has_attachments(self, obj):
+        if hasattr(obj, 'has_attachments'):
+            # Annotated by the PrivateSignalViewSet
+            return obj.has_attachments
         return obj.attachments.exists()
 
     def update(self, instance, validated_data): # noqa
@@ -398,12 +402,18 @@ class PrivateSignalSerializerList(SignalValidationMixin, HALSerializer):
         }
 
     def get_has_attachments(self, obj):
+        if hasattr(obj, 'has_attachments'):
+            # Annotated by the PrivateSignalViewSet
+            return obj.has_attachments
         return obj.attachments.exists()
 
     def get_has_parent(self, obj):
         return obj.parent_id is not None  # True is a parent_id is set, False if not
 
     def get_has_children(self, obj):
+        if hasattr(obj, 'has_children'):
+            # Annotated by the PrivateSignalViewSet
+            return obj.has_children
         return obj.children.exists()
 
     def validate(self, attrs):  # noqa C901
@@ -705,18 +715,16 @@ class AbridgedChildSignalSerializer(HALSerializer):
         }
 
     def get_category(self, obj):
-        departments = ', '.join(
-            obj.category_assignment.category.departments.filter(
-                categorydepartment__is_responsible=True
-            ).values_list('code', flat=True)
-        )
         return {
             'sub': obj.category_assignment.category.name,
             'sub_slug': obj.category_assignment.category.slug,
-            'departments': departments,
+            'departments': get_responsible_department_codes(obj.category_assignment.category),
             'main': obj.category_assignment.category.parent.name,
             'main_slug': obj.category_assignment.category.parent.slug,
         }
 
     def get_can_view_signal(self, obj):
+        if hasattr(obj, 'can_view_signal'):
+            # Annotated by the PrivateSignalViewSet.children action
+            return obj.can_view_signal
         return Signal.objects.filter(pk=obj.pk).filter_for_user(self.context['request'].user).exists()
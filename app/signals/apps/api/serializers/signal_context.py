@@ -1,22 +1,36 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 import datetime
 
 from datapunt_api.rest import HALSerializer
 from django.conf import settings
-from django.contrib.gis.db.models.functions import Distance
 from django.db.models import Q
 from django.utils import timezone
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from rest_framework_gis.fields import GeometryField
-from rest_framework_gis.serializers import GeoFeatureModelSerializer
 
 from signals.apps.api.fields import PrivateSignalWithContextLinksField
 from signals.apps.signals import workflow
 from signals.apps.signals.models import Signal
 
 
+def get_near_signals_queryset(signal):
+    """
+    Signals in the same category, created in the last weeks, within a radius of the given signal
+
+    Used for both the count in the signal context and the "near" GeoJSON endpoint.
+    """
+    return Signal.objects.near(
+        signal.location.geometrie, settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS
+    ).filter(
+        (Q(parent__isnull=True) & Q(children__isnull=True)) | Q(parent__isnull=False),
+        category_assignment__category_id=signal.category_assignment.category_id,
+        created_at__gte=(
+            timezone.now() - datetime.timedelta(weeks=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_CREATED_DELTA_WEEKS)
+        ),
+    ).exclude(pk=signal.pk)
+
+
 class SignalContextReporterSerializer(serializers.ModelSerializer):
     category = serializers.SerializerMethodField()
     status = serializers.SerializerMethodField()
@@ -149,19 +163,8 @@ class SignalContextSerializer(HALSerializer):
         },
     })
     def get_near(self, obj) -> dict:
-        signals_for_geography_qs = Signal.objects.annotate(
-            distance_from_point=Distance('location__geometrie', obj.location.geometrie),
-        ).filter(
-            (Q(parent__isnull=True) & Q(children__isnull=True)) | Q(parent__isnull=False),
-            distance_from_point__lte=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS,
-            category_assignment__category_id=obj.category_assignment.category.pk,
-            created_at__gte=(
-                timezone.now() - datetime.timedelta(weeks=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_CREATED_DELTA_WEEKS)
-            ),
-        ).exclude(pk=obj.pk)
-
         return {
-            'signal_count': signals_for_geography_qs.count(),
+            'signal_count': get_near_signals_queryset(obj).count(),
         }
 
     @extend_schema_field({
@@ -218,37 +221,3 @@ class SignalContextSerializer(HALSerializer):
             'positive_count': satisfied_count,
             'negative_count': not_satisfied_count,
         }
-
-
-class SignalContextGeoSerializer(GeoFeatureModelSerializer):
-    location = GeometryField(source='location.geometrie')
-
-    class Meta:
-        model = Signal
-        id_field = False
-        geo_field = 'location'
-        fields = ['id', 'created_at']
-
-    @extend_schema_field({
-        'type': 'object',
-        'properties': {
-            'state': {
-                'type': 'string',
-                'enum': [state[0] for state in workflow.STATUS_CHOICES_API],
-                'example': 'm',
-            },
-            'state_display': {
-                'type': 'string',
-                'example': 'Gemeld',
-            },
-        },
-    })
-    def get_properties(self, instance, fields) -> dict:
-        properties = super(SignalContextGeoSerializer, self).get_properties(instance, fields)
-        properties.update({
-            'status': {
-                'state': instance.status.state,
-                'state_display': instance.status.get_state_display(),
-            }
-        })
-        return properties
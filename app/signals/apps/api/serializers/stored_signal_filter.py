@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from datapunt_api.rest import DisplayField, HALSerializer
+from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from signals.apps.api.fields import StoredSignalFilterLinksField
@@ -58,3 +59,9 @@ class StoredSignalFilterSerializer(HALSerializer):
             'created_by': self.context['request'].user.email
         })
         return super().create(validated_data=validated_data)
+
+
+class StoredSignalFilterCountSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    count = serializers.IntegerField(allow_null=True,
+                                     help_text='Null when the options of the filter are no longer valid')
@@ -0,0 +1,29 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from signals.apps.api.filters.utils import ReferenceChoices
+from signals.apps.signals.models import Area, AreaType, Buurt, Category, Department, Source
+
+
+@receiver(post_save, sender=Area, dispatch_uid='reference_choices_area_saved')
+@receiver(post_delete, sender=Area, dispatch_uid='reference_choices_area_deleted')
+@receiver(post_save, sender=AreaType, dispatch_uid='reference_choices_area_type_saved')
+@receiver(post_delete, sender=AreaType, dispatch_uid='reference_choices_area_type_deleted')
+@receiver(post_save, sender=Buurt, dispatch_uid='reference_choices_buurt_saved')
+@receiver(post_delete, sender=Buurt, dispatch_uid='reference_choices_buurt_deleted')
+@receiver(post_save, sender=Category, dispatch_uid='reference_choices_category_saved')
+@receiver(post_delete, sender=Category, dispatch_uid='reference_choices_category_deleted')
+@receiver(post_save, sender=Department, dispatch_uid='reference_choices_department_saved')
+@receiver(post_delete, sender=Department, dispatch_uid='reference_choices_department_deleted')
+@receiver(post_save, sender=Source, dispatch_uid='reference_choices_source_saved')
+@receiver(post_delete, sender=Source, dispatch_uid='reference_choices_source_deleted')
+def reference_choices_invalidation_handler(sender, **kwargs):
+    """
+    Changes to the reference tables invalidate the cached filter choices, again when the transaction is committed so
+    other processes cannot keep choices built from the data before the commit
+    """
+    ReferenceChoices.invalidate()
+    transaction.on_commit(ReferenceChoices.invalidate)
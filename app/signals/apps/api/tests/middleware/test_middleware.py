@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 from django.test import modify_settings
 
 from signals.test.utils import SIAReadUserMixin, SignalsBaseApiTestCase
@@ -17,3 +17,19 @@ class TestSessionLoginMiddleware(SIAReadUserMixin, SignalsBaseApiTestCase):
     def test_session_cookie_is_not_provided_on_public_endpoint(self):
         response = self.client.get('/signals/v1/public/terms/categories/')
         self.assertIsNone(response.cookies.get('sessionid'))
+
+    def test_session_is_established_once_per_token(self):
+        user = self.sia_read_user
+        self.client.force_authenticate(user=user, token='token')
+        response = self.client.get('/signals/v1/private/signals/')
+        session_key = response.cookies['sessionid'].value
+
+        # A valid session for the same user and token, the session is not written again
+        response = self.client.get('/signals/v1/private/signals/')
+        self.assertIsNone(response.cookies.get('sessionid'))
+        self.assertEqual(self.client.cookies['sessionid'].value, session_key)
+
+        # A new token, the user is logged in again
+        self.client.force_authenticate(user=user, token='new token')
+        response = self.client.get('/signals/v1/private/signals/')
+        self.assertNotEqual(response.cookies['sessionid'].value, session_key)
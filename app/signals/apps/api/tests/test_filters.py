@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from datetime import datetime, timedelta
 from random import shuffle
 
@@ -7,6 +7,7 @@ from django.contrib.gis.geos import MultiPolygon, Point, Polygon
 from django.utils import timezone
 from freezegun import freeze_time
 
+from signals.apps.api.filters.utils import ReferenceChoices, department_choices, source_choices
 from signals.apps.feedback.factories import FeedbackFactory
 from signals.apps.signals import workflow
 from signals.apps.signals.factories import (
@@ -24,7 +25,7 @@ from signals.apps.signals.factories import (
     StatusFactory,
     TypeFactory
 )
-from signals.apps.signals.models import Category, Priority, Signal, SignalDepartments
+from signals.apps.signals.models import Category, Location, Priority, Signal, SignalDepartments
 from signals.apps.signals.workflow import BEHANDELING, GEMELD, ON_HOLD
 from signals.test.utils import SignalsBaseApiTestCase
 
@@ -713,6 +714,51 @@ class TestNoteKeywordFilter(SignalsBaseApiTestCase):
         ids = self._request_filter_signals(filter_params)
         self.assertEqual(ids, [])
 
+    def test_retrieve_signal_with_keyword_full_text(self):
+        NoteFactory(_signal=self.signal_no_keyword, text='De fietsen staan al weken bij de brug')
+
+        # Matches all words, in any order
+        ids = self._request_filter_signals({'note_keyword': 'brug fietsen', 'search_mode': 'fulltext'})
+        self.assertEqual(ids, [self.signal_no_keyword.id])
+
+        ids = self._request_filter_signals({'note_keyword': 'fietsen -brug', 'search_mode': 'fulltext'})
+        self.assertEqual(ids, [])
+
+        ids = self._request_filter_signals({'note_keyword': 'keyword', 'search_mode': 'fulltext'})
+        self.assertEqual(ids, [self.signal_with_keyword.id])
+
+
+class TestAddressTextFilter(SignalsBaseApiTestCase):
+    LIST_ENDPOINT = '/signals/v1/private/signals/'
+
+    def _request_filter_signals(self, filter_params: dict):
+        self.client.force_authenticate(user=self.superuser)
+        resp = self.client.get(self.LIST_ENDPOINT, data=filter_params)
+        self.assertEqual(200, resp.status_code)
+        return sorted(res['id'] for res in resp.json()['results'])
+
+    def setUp(self):
+        self.signal_dam = SignalFactory.create()
+        self.signal_damrak = SignalFactory.create()
+        Location.objects.filter(pk=self.signal_dam.location_id).update(address_text='Dam 1 1012JS Amsterdam')
+        Location.objects.filter(pk=self.signal_damrak.location_id).update(address_text='Damrak 5 1012LG Amsterdam')
+
+    def test_address_text_contains(self):
+        self.assertEqual(self._request_filter_signals({'address_text': 'dam'}),
+                         sorted([self.signal_dam.id, self.signal_damrak.id]))
+        self.assertEqual(self._request_filter_signals({'address_text': 'damrak'}), [self.signal_damrak.id])
+
+    def test_address_text_full_text(self):
+        self.assertEqual(self._request_filter_signals({'address_text': 'dam', 'search_mode': 'fulltext'}),
+                         [self.signal_dam.id])
+        self.assertEqual(self._request_filter_signals({'address_text': 'damrak 5', 'search_mode': 'fulltext'}),
+                         [self.signal_damrak.id])
+
+    def test_invalid_search_mode(self):
+        self.client.force_authenticate(user=self.superuser)
+        resp = self.client.get(self.LIST_ENDPOINT, data={'address_text': 'dam', 'search_mode': 'regex'})
+        self.assertEqual(400, resp.status_code)
+
 
 class TestContactDetailsPresentFilter(SignalsBaseApiTestCase):
     SIGNALS_LIST_ENDPOINT = '/signals/v1/private/signals/'
@@ -1376,3 +1422,37 @@ class TestPunctualityFilter(SignalsBaseApiTestCase):
             ids = self._request_filter_signals(params)
         late = [self.signal_slo_c.id, self.signal_slo_w.id]
         self.assertEqual(set(late), set(ids))
+
+
+class TestReferenceChoices(SignalsBaseApiTestCase):
+    LIST_ENDPOINT = '/signals/v1/private/signals/'
+
+    def setUp(self):
+        self.department = DepartmentFactory.create(code='RCT')
+        self.client.force_authenticate(user=self.superuser)
+
+    def test_choices_are_cached(self):
+        self.assertIn(('RCT', 'RCT'), department_choices())
+        self.assertIn('RCT', department_choices.values())
+
+        with self.assertNumQueries(0):
+            department_choices()
+            department_choices.values()
+
+    def test_invalidated_on_save_and_delete(self):
+        self.assertNotIn('new-source', source_choices.values())
+
+        source = SourceFactory.create(name='new-source')
+        self.assertIn('new-source', source_choices.values())
+
+        source.delete()
+        self.assertNotIn('new-source', source_choices.values())
+
+    def test_filter_validation(self):
+        ReferenceChoices.invalidate()
+
+        response = self.client.get(self.LIST_ENDPOINT, data={'routing_department_code': 'RCT'})
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(self.LIST_ENDPOINT, data={'routing_department_code': 'UNKNOWN'})
+        self.assertEqual(response.status_code, 400)
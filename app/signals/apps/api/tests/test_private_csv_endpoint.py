@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 import os
 import shutil
 import tempfile
@@ -7,6 +7,7 @@ from unittest import mock
 
 from django.contrib.auth.models import Permission
 from django.core.files.storage import FileSystemStorage
+from django.test import override_settings
 from freezegun import freeze_time
 from rest_framework import status
 
@@ -16,6 +17,7 @@ from signals.test.utils import SIAReadWriteUserMixin, SignalsBaseApiTestCase
 THIS_DIR = os.path.dirname(__file__)
 
 
+@override_settings(DWH_EXPORT_WORKERS=1)
 class TestPrivateCSVEndpoint(SIAReadWriteUserMixin, SignalsBaseApiTestCase):
     csv_endpoint = '/signals/v1/private/csv/'
 
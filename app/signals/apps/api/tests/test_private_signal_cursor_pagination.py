@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import Permission
+from django.utils import timezone
+from freezegun import freeze_time
+
+from signals.apps.signals.factories import SignalFactoryValidLocation
+from signals.test.utils import SIAReadWriteUserMixin, SignalsBaseApiTestCase
+
+
+class TestPrivateSignalCursorPagination(SIAReadWriteUserMixin, SignalsBaseApiTestCase):
+    list_endpoint = '/signals/v1/private/signals/'
+    geo_list_endpoint = '/signals/v1/private/signals/geography'
+
+    def setUp(self):
+        now = timezone.now()
+        self.signals = []
+        for days in range(5, 0, -1):
+            with freeze_time(now - timedelta(days=days)):
+                self.signals.append(SignalFactoryValidLocation.create())
+
+        # Every access of sia_read_write_user creates a new user
+        self.read_write_user = self.sia_read_write_user
+        self.read_write_user.user_permissions.add(Permission.objects.get(codename='sia_can_view_all_categories'))
+        self.client.force_authenticate(user=self.read_write_user)
+
+    def _follow(self, url, link='next'):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            ids.extend(result['id'] for result in data['results'])
+            url = data['_links'][link]['href']
+        return ids
+
+    def test_list_cursor_pagination(self):
+        response = self.client.get(self.list_endpoint, {'pagination': 'cursor', 'page_size': 2})
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertIsNone(data['count'])
+        self.assertIsNone(data['_links']['previous']['href'])
+        self.assertEqual([result['id'] for result in data['results']], [self.signals[4].id, self.signals[3].id])
+
+        # Follow the next links, default ordering is newest first
+        ids = self._follow(f'{self.list_endpoint}?pagination=cursor&page_size=2')
+        self.assertEqual(ids, [signal.id for signal in reversed(self.signals)])
+
+    def test_list_cursor_pagination_previous(self):
+        response = self.client.get(self.list_endpoint, {'pagination': 'cursor', 'page_size': 2, 'ordering': 'id'})
+        data = response.json()
+        response = self.client.get(data['_links']['next']['href'])
+        data = response.json()
+        response = self.client.get(data['_links']['next']['href'])
+        data = response.json()
+        self.assertEqual([result['id'] for result in data['results']], [self.signals[4].id])
+        self.assertIsNone(data['_links']['next']['href'])
+
+        response = self.client.get(data['_links']['previous']['href'])
+        data = response.json()
+        self.assertEqual([result['id'] for result in data['results']], [self.signals[2].id, self.signals[3].id])
+        self.assertIsNotNone(data['_links']['next']['href'])
+        self.assertIsNotNone(data['_links']['previous']['href'])
+
+    def test_list_cursor_pagination_unsupported_ordering(self):
+        response = self.client.get(self.list_endpoint, {'pagination': 'cursor', 'ordering': 'status'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_cursor_pagination_invalid_cursor(self):
+        response = self.client.get(self.list_endpoint, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_estimated_count(self):
+        response = self.client.get(self.list_endpoint, {'count': 'estimated'})
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.json()['count'], int)
+        self.assertEqual(len(response.json()['results']), 5)
+
+    @patch('signals.apps.api.generics.pagination.estimated_count', return_value=1)
+    def test_list_estimated_count_too_low(self, _):
+        response = self.client.get(self.list_endpoint, {'count': 'estimated', 'page_size': 2})
+        data = response.json()
+        self.assertEqual(data['count'], 1)
+        self.assertEqual(len(data['results']), 2)
+        self.assertIsNotNone(data['_links']['next']['href'])
+
+        self.assertEqual(self._follow(data['_links']['next']['href']),
+                         [signal.id for signal in reversed(self.signals[:3])])
+
+    @patch('signals.apps.api.generics.pagination.estimated_count', return_value=1000)
+    def test_list_estimated_count_too_high(self, _):
+        response = self.client.get(self.list_endpoint, {'count': 'estimated', 'page_size': 2, 'page': 3})
+        data = response.json()
+        self.assertEqual(data['count'], 1000)
+        self.assertEqual([result['id'] for result in data['results']], [self.signals[0].id])
+        self.assertIsNone(data['_links']['next']['href'])
+
+    @patch('signals.apps.api.generics.pagination.estimated_count', return_value=1000)
+    def test_geography_estimated_count(self, _):
+        response = self.client.get(self.geo_list_endpoint, {'count': 'estimated', 'page_size': 2, 'page': 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Total-Count'], '1000')
+        self.assertNotIn('rel="next"', response['Link'])
+        self.assertEqual([feature['properties']['id'] for feature in response.json()['features']],
+                         [self.signals[0].id])
+
+        response = self.client.get(self.geo_list_endpoint, {'count': 'estimated', 'page_size': 2, 'page': 2})
+        self.assertIn('rel="next"', response['Link'])
+
+    def test_geography_cursor_pagination(self):
+        response = self.client.get(self.geo_list_endpoint, {'pagination': 'cursor', 'page_size': 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('X-Total-Count'))
+        self.assertIn('rel="next"', response['Link'])
+        self.assertEqual(len(response.json()['features']), 3)
+
+        next_link = response['Link'].split(',')[1].split(';')[0].strip('<>')
+        response = self.client.get(next_link)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('rel="next"', response['Link'])
+        self.assertIn('rel="prev"', response['Link'])
+        self.assertEqual({feature['properties']['id'] for feature in response.json()['features']},
+                         {self.signals[0].id, self.signals[1].id})
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2025 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 import copy
 import json
 import os
@@ -181,6 +181,17 @@ class TestPrivateSignalViewSet(SIAInactiveUserMixin, SIAReadUserMixin, SIAReadWr
         self.assertTrue(response.has_header('X-Total-Count'))
         self.assertEqual(response['X-Total-Count'], '2')
 
+    def test_geo_tile_endpoint(self):
+        response = self.client.get(f'{self.geo_list_endpoint}/0/0/0.mvt')  # The whole world
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/vnd.mapbox-vector-tile')
+        self.assertIn('private', response['Cache-Control'])
+        self.assertIn('Authorization', response['Vary'])
+        self.assertIn(b'signals', response.content)  # The name of the layer
+
+        response = self.client.get(f'{self.geo_list_endpoint}/0/1/0.mvt')
+        self.assertEqual(response.status_code, 404)
+
     def test_geo_list_endpoint_paginated(self):
         # the first page
         response = self.client.get(f'{self.geo_list_endpoint}?page_size=1')
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.auth.models import Permission
+from django.utils import timezone
+
+from signals.apps.feedback.factories import FeedbackFactory
+from signals.apps.signals.factories import (
+    CategoryFactory,
+    DepartmentFactory,
+    ImageAttachmentFactory,
+    NoteFactory,
+    SignalFactory,
+    SignalFactoryValidLocation
+)
+from signals.apps.signals.models import Signal
+from signals.test.utils import SIAReadWriteUserMixin, SignalsBaseApiTestCase
+
+
+class TestPrivateSignalQueryCount(SIAReadWriteUserMixin, SignalsBaseApiTestCase):
+    list_endpoint = '/signals/v1/private/signals/'
+    children_endpoint = '/signals/v1/private/signals/{}/children/'
+
+    def setUp(self):
+        self.department = DepartmentFactory.create()
+        self.category = CategoryFactory.create(departments=[self.department])
+
+        self.signals = self._create_signals(10)
+        self.parent = self.signals[0]
+        self.children = SignalFactory.create_batch(10, parent=self.parent)
+
+        self.read_write_user = self.sia_read_write_user
+        self.read_write_user.user_permissions.add(Permission.objects.get(codename='sia_can_view_all_categories'))
+        self.client.force_authenticate(user=self.read_write_user)
+
+    def _create_signals(self, n: int) -> list[Signal]:
+        signals = SignalFactoryValidLocation.create_batch(n, category_assignment__category=self.category)
+        for signal in signals:
+            ImageAttachmentFactory.create(_signal=signal)
+            NoteFactory.create(_signal=signal)
+            FeedbackFactory.create(_signal=signal, submitted_at=timezone.now(), allows_contact=False)
+            Signal.actions.update_routing_departments({
+                'relation_type': 'routing',
+                'departments': [{'id': self.department.id}],
+            }, signal)
+        return signals
+
+    def test_list_query_count(self):
+        # Ordered by id every page contains a Signal with routing departments, so every page prefetches the same
+        # relations
+        params = {'ordering': 'id'}
+        query_count = self.assertQueryCountPerPageSize(self.list_endpoint, page_sizes=(1, 5, 20), params=params)
+
+        # More Signals do not cost more queries
+        self._create_signals(20)
+        self.assertEqual(self.assertQueryCountPerPageSize(self.list_endpoint, page_sizes=(40, ), params=params),
+                         query_count)
+
+        response = self.client.get(self.list_endpoint, {'page_size': 20})
+        results = {result['id']: result for result in response.json()['results']}
+
+        self.assertTrue(results[self.parent.id]['has_children'])
+        self.assertTrue(results[self.children[0].id]['has_parent'])
+        self.assertFalse(results[self.children[0].id]['has_children'])
+        self.assertTrue(results[self.signals[1].id]['has_attachments'])
+        self.assertFalse(results[self.children[0].id]['has_attachments'])
+        self.assertFalse(results[self.signals[1].id]['reporter']['allows_contact'])
+        self.assertTrue(results[self.children[0].id]['reporter']['allows_contact'])
+        self.assertEqual(results[self.signals[1].id]['category']['departments'], self.department.code)
+        self.assertEqual(results[self.signals[1].id]['routing_departments'][0]['id'], self.department.id)
+
+    def test_children_query_count(self):
+        self.assertQueryCountPerPageSize(self.children_endpoint.format(self.parent.id), page_sizes=(1, 10))
+
+    def test_children_can_view_signal(self):
+        # This user can only see the Signals in the category of its department, or those routed to its department
+        user = self.sia_read_write_user
+        user.profile.departments.add(self.department)
+
+        visible_child = self.children[0]
+        Signal.actions.update_routing_departments({
+            'relation_type': 'routing',
+            'departments': [{'id': self.department.id}],
+        }, visible_child)
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.children_endpoint.format(self.parent.id))
+        self.assertEqual(response.status_code, 200)
+
+        results = response.json()['results']
+        self.assertEqual(len(results), 10)
+        for result in results:
+            self.assertEqual(result['can_view_signal'], result['id'] == visible_child.id)
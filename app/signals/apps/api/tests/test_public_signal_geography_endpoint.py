@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2022 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2022 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+import math
 from datetime import timedelta
 
 from django.contrib.gis.geos import Point
@@ -460,3 +461,65 @@ class TestPublicSignalViewSet(SignalsBaseApiTestCase):
         self.assertEqual(200, response.status_code)
         data = response.json()
         self.assertEqual(None, data['features'])
+
+    def test_get_geojson_clustered(self):
+        """
+        Below the cluster zoom level the signals are clustered, one feature per cluster with the number of signals
+        """
+        parent_category = ParentCategoryFactory.create()
+        child_category = CategoryFactory.create(parent=parent_category, is_public_accessible=True)
+
+        for location in [STADHUIS, ARENA]:
+            SignalFactory.create_batch(5, location__geometrie=Point(location['lon'], location['lat']),
+                                       location__buurt_code=location['buurt_code'],
+                                       category_assignment__category=child_category)
+        refresh_materialized_view_public_signals_geography_feature_collection()
+
+        url = f'{self.geography_endpoint}/?maincategory_slug={parent_category.slug}&bbox=4.7,52.2,5.0,52.5&zoom={{}}'
+
+        with self.settings(SIGNALS_API_GEO_CLUSTER_BELOW_ZOOM=14):
+            response = self.client.get(url.format(12))
+            self.assertEqual(200, response.status_code)
+
+            features = response.json()['features']
+            self.assertEqual(2, len(features))
+            for feature in features:
+                self.assertEqual('Point', feature['geometry']['type'])
+                self.assertEqual({'count': 5}, feature['properties'])
+
+            response = self.client.get(url.format(14))
+            self.assertEqual(200, response.status_code)
+            self.assertEqual(10, len(response.json()['features']))
+
+            response = self.client.get(url.format(-1))
+            self.assertEqual(400, response.status_code)
+
+    def test_get_tile(self):
+        """
+        Return the signals in a vector tile
+        """
+        parent_category = ParentCategoryFactory.create()
+        child_category = CategoryFactory.create(parent=parent_category, is_public_accessible=True)
+        SignalFactory.create_batch(5, location__geometrie=Point(STADHUIS['lon'], STADHUIS['lat']),
+                                   location__buurt_code=STADHUIS['buurt_code'],
+                                   category_assignment__category=child_category)
+        refresh_materialized_view_public_signals_geography_feature_collection()
+
+        z = 14
+        x = int((STADHUIS['lon'] + 180) / 360 * 2 ** z)
+        y = int((1 - math.asinh(math.tan(math.radians(STADHUIS['lat']))) / math.pi) / 2 * 2 ** z)
+
+        response = self.client.get(f'{self.geography_endpoint}/{z}/{x}/{y}.mvt',
+                                   {'maincategory_slug': parent_category.slug})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/vnd.mapbox-vector-tile', response.headers['Content-Type'])
+        self.assertIn('public', response.headers['Cache-Control'])
+        self.assertIn(b'signals', response.content)  # The name of the layer
+        self.assertIn(child_category.slug.encode(), response.content)
+
+        response = self.client.get(f'{self.geography_endpoint}/{z}/{x + 10}/{y}.mvt')
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(b'', response.content)
+
+        response = self.client.get(f'{self.geography_endpoint}/{z}/{2 ** z}/{y}.mvt')
+        self.assertEqual(404, response.status_code)
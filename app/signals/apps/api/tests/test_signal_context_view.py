@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 from datetime import timedelta
 
 from django.contrib.gis.geos import Point
@@ -120,6 +120,40 @@ class TestSignalContextView(SuperUserMixin, APITestCase):
         self.assertEqual(response_data['reporter']['positive_count'], 1)
         self.assertEqual(response_data['reporter']['negative_count'], 2)
 
+    def test_get_signal_context_geography_detail(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        signal_id = self.reporter_1_signals[0].pk
+        response = self.client.get(f'/signals/v1/private/signals/{signal_id}/context/near/geography/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Total-Count'], '3')
+
+        response_data = response.json()
+        self.assertEqual(response_data['type'], 'FeatureCollection')
+        self.assertEqual(len(response_data['features']), 3)
+        for feature in response_data['features']:
+            self.assertEqual(feature['type'], 'Feature')
+            self.assertEqual(feature['geometry']['type'], 'Point')
+            self.assertNotEqual(feature['properties']['id'], signal_id)
+
+            state = feature['properties']['status']['state']
+            self.assertEqual(feature['properties']['status']['state_display'],
+                             dict(workflow.STATUS_CHOICES)[state])
+
+            created_at = Signal.objects.get(pk=feature['properties']['id']).created_at
+            self.assertEqual(feature['properties']['created_at'],
+                             timezone.localtime(created_at).isoformat())
+
+    def test_get_signal_context_geography_detail_no_signals_near(self):
+        self.client.force_authenticate(user=self.superuser)
+
+        signal = SignalFactory.create(location__geometrie=Point(STADHUIS['lon'], STADHUIS['lat']),
+                                      category_assignment__category=CategoryFactory.create())
+        response = self.client.get(f'/signals/v1/private/signals/{signal.pk}/context/near/geography/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Total-Count'], '0')
+        self.assertEqual(response.json(), {'type': 'FeatureCollection', 'features': []})
+
     def test_get_signal_context_reporter_detail(self):
         self.client.force_authenticate(user=self.superuser)
 
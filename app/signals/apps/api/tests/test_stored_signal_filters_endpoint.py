@@ -1,7 +1,18 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
-from signals.apps.signals.factories import StoredSignalFilterFactory
-from signals.apps.signals.models import StoredSignalFilter
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.core.cache import cache
+
+from signals.apps.services.domain.stored_signal_filter_counts import StoredSignalFilterCountService
+from signals.apps.signals import workflow
+from signals.apps.signals.factories import (
+    CategoryFactory,
+    DepartmentFactory,
+    SignalFactory,
+    StoredSignalFilterFactory
+)
+from signals.apps.signals.models import Signal, StoredSignalFilter
 from signals.test.utils import SIAReadUserMixin, SignalsBaseApiTestCase
 
 
@@ -252,3 +263,82 @@ class TestStoredSignalFilters(SIAReadUserMixin, SignalsBaseApiTestCase):
 
         response_data = response.json()
         self.assertFalse(response_data['show_on_overview'])
+
+
+class TestStoredSignalFilterCounts(SIAReadUserMixin, SignalsBaseApiTestCase):
+    endpoint = '/signals/v1/private/me/filters/counts/'
+
+    def setUp(self):
+        cache.clear()
+
+        self.department = DepartmentFactory.create()
+        self.category = CategoryFactory.create(departments=[self.department])
+        SignalFactory.create_batch(3, category_assignment__category=self.category, status__state=workflow.GEMELD)
+        SignalFactory.create_batch(2, category_assignment__category=self.category, status__state=workflow.AFGEHANDELD)
+
+        # Signals of another department are not counted
+        SignalFactory.create_batch(2, status__state=workflow.GEMELD)
+
+        self.sia_read_user.profile.departments.add(self.department)
+        self.client.force_authenticate(user=self.sia_read_user)
+
+        self.open_filter = StoredSignalFilterFactory.create(
+            created_by=self.sia_read_user, show_on_overview=True, options={'status': [workflow.GEMELD]}
+        )
+        self.closed_filter = StoredSignalFilterFactory.create(
+            created_by=self.sia_read_user, show_on_overview=True, options={'status': [workflow.AFGEHANDELD]}
+        )
+
+    def _counts(self):
+        response = self.client.get(self.endpoint)
+        self.assertEqual(200, response.status_code)
+        return {item['id']: item['count'] for item in response.json()}
+
+    def test_counts(self):
+        StoredSignalFilterFactory.create(created_by=self.sia_read_user, options={'status': [workflow.GEMELD]})
+        StoredSignalFilterFactory.create(show_on_overview=True, options={'status': [workflow.GEMELD]})
+        invalid_filter = StoredSignalFilterFactory.create(
+            created_by=self.sia_read_user, show_on_overview=True, options={'status': ['not-a-state']}
+        )
+
+        # Only the filters of the user shown on the overview, a filter that is no longer valid has no count
+        self.assertEqual(self._counts(), {self.open_filter.pk: 3, self.closed_filter.pk: 2, invalid_filter.pk: None})
+
+    def test_counts_cached(self):
+        with mock.patch.object(StoredSignalFilterCountService, '_count',
+                               wraps=StoredSignalFilterCountService._count) as count:
+            self.assertEqual(self._counts(), {self.open_filter.pk: 3, self.closed_filter.pk: 2})
+            self.assertEqual(self._counts(), {self.open_filter.pk: 3, self.closed_filter.pk: 2})
+
+        # Both filters were counted together, once
+        count.assert_called_once()
+        self.assertEqual(len(count.call_args.args[1]), 2)
+
+    def test_counts_invalidated(self):
+        self.assertEqual(self._counts(), {self.open_filter.pk: 3, self.closed_filter.pk: 2})
+
+        signal = Signal.objects.filter(category_assignment__category=self.category,
+                                       status__state=workflow.GEMELD).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            Signal.actions.update_status({'state': workflow.AFGEHANDELD, 'text': 'Afgehandeld'}, signal)
+
+        self.assertEqual(self._counts(), {self.open_filter.pk: 2, self.closed_filter.pk: 3})
+
+    def test_counts_invalidated_on_commit(self):
+        signal = Signal.objects.filter(category_assignment__category=self.category).first()
+        with mock.patch.object(StoredSignalFilterCountService, 'invalidate') as invalidate:
+            with self.captureOnCommitCallbacks() as callbacks:
+                signal.delete()
+            invalidate.assert_not_called()
+
+            for callback in callbacks:
+                callback()
+        invalidate.assert_called_once_with()
+
+    def test_counts_per_permissions(self):
+        self.assertEqual(self._counts(), {self.open_filter.pk: 3, self.closed_filter.pk: 2})
+
+        # The counts cached for the previous permissions of the user are not used
+        other_department = DepartmentFactory.create()
+        self.sia_read_user.profile.departments.set([other_department])
+        self.assertEqual(self._counts(), {self.open_filter.pk: 0, self.closed_filter.pk: 0})
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest.mock import patch
+
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from signals.apps.signals.models import ThrottleCounter
+from signals.cache import uses_database_cache
+from signals.throttling import PostOnlyNoUserRateThrottle
+
+LOCAL_MEMORY_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-throttling',
+    },
+}
+DATABASE_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'signals_cache',
+    },
+}
+LAYERED_CACHES = {
+    'default': {
+        'BACKEND': 'signals.cache.LayeredCache',
+        'OPTIONS': {'SHARED_CACHE': 'shared', 'LOCAL_TIMEOUT': 60},
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'test-throttling-shared',
+    },
+}
+
+
+class TenPerMinuteThrottle(PostOnlyNoUserRateThrottle):
+    rate = '10/minute'
+
+
+@override_settings(CACHES=LOCAL_MEMORY_CACHES)
+class TestSlidingWindowRateThrottle(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.now = 6000.0  # The start of a window of 60 seconds
+        self.request = APIRequestFactory().post('/signals/v1/public/signals/', REMOTE_ADDR='10.0.0.1')
+
+    def _allow_request(self):
+        throttle = TenPerMinuteThrottle()
+        throttle.timer = lambda: self.now
+        return throttle.allow_request(self.request, None), throttle
+
+    def test_allows_rate(self):
+        for _ in range(10):
+            self.assertTrue(self._allow_request()[0])
+
+        allowed, throttle = self._allow_request()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(throttle.wait(), 66)  # Until enough of this window fell out of the sliding window
+
+    def test_sliding_window(self):
+        for _ in range(10):
+            self.assertTrue(self._allow_request()[0])
+
+        # Halfway the next window half of the previous requests are within the sliding window
+        self.now += 90
+        for _ in range(5):
+            self.assertTrue(self._allow_request()[0])
+
+        allowed, throttle = self._allow_request()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(throttle.wait(), 6)  # Until another of the previous requests fell out of the window
+
+        self.now += 6
+        self.assertTrue(self._allow_request()[0])
+
+    def test_denied_requests_are_not_counted(self):
+        for _ in range(15):
+            self._allow_request()
+
+        # Halfway the next window half of the 10 allowed requests are within the sliding window
+        self.now += 90
+        for _ in range(5):
+            self.assertTrue(self._allow_request()[0])
+        self.assertFalse(self._allow_request()[0])
+
+    def test_only_post(self):
+        request = APIRequestFactory().get('/signals/v1/public/signals/', REMOTE_ADDR='10.0.0.1')
+        for _ in range(15):
+            self.assertTrue(TenPerMinuteThrottle().allow_request(request, None))
+
+    def test_per_client(self):
+        for _ in range(10):
+            self.assertTrue(self._allow_request()[0])
+
+        self.request = APIRequestFactory().post('/signals/v1/public/signals/', REMOTE_ADDR='10.0.0.2')
+        self.assertTrue(self._allow_request()[0])
+
+
+@override_settings(CACHES=DATABASE_CACHES)
+class TestSlidingWindowRateThrottleDatabaseCounters(TestSlidingWindowRateThrottle):
+    def test_counters_in_database(self):
+        self.assertTrue(uses_database_cache())
+        for _ in range(3):
+            self._allow_request()
+
+        counter = ThrottleCounter.objects.get()
+        self.assertEqual(counter.current_window, 100)
+        self.assertEqual(counter.current_count, 3)
+
+        self.now += 60
+        self._allow_request()
+        counter.refresh_from_db()
+        self.assertEqual((counter.current_window, counter.current_count, counter.previous_count), (101, 1, 3))
+
+        self.now += 120
+        self._allow_request()
+        counter.refresh_from_db()
+        self.assertEqual((counter.current_window, counter.current_count, counter.previous_count), (103, 1, 0))
+
+    @patch('signals.throttling.random.randrange', return_value=1)
+    def test_one_query_per_request(self, _):
+        for _ in range(10):
+            with self.assertNumQueries(1):
+                self.assertTrue(self._allow_request()[0])
+
+    @patch('signals.throttling.random.randrange', return_value=0)
+    def test_expired_counters_deleted(self, _):
+        ThrottleCounter.objects.create(key='expired', current_window=1, current_count=1, expires=self.now - 1)
+        self._allow_request()
+        self.assertEqual(list(ThrottleCounter.objects.values_list('key', flat=True)), ['throttle_nouser_10.0.0.1'])
+
+
+@override_settings(CACHES=LAYERED_CACHES)
+class TestLayeredCache(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_read_from_local_memory(self):
+        cache.set('key', 'value')
+        caches['shared'].set('key', 'changed')
+        self.assertEqual(cache.get('key'), 'value')
+
+        cache.delete('key')
+        self.assertIsNone(cache.get('key'))
+        self.assertIsNone(caches['shared'].get('key'))
+
+    def test_filled_from_shared_cache(self):
+        caches['shared'].set('key', 'value')
+        self.assertEqual(cache.get('key'), 'value')
+        self.assertEqual(cache.get_many(['key', 'other']), {'key': 'value'})
+
+    def test_uses_database_cache(self):
+        self.assertFalse(uses_database_cache())
+        with override_settings(CACHES={**LAYERED_CACHES, 'shared': DATABASE_CACHES['default']}):
+            self.assertTrue(uses_database_cache())
+
+    def test_counters_in_shared_cache(self):
+        self.assertTrue(cache.add('counter', 1))
+        self.assertFalse(cache.add('counter', 1))
+        self.assertEqual(cache.incr('counter'), 2)
+        self.assertEqual(caches['shared'].incr('counter'), 3)
+        self.assertEqual(cache.get('counter'), 3)
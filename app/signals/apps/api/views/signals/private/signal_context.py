@@ -1,25 +1,24 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 import logging
+from datetime import datetime
 
-from django.conf import settings
-from django.contrib.gis.db.models.functions import Distance
-from django.db.models import Q
-from django.utils import timezone
+from django.db.models.functions import JSONObject
 from drf_spectacular.utils import extend_schema
-from rest_framework import mixins
+from rest_framework import mixins, serializers
 from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.status import HTTP_200_OK
 from rest_framework.viewsets import GenericViewSet
 
-from signals.apps.api.generics.pagination import LinkHeaderPagination
-from signals.apps.api.generics.permissions import SIAPermissions
-from signals.apps.api.serializers import (
-    SignalContextGeoSerializer,
-    SignalContextReporterSerializer,
-    SignalContextSerializer
+from signals.apps.api.generics.geojson import (
+    GeoJSONFeature,
+    choice_display,
+    paginated_feature_collection_response
 )
+from signals.apps.api.generics.permissions import SIAPermissions
+from signals.apps.api.serializers import SignalContextReporterSerializer, SignalContextSerializer
+from signals.apps.api.serializers.signal_context import get_near_signals_queryset
 from signals.apps.signals import workflow
 from signals.apps.signals.models import Signal
 from signals.auth.backend import JWTAuthBackend
@@ -107,25 +106,29 @@ class SignalContextViewSet(mixins.RetrieveModelMixin, GenericViewSet):
     def near(self, request, pk=None):
         signal = self.get_object()
 
-        signals_for_geography_qs = Signal.objects.annotate(
-            distance_from_point=Distance('location__geometrie', signal.location.geometrie),
-        ).filter(
-            (Q(parent__isnull=True) & Q(children__isnull=True)) | Q(parent__isnull=False),
-            distance_from_point__lte=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS,
-            category_assignment__category_id=signal.category_assignment.category.pk,
-            created_at__gte=(
-                timezone.now() - timezone.timedelta(weeks=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_CREATED_DELTA_WEEKS)
-            ),
-        ).exclude(pk=signal.pk)
+        features_qs = get_near_signals_queryset(signal).annotate(
+            feature=GeoJSONFeature(
+                geometry='location__geometrie',
+                id='id',
+                created_at='created_at',
+                status=JSONObject(
+                    state='status__state',
+                    state_display=choice_display('status__state', workflow.STATUS_CHOICES),
+                ),
+            )
+        )
 
-        paginator = LinkHeaderPagination(page_query_param='geopage', page_size=4000)
-        page = paginator.paginate_queryset(signals_for_geography_qs, self.request, view=self)
-        if page is not None:
-            serializer = SignalContextGeoSerializer(page, many=True, context=self.get_serializer_context())
-            return paginator.get_paginated_response(serializer.data)
+        response = paginated_feature_collection_response(features_qs, request, view=self, page_size=4000)
 
-        serializer = SignalContextGeoSerializer(page, many=True, context=self.get_serializer_context())
-        return Response(serializer.data)
+        # The database formats the timestamps in UTC, the API uses the (Europe/Amsterdam) representation of DRF
+        created_at_field = serializers.DateTimeField()
+        for feature in response.data['features']:
+            properties = feature['properties']
+            properties['created_at'] = created_at_field.to_representation(
+                datetime.fromisoformat(properties['created_at'])
+            )
+
+        return response
 
     @extend_schema(responses={'200': SignalContextReporterSerializer(many=True)},
                    description='Get an overview of signals from the same reporter')
@@ -1,10 +1,10 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2025 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 import logging
 
 from django.conf import settings
-from django.db.models import CharField, Value
-from django.db.models.functions import JSONObject
+from django.contrib.gis.geos import Polygon
+from django.db.models import Exists, F, OuterRef
 from django.http import HttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.types import OpenApiTypes
@@ -19,7 +19,15 @@ from rest_framework_extensions.mixins import DetailSerializerMixin
 
 from signals.apps.api.filters import SignalFilterSet
 from signals.apps.api.generics.filters import FieldMappingOrderingFilter
-from signals.apps.api.generics.pagination import HALPagination, LinkHeaderPaginationForQuerysets
+from signals.apps.api.generics.geojson import GeoJSONFeature, paginated_feature_collection_response
+from signals.apps.api.generics.mvt import (
+    MVT_CONTENT_TYPE,
+    IgnoreClientContentNegotiation,
+    mvt_response,
+    mvt_tile,
+    tile_bbox
+)
+from signals.apps.api.generics.pagination import HALPagination
 from signals.apps.api.generics.permissions import (
     SignalCreateInitialPermission,
     SignalViewObjectPermission
@@ -33,13 +41,12 @@ from signals.apps.api.serializers.email_preview import (
     EmailPreviewPostSerializer,
     EmailPreviewSerializer
 )
+from signals.apps.api.serializers.nested.category import prefetch_responsible_departments
 from signals.apps.api.serializers.signal_history import HistoryLogHalSerializer
 from signals.apps.email_integrations.utils import trigger_mail_action_for_email_preview
 from signals.apps.history.models import Log
 from signals.apps.services.domain.pdf import PDFSummaryService
-from signals.apps.signals.models import Signal
-from signals.apps.signals.models.aggregates.json_agg import JSONAgg
-from signals.apps.signals.models.functions.asgeojson import AsGeoJSON
+from signals.apps.signals.models import Attachment, Signal
 from signals.auth.backend import JWTAuthBackend
 
 logger = logging.getLogger(__name__)
@@ -62,18 +69,20 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
     queryset = Signal.objects.select_related(
         'location',
         'status',
-        'category_assignment',
+        'category_assignment__category__parent',
         'reporter',
         'priority',
         'parent',
         'type_assignment',
+        'directing_departments_assignment',
+        'routing_assignment',
+        'user_assignment__user',
     ).prefetch_related(
-        'category_assignment__category__departments',
-        'children',
-        'attachments',
+        prefetch_responsible_departments('category_assignment__category'),
+        'directing_departments_assignment__departments',
+        'routing_assignment__departments',
         'notes',
         'signal_departments',
-        'user_assignment',
     )
 
     # Geography queryset to reduce the complexity of the query
@@ -131,10 +140,18 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
 
     def get_queryset(self, *args, **kwargs):
         if self._is_request_to_detail_endpoint():
-            return super().get_queryset(*args, **kwargs)
+            # The links to the children and has_attachments of the PrivateSignalSerializerDetail
+            return super().get_queryset(*args, **kwargs).prefetch_related('children', 'attachments')
         else:
             qs = super().get_queryset(*args, **kwargs)
-            return qs.filter_for_user(user=self.request.user)
+            # The booleans of the PrivateSignalSerializerList are determined in the query, instead of
+            # one or more queries per Signal while serializing
+            return qs.filter_for_user(
+                user=self.request.user
+            ).annotate(
+                has_attachments=Exists(Attachment.objects.filter(_signal_id=OuterRef('pk'))),
+                has_children=Exists(Signal.objects.filter(parent_id=OuterRef('pk'))),
+            ).annotate_feedback_allows_contact()
 
     def check_object_permissions(self, request, obj):
         for permission_class in self.object_permission_classes:
@@ -263,13 +280,10 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         # to "Signalen" project access rules:
         features_qs = self.filter_queryset(
             self.geography_queryset.annotate(
-                feature=JSONObject(
-                    type=Value('Feature', output_field=CharField()),
-                    geometry=AsGeoJSON('location__geometrie'),
-                    properties=JSONObject(
-                        id='id',
-                        created_at='created_at',
-                    ),
+                feature=GeoJSONFeature(
+                    geometry='location__geometrie',
+                    id='id',
+                    created_at='created_at',
                 )
             ).filter_for_user(
                 user=request.user
@@ -277,18 +291,39 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         )
 
         # Paginate our queryset and turn it into a GeoJSON feature collection:
-        headers = []
-        feature_collection = {'type': 'FeatureCollection', 'features': []}
-        paginator = LinkHeaderPaginationForQuerysets(page_query_param='geopage',
-                                                     page_size=settings.SIGNALS_API_GEO_PAGINATE_BY)
-        page_qs = paginator.paginate_queryset(features_qs, self.request, view=self)
+        return paginated_feature_collection_response(features_qs, request, view=self)
 
-        if page_qs is not None:
-            features = page_qs.aggregate(features=JSONAgg('feature'))
-            feature_collection.update(features)
-            headers = paginator.get_pagination_headers()
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('z', OpenApiTypes.INT, OpenApiParameter.PATH),
+            OpenApiParameter('x', OpenApiTypes.INT, OpenApiParameter.PATH),
+            OpenApiParameter('y', OpenApiTypes.INT, OpenApiParameter.PATH),
+        ],
+        responses={(HTTP_200_OK, MVT_CONTENT_TYPE): OpenApiTypes.BINARY},
+        description='Vector tile (MVT) of the signals, the "signals" layer has the id and created_at properties.',
+    )
+    @action(detail=False, url_path=r'geography/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.mvt', filterset_class=SignalFilterSet,
+            content_negotiation_class=IgnoreClientContentNegotiation)
+    def geography_tile(self, request, z, x, y):
+        """
+        The signals of the geography endpoint (same filters, same access rules) in a vector tile
+        """
+        z, x, y = int(z), int(x), int(y)
 
-        return Response(feature_collection, headers=headers)
+        features_qs = self.filter_queryset(
+            self.geography_queryset.filter(
+                location__geometrie__intersects=Polygon.from_bbox(tile_bbox(z, x, y))
+            ).filter_for_user(
+                user=request.user
+            )
+        ).values(
+            'id',
+            'created_at',
+            geometry=F('location__geometrie'),
+        ).order_by()
+
+        tile = mvt_tile(features_qs, z, x, y, properties=['id', 'created_at'])
+        return mvt_response(tile, max_age=settings.SIGNALS_API_MVT_MAX_AGE, private=True)
 
     @extend_schema(responses={HTTP_200_OK: AbridgedChildSignalSerializer(many=True)})
     @action(detail=True, url_path='children', filterset_class=None, filter_backends=())
@@ -311,7 +346,14 @@ class PrivateSignalViewSet(DetailSerializerMixin, CreateModelMixin, UpdateModelM
         # Return the child signals for a parent signal in an abridged version
         # of the usual serialization.
         paginator = HALPagination()
-        child_qs = signal.children.all()
+        child_qs = signal.children.select_related(
+            'status',
+            'category_assignment__category__parent',
+        ).prefetch_related(
+            prefetch_responsible_departments('category_assignment__category'),
+        ).annotate(
+            can_view_signal=Exists(Signal.objects.filter_for_user(request.user).filter(pk=OuterRef('pk'))),
+        )
         page = paginator.paginate_queryset(child_qs, self.request, view=self)
 
         if page is not None:
@@ -1,13 +1,17 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 from typing import Any
 
 from django.conf import settings
-from django.db.models import Min, Q
+from django.db.models import Min, Q, QuerySet
+from django.db.models.fields.json import KT
+from django.http import HttpResponse
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, extend_schema_view
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.filters import OrderingFilter
 from rest_framework.mixins import CreateModelMixin, RetrieveModelMixin
 from rest_framework.request import Request
@@ -16,10 +20,21 @@ from rest_framework.status import HTTP_200_OK, HTTP_201_CREATED
 from rest_framework.viewsets import GenericViewSet
 
 from signals.apps.api.filters.signal import PublicSignalGeographyFilter
-from signals.apps.api.generics.pagination import LinkHeaderPaginationForQuerysets
+from signals.apps.api.generics.geojson import (
+    clustered_features,
+    feature_collection,
+    grid_size_for_zoom,
+    paginated_feature_collection_response
+)
+from signals.apps.api.generics.mvt import (
+    MVT_CONTENT_TYPE,
+    IgnoreClientContentNegotiation,
+    mvt_response,
+    mvt_tile,
+    tile_bbox
+)
 from signals.apps.api.serializers import PublicSignalCreateSerializer, PublicSignalSerializerDetail
 from signals.apps.signals.models import Signal
-from signals.apps.signals.models.aggregates.json_agg import JSONAgg
 from signals.apps.signals.models.views.signal import PublicSignalGeographyFeature
 from signals.apps.signals.workflow import (
     AFGEHANDELD,
@@ -79,6 +94,12 @@ class PublicSignalViewSet(CreateModelMixin, RetrieveModelMixin, GenericViewSet):
         data = PublicSignalSerializerDetail(signal, context=self.get_serializer_context()).data
         return Response(data, status=status.HTTP_201_CREATED)
 
+    def _get_public_features(self) -> QuerySet:
+        return self.geography_queryset.exclude(
+            Q(state__in=[AFGEHANDELD, AFGEHANDELD_EXTERN, GEANNULEERD, GESPLITST, VERZOEK_TOT_HEROPENEN]) |
+            ~Q(child_category_is_public_accessible=True)
+        )
+
     @extend_schema(
         filters=True,
         responses={
@@ -167,7 +188,10 @@ class PublicSignalViewSet(CreateModelMixin, RetrieveModelMixin, GenericViewSet):
                 }
             }
         },
-        description='GeoJSON of all signals that can be shown on a public map.',
+        description='GeoJSON of all signals that can be shown on a public map. When a zoom level below '
+                    f'{settings.SIGNALS_API_GEO_CLUSTER_BELOW_ZOOM} is given the signals are clustered on a grid, a '
+                    'cluster is a Point feature (the centroid of its signals) with the number of signals ("count") as '
+                    'its only property. Clusters are not paginated.',
     )
     @action(detail=False, url_path='geography', methods=['GET'],
             filter_backends=(DjangoFilterBackend, OrderingFilter), filterset_class=PublicSignalGeographyFilter,
@@ -183,27 +207,57 @@ class PublicSignalViewSet(CreateModelMixin, RetrieveModelMixin, GenericViewSet):
             A Response containing the paginated GeoJSON feature collection.
 
         """
-        queryset = self.filter_queryset(
-            self.get_queryset().exclude(
-                Q(state__in=[AFGEHANDELD, AFGEHANDELD_EXTERN, GEANNULEERD, GESPLITST, VERZOEK_TOT_HEROPENEN]) |
-                ~Q(child_category_is_public_accessible=True)
-            )
-        ).order_by('geometry')
+        queryset = self.filter_queryset(self._get_public_features()).order_by('geometry')
 
         if request.query_params.get('group_by', '').lower() == 'category':
             # Group by category and return the oldest signal created_at date
             queryset = queryset.values('child_category_id').annotate(created_at=Min('created_at'))
+        elif request.query_params.get('zoom'):
+            zoom = int(float(request.query_params['zoom']))  # Validated by the PublicSignalGeographyFilter
+            if zoom < settings.SIGNALS_API_GEO_CLUSTER_BELOW_ZOOM:
+                # Cluster on a grid, the size of a cluster on the map is the same for every zoom level
+                grid_size = grid_size_for_zoom(zoom, settings.SIGNALS_API_GEO_CLUSTER_SIZE_PIXELS)
+                return Response(feature_collection(clustered_features(queryset, grid_size)))
 
         # Paginate our queryset and turn it into a GeoJSON feature collection:
-        feature_collection = {'type': 'FeatureCollection', 'features': []}
-        paginator = LinkHeaderPaginationForQuerysets(page_query_param='geopage',
-                                                     page_size=settings.SIGNALS_API_GEO_PAGINATE_BY)
-        page_qs = paginator.paginate_queryset(queryset, self.request, view=self)
-
-        headers = {}
-        if page_qs is not None:
-            features = page_qs.aggregate(features=JSONAgg('feature'))
-            feature_collection.update(features)
-            headers = paginator.get_pagination_headers()
-
-        return Response(feature_collection, headers=headers)
+        return paginated_feature_collection_response(queryset, request, view=self)
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter('z', OpenApiTypes.INT, OpenApiParameter.PATH),
+            OpenApiParameter('x', OpenApiTypes.INT, OpenApiParameter.PATH),
+            OpenApiParameter('y', OpenApiTypes.INT, OpenApiParameter.PATH),
+            OpenApiParameter('maincategory_slug', OpenApiTypes.STR, many=True),
+            OpenApiParameter('category_slug', OpenApiTypes.STR, many=True),
+        ],
+        responses={(HTTP_200_OK, MVT_CONTENT_TYPE): OpenApiTypes.BINARY},
+        description='Vector tile (MVT) of the signals that can be shown on a public map, the "signals" layer has the '
+                    'category_name, category_slug, parent_name, parent_slug and created_at properties.',
+    )
+    @action(detail=False, url_path=r'geography/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.mvt', methods=['GET'],
+            filter_backends=(), content_negotiation_class=IgnoreClientContentNegotiation)
+    def geography_tile(self, request: Request, z: str, x: str, y: str) -> HttpResponse:
+        """
+        Retrieve a vector tile of the signals that can be shared on a public map, filtered like the geography
+        """
+        z, x, y = int(z), int(x), int(y)
+
+        data = request.query_params.copy()
+        data['bbox'] = ','.join(str(coordinate) for coordinate in tile_bbox(z, x, y))
+        filterset = PublicSignalGeographyFilter(data=data, queryset=self._get_public_features(), request=request)
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        features_qs = filterset.qs.annotate(
+            category_name=KT('feature__properties__category__name'),
+            category_slug=KT('feature__properties__category__slug'),
+            parent_name=KT('feature__properties__category__parent__name'),
+            parent_slug=KT('feature__properties__category__parent__slug'),
+        ).values(
+            'geometry', 'created_at', 'category_name', 'category_slug', 'parent_name', 'parent_slug',
+        ).order_by()
+
+        tile = mvt_tile(features_qs, z, x, y, properties=[
+            'created_at', 'category_name', 'category_slug', 'parent_name', 'parent_slug',
+        ])
+        return mvt_response(tile, max_age=settings.SIGNALS_API_MVT_MAX_AGE)
@@ -1,9 +1,16 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from datapunt_api.pagination import HALPagination
+from drf_spectacular.utils import extend_schema
 from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 
-from signals.apps.api.serializers import StoredSignalFilterSerializer
+from signals.apps.api.serializers import (
+    StoredSignalFilterCountSerializer,
+    StoredSignalFilterSerializer
+)
+from signals.apps.services.domain.stored_signal_filter_counts import StoredSignalFilterCountService
 from signals.apps.signals.models import StoredSignalFilter
 from signals.auth.backend import JWTAuthBackend
 
@@ -18,3 +25,15 @@ class StoredSignalFilterViewSet(mixins.RetrieveModelMixin, mixins.ListModelMixin
 
     def get_queryset(self):
         return StoredSignalFilter.objects.filter(created_by=self.request.user.username)
+
+    @extend_schema(responses={200: StoredSignalFilterCountSerializer(many=True)})
+    @action(detail=False, url_path='counts', pagination_class=None, serializer_class=StoredSignalFilterCountSerializer)
+    def counts(self, request):
+        """
+        The number of signals matching each of the filters of the user that are shown on the overview
+        """
+        stored_filters = self.get_queryset().filter(show_on_overview=True).order_by('pk')
+        counts = StoredSignalFilterCountService.get_counts(request.user, stored_filters)
+
+        serializer = self.get_serializer([{'id': pk, 'count': count} for pk, count in counts.items()], many=True)
+        return Response(serializer.data)
@@ -1,13 +1,15 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 import inspect
 import os
 from tempfile import TemporaryDirectory
 
 from django.core.management import BaseCommand
 
+from signals.apps.api.filters.utils import ReferenceChoices
 from signals.apps.dataset import sources
 from signals.apps.dataset.base import AreaLoader
+from signals.apps.signals.utils.area_index import AreaIndex
 
 
 class Command(BaseCommand):
@@ -53,4 +55,8 @@ class Command(BaseCommand):
             loader = data_loaders[type_string](**options)
             loader.load()
 
+        # Make sure all processes rebuild their area index and area filter choices with the loaded areas
+        AreaIndex.invalidate()
+        ReferenceChoices.invalidate()
+
         self.stdout.write('...done.')
@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 from django.contrib.gis import geos
 
 from signals.apps.dsl.evaluators.evaluator import Evaluator
+from signals.apps.dsl.prepared_geometry import PreparedMultiPolygon
 
 
 class InEvaluator(Evaluator):
@@ -50,6 +51,6 @@ class InEvaluator(Evaluator):
                     rhs_val = rhs_val[prop.evaluate(ctx)]
             except KeyError:
                 raise Exception("Could not resolve {prop}".format(prop=".".join(self.rhs_prop)))
-        if type(rhs_val) is not geos.MultiPolygon:
+        if type(rhs_val) is not geos.MultiPolygon and type(rhs_val) is not PreparedMultiPolygon:
             self._raise_type_error(exp=type(geos.MultiPolygon), act=type(rhs_val))
         return rhs_val.contains(lhs_val)
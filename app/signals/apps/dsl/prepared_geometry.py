@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis import geos
+
+
+class PreparedMultiPolygon:
+    """
+    A MultiPolygon with its prepared geometry and extent, for repeated "location in area" checks. The extent is
+    checked first, so most checks of a point outside the area never reach GEOS.
+    """
+    __slots__ = ('geometry', 'prepared', 'extent')
+
+    def __init__(self, geometry: geos.MultiPolygon):
+        self.geometry = geometry
+        self.prepared = geometry.prepared
+        self.extent = geometry.extent
+
+    def contains(self, geometry: geos.GEOSGeometry) -> bool:
+        xmin, ymin, xmax, ymax = self.extent
+        gxmin, gymin, gxmax, gymax = geometry.extent
+        if gxmin < xmin or gymin < ymin or gxmax > xmax or gymax > ymax:
+            return False
+        return self.prepared.contains(geometry)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 import logging
 import typing
 from abc import ABC, abstractmethod
@@ -12,6 +12,7 @@ from signals.apps.email_integrations.exceptions import URLEncodedCharsFoundInTex
 from signals.apps.email_integrations.models import EmailTemplate
 from signals.apps.email_integrations.renderers.email_template_renderer import EmailTemplateRenderer
 from signals.apps.email_integrations.rules.abstract import AbstractRule
+from signals.apps.email_integrations.rules.facts import MailFacts
 from signals.apps.email_integrations.utils import make_email_context
 from signals.apps.signals.models import Signal
 
@@ -124,8 +125,8 @@ class AbstractAction(ABC):
 class AbstractSignalStatusAction(AbstractAction):
     rule: AbstractRule
 
-    def __call__(self, signal: Signal, dry_run: bool = False) -> bool:
-        if self.rule(signal):
+    def __call__(self, signal: Signal, dry_run: bool = False, facts: MailFacts | None = None) -> bool:
+        if self.rule(signal, facts):
             return super(AbstractSignalStatusAction, self).__call__(signal, dry_run)
 
         return False
@@ -0,0 +1,46 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import threading
+
+import markdown as md
+from django.utils.html import escape
+from django.utils.safestring import SafeString, mark_safe
+
+from signals.apps.email_integrations.markdown.plaintext import strip_markdown_html
+
+_local = threading.local()
+
+
+def _convert(value: str) -> str:
+    """
+    Converts markdown to HTML, the same as markdown.markdown but reusing a Markdown instance (per thread, an instance
+    cannot be shared by threads) instead of setting up a new one for every conversion
+    """
+    converter = getattr(_local, 'converter', None)
+    if converter is None:
+        converter = _local.converter = md.Markdown()
+    return converter.reset().convert(value)
+
+
+def markdown_to_html(value: str) -> SafeString:
+    """
+    The HTML of the markdown, any HTML in the markdown itself is escaped
+    """
+    return mark_safe(_convert(escape(value)))
+
+
+def markdown_to_plaintext(value: str) -> str:
+    return strip_markdown_html(_convert(value))
+
+
+def render_markdown(value: str) -> tuple[SafeString, SafeString]:
+    """
+    The HTML and plaintext of the markdown of an email body
+
+    The markdown is converted once when the body contains no characters that are escaped for the HTML version. The
+    plaintext is marked safe, like the "plaintext" filter does for the (safe) output of a rendered template.
+    """
+    escaped = escape(value)
+    html = _convert(escaped)
+    plaintext = strip_markdown_html(html if escaped == value else _convert(value))
+    return mark_safe(html), mark_safe(plaintext)
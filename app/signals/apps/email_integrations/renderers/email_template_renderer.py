@@ -1,20 +1,119 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
 from django.template import Context, Template, loader
 
+from signals.apps.email_integrations.markdown.converter import render_markdown
 from signals.apps.email_integrations.models import EmailTemplate
+from signals.apps.services.domain.cache_version import CacheVersion
+
+
+@dataclass(frozen=True)
+class CompiledEmailTemplate:
+    updated_at: datetime
+    title: Template
+    body: Template
 
 
 class EmailTemplateRenderer:
-    def __call__(self, key: str, context: dict) -> tuple[str, str, str]:
+    """
+    Renders the subject, text message and html message of an EmailTemplate
+
+    The title and body of an EmailTemplate are parsed once per process, the compiled templates are kept per key
+    together with the updated_at of the EmailTemplate they were compiled from. All processes share one version in the
+    cache, the version is replaced whenever an EmailTemplate is saved or deleted (before and again after the change is
+    committed). Every process reads the version at most once per VERSION_CHECK_INTERVAL seconds, after a new version
+    (or at least every MAX_AGE seconds) the updated_at of a template is checked (once) before it is used again and the
+    template is compiled again when it has changed.
+    """
+    MAX_AGE = 5 * 60
+    VERSION_CHECK_INTERVAL = 1
+
+    cache_version = CacheVersion('signals-email-template-version')
+
+    _lock = threading.Lock()
+    _version: Optional[str] = None
+    _version_checked_at = 0.0
+    _compiled: dict[str, CompiledEmailTemplate] = {}
+    _checked: dict[str, float] = {}
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._version = None
+            cls._checked = {}
+        cls.cache_version.replace()
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forgets the compiled templates and the version known to this process (without replacing the shared version)
+        """
+        with cls._lock:
+            cls._version = None
+            cls._compiled = {}
+            cls._checked = {}
+
+    @classmethod
+    def _check_version(cls) -> str:
+        now = time.monotonic()
+        with cls._lock:
+            version = cls._version
+            if version is not None and now - cls._version_checked_at < cls.VERSION_CHECK_INTERVAL:
+                return version
+
+        version = cls.cache_version.get()
+        with cls._lock:
+            if cls._version != version:
+                cls._version = version
+                cls._checked = {}
+            cls._version_checked_at = now
+        return version
+
+    @classmethod
+    def get_template(cls, key: str) -> CompiledEmailTemplate:
+        """
+        The compiled EmailTemplate, raises EmailTemplate.DoesNotExist when there is no EmailTemplate with the key
+        """
+        version = cls._check_version()
+        with cls._lock:
+            checked_at = cls._checked.get(key)
+            if checked_at is not None and time.monotonic() - checked_at < cls.MAX_AGE:
+                return cls._compiled[key]
+            compiled = cls._compiled.get(key)
+
         email_template = EmailTemplate.objects.get(key=key)
+        if compiled is None or compiled.updated_at != email_template.updated_at:
+            compiled = CompiledEmailTemplate(updated_at=email_template.updated_at,
+                                             title=Template(email_template.title),
+                                             body=Template(email_template.body))
+
+        with cls._lock:
+            if cls._version == version:
+                cls._compiled[key] = compiled
+                cls._checked[key] = time.monotonic()
+
+        return compiled
+
+    def __call__(self, key: str, context: dict) -> tuple[str, str, str]:
+        email_template = self.get_template(key)
+
+        body = email_template.body.render(Context(context, autoescape=False))
+        body_html, body_text = render_markdown(body)
 
         rendered_context = {
-            'subject': Template(email_template.title).render(Context(context)),
-            'body': Template(email_template.body).render(Context(context, autoescape=False))
+            'subject': email_template.title.render(Context(context)),
+            'body': body,
+            'body_html': body_html,
+            'body_text': body_text,
         }
 
-        subject = Template(email_template.title).render(Context(context, autoescape=False))
+        subject = email_template.title.render(Context(context, autoescape=False))
         message = loader.get_template('email/_base.txt').render(rendered_context)
         html_message = loader.get_template('email/_base.html').render(rendered_context)
 
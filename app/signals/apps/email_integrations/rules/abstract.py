@@ -1,11 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2022 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 from abc import ABC, abstractmethod
 
-from django.db.models import Q
-
+from signals.apps.email_integrations.rules.facts import MailFacts
 from signals.apps.signals import workflow
-from signals.apps.signals.models import Signal
 
 
 class AbstractRule(ABC):
@@ -15,32 +13,37 @@ class AbstractRule(ABC):
     The derived class, is associated with the corresponding action. For example the SignalCreatedRule is used with the
     SignalCreatedAction to determine if it should trigger tge Signal created email to be sent.
     """
-    def __call__(self, signal):
+    def __call__(self, signal, facts: MailFacts | None = None):
         """
         When called run all validation
         """
-        return self.validate(signal, signal.status)
+        return self.validate(signal, signal.status, facts)
 
-    def validate(self, signal, status):
+    def validate(self, signal, status, facts: MailFacts | None = None):
         """
         Run all validations
 
         - The reporter email must be set
         - The Signal cannot be a child Signal OR should have the status GESPLITST
+
+        Pass the same facts when evaluating several rules for a Signal, so the facts are only queried once.
         """
-        return (self._validate_reporter_email(signal) and
-                self._validate_historical_data(signal) and
-                self._validate_allows_contact(signal) and
-                self._validate_status(status) and
+        if facts is None:
+            facts = MailFacts(signal)
+
+        return (self._validate_reporter_email(facts) and
+                self._validate_historical_data(facts) and
+                self._validate_allows_contact(facts) and
+                self._validate_status(status, facts) and
                 self._validate(signal))
 
-    def _validate_reporter_email(self, signal):
+    def _validate_reporter_email(self, facts: MailFacts):
         """
         Validate that the reporter email is set
         """
-        return signal.reporter and signal.reporter.email
+        return bool(facts.reporter_email)
 
-    def _validate_historical_data(self, signal):
+    def _validate_historical_data(self, facts: MailFacts):
         """
         Validate that a Signal is not a child Signal OR that the Signal has the status GESPLITST.
 
@@ -49,9 +52,7 @@ class AbstractRule(ABC):
               emails can be sent from child signals. Before that child signals were communicated to the parent signal's
               reporter. In that case the original complaint transitioned to the status GESPLITST. (See SIG-2931.)
         """
-        return Signal.objects.filter(id=signal.id).filter(
-            Q(parent_id__isnull=True) | Q(parent__status__state__exact=workflow.GESPLITST)
-        )
+        return not facts.is_child or facts.parent_state == workflow.GESPLITST
 
     def _validate(self, signal):
         """
@@ -60,17 +61,17 @@ class AbstractRule(ABC):
         return True
 
     @abstractmethod
-    def _validate_status(self, status):
+    def _validate_status(self, status, facts: MailFacts):
         """
         overwrite this function in the defined Rule to add the additional status validation checks
         """
         return False
 
-    def _validate_allows_contact(self, signal: Signal):
+    def _validate_allows_contact(self, facts: MailFacts):
         """
         Validate if the user want to be contacted and if allows_contact on feedback is False to
         never send ANY emails to the user
 
         If the feature flag is False we return True to still send emails to the user.
         """
-        return signal.allows_contact
+        return facts.allows_contact
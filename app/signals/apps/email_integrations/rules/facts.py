@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from functools import cached_property
+
+from django.conf import settings
+
+from signals.apps.signals.models import Signal, Status
+
+
+class MailFacts:
+    """
+    The facts about a Signal the email rules are evaluated against
+
+    All rules of the status actions check the same facts (the reporter, the state of the parent, the feedback and the
+    status history). The facts are loaded on first use and only once, so evaluating all rules for a status change
+    queries them once instead of once per rule. Create a new MailFacts for every evaluation.
+    """
+    def __init__(self, signal: Signal):
+        self.signal = signal
+
+    @property
+    def reporter_email(self) -> str | None:
+        return self.signal.reporter.email if self.signal.reporter else None
+
+    @cached_property
+    def parent_state(self) -> str | None:
+        """
+        The state of the parent Signal, None when the Signal is not a child Signal
+        """
+        if self.signal.parent_id is None:
+            return None
+        return Signal.objects.filter(id=self.signal.parent_id).values_list('status__state', flat=True).first()
+
+    @property
+    def is_child(self) -> bool:
+        return self.signal.parent_id is not None
+
+    @cached_property
+    def _feedback(self) -> list[tuple]:
+        # (submitted_at, allows_contact) in the default ordering of the feedback
+        return list(self.signal.feedback.values_list('submitted_at', 'allows_contact'))
+
+    @cached_property
+    def allows_contact(self) -> bool:
+        """
+        The same as Signal.allows_contact, based on the feedback loaded for these facts
+        """
+        if not settings.FEATURE_FLAGS.get('REPORTER_MAIL_CONTACT_FEEDBACK_ALLOWS_CONTACT_ENABLED', True):
+            return True
+
+        if hasattr(self.signal, 'feedback_allows_contact'):
+            # Annotated (see SignalQuerySet.annotate_feedback_allows_contact)
+            return self.signal.feedback_allows_contact
+
+        submitted = [feedback for feedback in self._feedback if feedback[0] is not None]
+        if not submitted:
+            return True
+        return max(submitted, key=lambda feedback: feedback[0])[1]
+
+    @cached_property
+    def last_feedback_allows_contact(self) -> bool | None:
+        """
+        The allows_contact of the last feedback (in the default ordering of the feedback), None without feedback
+        """
+        return self._feedback[-1][1] if self._feedback else None
+
+    @cached_property
+    def status_history(self) -> list[tuple[int, str]]:
+        """
+        The (id, state) of all statuses of the Signal, the oldest first
+        """
+        return list(
+            Status.objects.filter(_signal_id=self.signal.id).order_by('created_at', 'id').values_list('id', 'state')
+        )
+
+    def first_status(self) -> tuple[int, str] | None:
+        return self.status_history[0] if self.status_history else None
+
+    def previous_state(self, status: Status) -> str | None:
+        """
+        The state of the latest status of the Signal other than the given status
+        """
+        states = [state for status_id, state in self.status_history if status_id != status.id]
+        return states[-1] if states else None
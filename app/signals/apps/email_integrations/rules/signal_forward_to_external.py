@@ -8,7 +8,7 @@ from signals.apps.signals.workflow import DOORGEZET_NAAR_EXTERN
 
 
 class ForwardToExternalRule(AbstractRule):
-    def validate(self, signal, status):
+    def validate(self, signal, status, facts=None):
         """
         Run all validation
 
@@ -18,9 +18,9 @@ class ForwardToExternalRule(AbstractRule):
         Note: we are not using the baseclass validate method because it hardcodes a number of checks for mails to
         reporters. These checks are not relevant here.
         """
-        return self._validate_status(status) and self._validate_status_email_override(status)
+        return self._validate_status(status, facts) and self._validate_status_email_override(status)
 
-    def _validate_status(self, status):
+    def _validate_status(self, status, facts):
         """
         Validate that the status is DOORGEZET_NAAR_EXTERN
         """
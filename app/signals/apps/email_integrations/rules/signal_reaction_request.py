@@ -1,11 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2022 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 from signals.apps.email_integrations.rules.abstract import AbstractRule
 from signals.apps.signals.workflow import REACTIE_GEVRAAGD
 
 
 class SignalReactionRequestRule(AbstractRule):
-    def _validate_status(self, status):
+    def _validate_status(self, status, facts):
         """
         Run status validations for the Rule
 
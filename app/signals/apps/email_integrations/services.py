@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 from signals.apps.email_integrations.actions import (
     AssignedAction,
     FeedbackReceivedAction,
@@ -16,6 +16,7 @@ from signals.apps.email_integrations.actions import (
 )
 from signals.apps.email_integrations.actions.abstract import AbstractAction, AbstractSystemAction
 from signals.apps.email_integrations.renderers.email_template_renderer import EmailTemplateRenderer
+from signals.apps.email_integrations.rules.facts import MailFacts
 from signals.apps.signals.models import Signal
 
 
@@ -48,12 +49,14 @@ class MailService:
         Send a mail based on the update status from a signal
         """
         if not isinstance(signal, Signal):
-            signal = Signal.objects.select_related('status').get(pk=signal)
+            signal = Signal.objects.select_related('status', 'reporter').get(pk=signal)
 
         assert isinstance(signal, Signal)
 
+        # The facts are shared by the rules of all actions, so they are queried once
+        facts = MailFacts(signal)
         for action in cls._status_actions:
-            if action(signal, dry_run=dry_run):
+            if action(signal, dry_run=dry_run, facts=facts):
                 return True
 
         return False
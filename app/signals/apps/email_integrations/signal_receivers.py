@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2022 Gemeente Amsterdam, Delta10 B.V.
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam, Delta10 B.V.
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from signals.apps.email_integrations import tasks
+from signals.apps.email_integrations.models import EmailTemplate
+from signals.apps.email_integrations.renderers.email_template_renderer import EmailTemplateRenderer
 from signals.apps.signals.managers import (
     create_initial,
     update_signal_departments,
@@ -40,3 +44,14 @@ def update_user_assignment_handler(sender, signal_obj, user_assignment, prev_use
         signal_pk=signal_obj.pk,
         user_pk=user_assignment.user.pk
     )
+
+
+@receiver(post_save, sender=EmailTemplate, dispatch_uid='email_template_saved')
+@receiver(post_delete, sender=EmailTemplate, dispatch_uid='email_template_deleted')
+def email_template_invalidation_handler(sender, **kwargs):
+    """
+    Changes to the email templates (for instance in the Django admin) invalidate the compiled email templates, again
+    when the transaction is committed so other processes cannot keep templates compiled from the data before the commit
+    """
+    EmailTemplateRenderer.invalidate()
+    transaction.on_commit(EmailTemplateRenderer.invalidate)
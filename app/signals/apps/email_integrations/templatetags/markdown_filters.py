@@ -1,20 +1,20 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
-import markdown as md
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 from django import template
-from django.utils.html import escape
-from django.utils.safestring import mark_safe
 
-from signals.apps.email_integrations.markdown.plaintext import strip_markdown_html
+from signals.apps.email_integrations.markdown.converter import (
+    markdown_to_html,
+    markdown_to_plaintext
+)
 
 register = template.Library()
 
 
 @register.filter
 def markdown(value: str) -> str:
-    return mark_safe(md.markdown(escape(value)))
+    return markdown_to_html(value)
 
 
 @register.filter(is_safe=True)
 def plaintext(value: str) -> str:
-    return strip_markdown_html(md.markdown(value))
+    return markdown_to_plaintext(value)
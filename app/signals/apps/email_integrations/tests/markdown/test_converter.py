@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import markdown
+from django.utils.html import escape
+
+from signals.apps.email_integrations.markdown.converter import render_markdown
+from signals.apps.email_integrations.markdown.plaintext import strip_markdown_html
+
+
+class TestRenderMarkdown:
+    def _expected(self, body):
+        return markdown.markdown(escape(body)), strip_markdown_html(markdown.markdown(body))
+
+    def test_render_markdown(self):
+        body = '# Title\n\nThanks a lot for reporting **SIG-123**\n\n- one\n- two'
+        assert render_markdown(body) == self._expected(body)
+
+    def test_render_markdown_escaped(self):
+        body = '**Example** <script>alert("evil");</script> & more'
+        html, plaintext = render_markdown(body)
+
+        assert (html, plaintext) == self._expected(body)
+        assert '&lt;script&gt;' in html
+
+    def test_render_markdown_repeated(self):
+        # The converter is reused, nothing of a previous body may end up in the next one
+        render_markdown('[link][1]\n\n[1]: https://example.com')
+        assert render_markdown('[link][1]') == self._expected('[link][1]')
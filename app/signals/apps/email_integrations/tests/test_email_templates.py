@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
 from typing import Final
+from unittest import mock
 from unittest.mock import Mock
 
 from django.conf import settings
@@ -1389,3 +1390,78 @@ Voor vragen over de wijziging kunt u bellen met telefoonnummer 14 020, maandag t
 </body>
 </html>
 """  # noqa
+
+
+class TestEmailTemplateRenderer(TestCase):
+    def setUp(self):
+        self.email_template = EmailTemplate.objects.create(
+            key=EmailTemplate.SIGNAL_CREATED,
+            title='Uw melding {{ formatted_signal_id }}',
+            body='Bedankt voor uw melding **{{ formatted_signal_id }}**',
+        )
+        self.render = EmailTemplateRenderer()
+
+    def test_compiled_once(self):
+        compiled = EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED)
+
+        # The version was read just now and the EmailTemplate is not queried or parsed again
+        with self.assertNumQueries(0):
+            self.assertIs(EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED), compiled)
+
+        subject, message, html_message = self.render(EmailTemplate.SIGNAL_CREATED, {'formatted_signal_id': 'SIG-1'})
+        self.assertEqual(subject, 'Uw melding SIG-1')
+        self.assertEqual(message, 'Bedankt voor uw melding SIG-1')
+        self.assertIn('<p>Bedankt voor uw melding <strong>SIG-1</strong></p>', html_message)
+
+    def test_version_checked_once_per_interval(self):
+        with mock.patch('signals.apps.email_integrations.renderers.email_template_renderer.time.monotonic',
+                        return_value=1000.0) as mocked_monotonic:
+            compiled = EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED)
+
+            with self.assertNumQueries(0):
+                EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED)
+
+            # After the interval only the version is read again
+            mocked_monotonic.return_value += EmailTemplateRenderer.VERSION_CHECK_INTERVAL
+            with self.assertNumQueries(1):
+                self.assertIs(EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED), compiled)
+
+    def test_checked_again_after_max_age(self):
+        with mock.patch('signals.apps.email_integrations.renderers.email_template_renderer.time.monotonic',
+                        return_value=1000.0) as mocked_monotonic:
+            compiled = EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED)
+
+            # Changed without replacing the version (for instance by another process before its commit)
+            EmailTemplate.objects.filter(pk=self.email_template.pk).update(title='Melding {{ formatted_signal_id }}',
+                                                                           updated_at=now())
+
+            mocked_monotonic.return_value += EmailTemplateRenderer.VERSION_CHECK_INTERVAL
+            self.assertIs(EmailTemplateRenderer.get_template(EmailTemplate.SIGNAL_CREATED), compiled)
+
+            mocked_monotonic.return_value += EmailTemplateRenderer.MAX_AGE
+            subject, _, _ = self.render(EmailTemplate.SIGNAL_CREATED, {'formatted_signal_id': 'SIG-1'})
+            self.assertEqual(subject, 'Melding SIG-1')
+
+    def test_invalidated_again_on_commit(self):
+        with mock.patch.object(EmailTemplateRenderer, 'invalidate') as mocked_invalidate, \
+                self.captureOnCommitCallbacks(execute=True):
+            self.email_template.save()
+            mocked_invalidate.assert_called_once_with()
+
+        self.assertEqual(mocked_invalidate.call_count, 2)
+
+    def test_recompiled_after_save(self):
+        self.render(EmailTemplate.SIGNAL_CREATED, {'formatted_signal_id': 'SIG-1'})
+
+        self.email_template.title = 'Melding {{ formatted_signal_id }}'
+        self.email_template.save()
+
+        subject, _, _ = self.render(EmailTemplate.SIGNAL_CREATED, {'formatted_signal_id': 'SIG-1'})
+        self.assertEqual(subject, 'Melding SIG-1')
+
+    def test_deleted(self):
+        self.render(EmailTemplate.SIGNAL_CREATED, {'formatted_signal_id': 'SIG-1'})
+        self.email_template.delete()
+
+        with self.assertRaises(EmailTemplate.DoesNotExist):
+            self.render(EmailTemplate.SIGNAL_CREATED, {'formatted_signal_id': 'SIG-1'})
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2022 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 from datetime import timedelta
 
 from django.test import TestCase
@@ -19,6 +19,8 @@ from signals.apps.email_integrations.rules import (
     SignalScheduledRule
 )
 from signals.apps.email_integrations.rules.abstract import AbstractRule
+from signals.apps.email_integrations.rules.facts import MailFacts
+from signals.apps.email_integrations.services import MailService
 from signals.apps.feedback.factories import FeedbackFactory
 from signals.apps.questionnaires.app_settings import NO_REACTION_RECEIVED_TEXT
 from signals.apps.signals import workflow
@@ -422,3 +424,26 @@ class TestForwardToExternalRule(TestCase):
                                             reporter__email='',
                                             parent=parent_signal)
         self.assertTrue(self.rule(child_signal))
+
+
+class TestMailFacts(TestCase):
+    def test_rules_share_facts(self):
+        signal = SignalFactory.create(status__state=workflow.VERZOEK_TOT_HEROPENEN, reporter__email='test@example.com')
+        signal.status = StatusFactory.create(_signal=signal, state=workflow.AFGEHANDELD)
+        signal.save()
+        FeedbackFactory.create(_signal=signal, allows_contact=True)
+
+        facts = MailFacts(signal)
+        with self.assertNumQueries(2):  # The feedback and the status history, for all rules together
+            rules = [action.rule for action in MailService._status_actions if action.rule(signal, facts)]
+
+        self.assertEqual([type(rule) for rule in rules], [SignalHandledNegativeRule])
+
+    def test_child_signal(self):
+        parent_signal = SignalFactory.create(status__state=workflow.GESPLITST)
+        child_signal = SignalFactory.create(parent=parent_signal, reporter__email='test@example.com')
+
+        facts = MailFacts(child_signal)
+        self.assertTrue(facts.is_child)
+        self.assertEqual(facts.parent_state, workflow.GESPLITST)
+        self.assertIsNone(MailFacts(parent_signal).parent_state)
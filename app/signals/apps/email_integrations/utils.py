@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2023 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 import re
 from typing import Optional
 from urllib.parse import unquote
@@ -13,6 +13,7 @@ from rest_framework.exceptions import NotFound
 
 from signals.apps.email_integrations.admin import EmailTemplate
 from signals.apps.email_integrations.exceptions import URLEncodedCharsFoundInText
+from signals.apps.email_integrations.rules.facts import MailFacts
 from signals.apps.feedback.models import Feedback
 from signals.apps.questionnaires.services.feedback_request import (
     create_session_for_feedback_request,
@@ -267,9 +268,10 @@ def trigger_mail_action_for_email_preview(signal, status_data):
     status.id = 0  # Fake id so that we still can trigger the action rule
 
     subject = message = html_message = None
+    facts = MailFacts(signal)
     for action in MailService._status_actions:
         # Execute the rule associated with the action
-        if action.rule.validate(signal, status):
+        if action.rule.validate(signal, status, facts):
             # action found, now render the subject, message and html_message and break the loop
             email_context = action.get_context(signal, dry_run=True)
 
@@ -1,7 +1,8 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 - 2025 Gemeente Amsterdam
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
 import pytz
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.dispatch import Signal as DjangoSignal
 from django.utils import timezone
 
@@ -181,6 +182,46 @@ class SignalLogService:
             _signal=signal_departments._signal,
         )
 
+    @staticmethod
+    def log_update_user_assignments_in_bulk(user_assignments: list[SignalUser]) -> None:
+        """
+        Same as log_update_user_assignment, with one query for all given user assignments
+        """
+        content_type = ContentType.objects.get_for_model(SignalUser)
+        Log.objects.bulk_create([
+            Log(
+                content_type=content_type,
+                object_pk=str(user_assignment.pk),
+                action=Log.ACTION_UPDATE,
+                extra=user_assignment.user.email if user_assignment.user else None,
+                created_by=user_assignment.created_by,
+                created_at=user_assignment.created_at,
+                _signal_id=user_assignment._signal_id,
+            )
+            for user_assignment in user_assignments
+        ])
+
+    @staticmethod
+    def log_update_signal_departments_in_bulk(signal_departments: list[tuple[SignalDepartments, str]]) -> None:
+        """
+        Same as log_update_signal_departments, with one query for all given SignalDepartments. The codes of the
+        departments (the "extra" of the log) are given with every SignalDepartments.
+        """
+        content_type = ContentType.objects.get_for_model(SignalDepartments)
+        Log.objects.bulk_create([
+            Log(
+                content_type=content_type,
+                object_pk=str(departments.pk),
+                action=Log.ACTION_UPDATE,
+                extra=department_codes,
+                description=None,
+                created_by=departments.created_by,
+                created_at=departments.created_at,
+                _signal_id=departments._signal_id,
+            )
+            for departments, department_codes in signal_departments
+        ])
+
     @staticmethod
     def log_receive_feedback(feedback: Feedback) -> None:
         if not isinstance(feedback, Feedback):
@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2022 Gemeente Amsterdam
-from rest_framework.throttling import SimpleRateThrottle
+# Copyright (C) 2022 - 2026 Gemeente Amsterdam
+from signals.throttling import SlidingWindowRateThrottle
 
 
-class AnonMySignalsTokenRateThrottle(SimpleRateThrottle):
+class AnonMySignalsTokenRateThrottle(SlidingWindowRateThrottle):
     """
     Limits the rate of API calls that may be made by an anonymous reporter.
 
@@ -1,3 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from datetime import timedelta
+
 CSV_BATCH_SIZE = 2000
+
+# The delta exports of the datawarehouse start this long before the previous delta export, so the rows of transactions
+# that were still running during the previous export are not missed
+DELTA_EXPORT_OVERLAP = timedelta(minutes=5)
@@ -1,9 +1,10 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 from signals.apps.reporting.csv.datawarehouse.categories import (
     create_category_assignments_csv,
     create_category_sla_csv
 )
+from signals.apps.reporting.csv.datawarehouse.deleted_signals import create_deleted_signals_csv
 from signals.apps.reporting.csv.datawarehouse.directing_departments import (
     create_directing_departments_csv
 )
@@ -27,6 +28,7 @@ from signals.apps.reporting.csv.datawarehouse.tasks import (
 __all__ = [
     'create_category_assignments_csv',
     'create_category_sla_csv',
+    'create_deleted_signals_csv',
     'create_directing_departments_csv',
     'create_kto_feedback_csv',
     'create_locations_csv',
@@ -1,20 +1,22 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
-import os
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from datetime import datetime
 
 from django.contrib.postgres.aggregates import StringAgg
 from django.db.models import CharField, F, Q, Value
 from django.db.models.functions import Cast, Coalesce
 
-from signals.apps.reporting.csv.utils import queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset
 from signals.apps.signals.models import CategoryAssignment, ServiceLevelObjective
 
 
-def create_category_assignments_csv(location: str) -> str:
+def create_category_assignments_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `CategoryAssignment` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = CategoryAssignment.objects.values(
@@ -34,20 +36,21 @@ def create_category_assignments_csv(location: str) -> str:
         'id'
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'categories.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'main', 'sub', 'departments', 'created_at', 'updated_at', 'extra_properties',
                            '_signal_id', 'deadline', 'deadline_factor_3', ]
-    reorder_csv(csv_file.name, ordered_field_names)
+    return export_queryset(queryset, location, 'categories', ordered_field_names, file_format)
 
-    return csv_file.name
 
-
-def create_category_sla_csv(location: str) -> str:
+def create_category_sla_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `ServiceLevelObjective` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = ServiceLevelObjective.objects.values(
@@ -62,9 +65,8 @@ def create_category_sla_csv(location: str) -> str:
         '-created_at'
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'sla.csv'))
+    if since is not None:
+        queryset = queryset.filter(created_at__gte=since)
 
     ordered_field_names = ['id', 'main', 'sub', 'n_days', 'use_calendar_days', 'created_at', ]
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'sla', ordered_field_names, file_format)
@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from datetime import datetime
+
+from signals.apps.reporting.csv.utils import export_queryset
+from signals.apps.signals.models import DeletedSignal
+
+
+def create_deleted_signals_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
+    """
+    Create CSV file with all `DeletedSignal` objects, the tombstones of the deleted `Signal` objects (and the rows
+    related to them) for the delta exports.
+
+    :param location: Directory for saving the CSV file
+    :param since: Only export the Signals deleted since then (delta export)
+    :param file_format: "csv" or "parquet"
+    :returns: Path to CSV file
+    """
+    queryset = DeletedSignal.objects.values(
+        'signal_id',
+        'signal_uuid',
+        'parent_signal_id',
+        'signal_state',
+        'deleted_at',
+        'action',
+    ).order_by(
+        'deleted_at'
+    )
+
+    if since is not None:
+        queryset = queryset.filter(deleted_at__gte=since)
+
+    ordered_field_names = ['signal_id', 'signal_uuid', 'parent_signal_id', 'signal_state', 'deleted_at', 'action', ]
+    return export_queryset(queryset, location, 'deleted_signals', ordered_field_names, file_format)
@@ -1,18 +1,20 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
-import os
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from datetime import datetime
 
 from django.contrib.postgres.aggregates import StringAgg
 
-from signals.apps.reporting.csv.utils import queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset
 from signals.apps.signals.models import SignalDepartments
 
 
-def create_directing_departments_csv(location: str) -> str:
+def create_directing_departments_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `DirectingDepartments` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = SignalDepartments.objects.values(
@@ -26,9 +28,8 @@ def create_directing_departments_csv(location: str) -> str:
         '-created_at',
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'directing_departments.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'created_at', 'updated_at', '_signal_id', 'departments', ]
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'directing_departments', ordered_field_names, file_format)
@@ -1,19 +1,22 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 import os
+from datetime import datetime
 
-from django.db.models import CharField, F, Func, TextField, Value
+from django.db.models import CharField, F, Func, Q, TextField, Value
 from django.db.models.functions import Cast, Coalesce, NullIf
 
 from signals.apps.feedback.models import Feedback
-from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset, map_choices
 
 
-def create_kto_feedback_csv(location: str) -> str:
+def create_kto_feedback_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `Feedback` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     environment = os.getenv('ENVIRONMENT')
@@ -23,7 +26,7 @@ def create_kto_feedback_csv(location: str) -> str:
     elif environment.upper() not in ['PRODUCTION', 'ACCEPTANCE']:
         raise EnvironmentError('ENVIRONMENT env variable is wrong {}'.format(environment))
 
-    file_name = f'kto-feedback-{environment}.csv'
+    file_name = f'kto-feedback-{environment}'
 
     queryset = Feedback.objects.values(
         '_signal_id',
@@ -40,10 +43,9 @@ def create_kto_feedback_csv(location: str) -> str:
                         function_kwargs={'indent': 4, 'ensure_ascii': False}),
     ).filter(submitted_at__isnull=False)
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, file_name))
+    if since is not None:
+        queryset = queryset.filter(Q(created_at__gte=since) | Q(submitted_at__gte=since))
 
     ordered_field_names = ['_signal_id', 'is_satisfied', 'allows_contact', 'text',
                            'text_extra', 'created_at', 'submitted_at', 'text_list']
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, file_name, ordered_field_names, file_format)
@@ -1,19 +1,22 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
-import os
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from datetime import datetime
 
 from django.db.models import CharField, ExpressionWrapper, FloatField, Func, Value
+from django.db.models.fields.json import KeyTextTransform
 from django.db.models.functions import Cast, Coalesce
 
-from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset, map_choices
 from signals.apps.signals.models import STADSDELEN, Location
 
 
-def create_locations_csv(location: str) -> str:
+def create_locations_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `Location` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Location.objects.values(
@@ -31,23 +34,23 @@ def create_locations_csv(location: str) -> str:
         _address=Coalesce(Cast('address', output_field=CharField()), Value('null', output_field=CharField())),
         _extra_properties=Coalesce(
             Cast('extra_properties', output_field=CharField()), Value('null', output_field=CharField())),
+        # The address parts are selected as text (instead of JSON) so they are exported without quotes
         address_street=Coalesce(
-            Cast('address__openbare_ruimte', output_field=CharField()), Value('null', output_field=CharField())),
+            KeyTextTransform('openbare_ruimte', 'address'), Value('null'), output_field=CharField()),
         address_number=Coalesce(
-            Cast('address__huisnummer', output_field=CharField()), Value('null', output_field=CharField())),
+            KeyTextTransform('huisnummer', 'address'), Value('null'), output_field=CharField()),
         address_postalcode=Coalesce(
-            Cast('address__postcode', output_field=CharField()), Value('null', output_field=CharField())),
+            KeyTextTransform('postcode', 'address'), Value('null'), output_field=CharField()),
         address_city=Coalesce(
-            Cast('address__woonplaats', output_field=CharField()), Value('null', output_field=CharField()))
+            KeyTextTransform('woonplaats', 'address'), Value('null'), output_field=CharField())
     ).order_by(
         'id'
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'locations.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'lat', 'lng', 'stadsdeel', 'buurt_code', 'address', 'address_text', 'created_at',
                            'updated_at', 'extra_properties', '_signal_id', 'address_street', 'address_number',
                            'address_postalcode', 'address_city', 'area_code', 'area_name']
-    reorder_csv(csv_file.name, ordered_field_names, remove_leading_trailing_quotes=True)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'locations', ordered_field_names, file_format)
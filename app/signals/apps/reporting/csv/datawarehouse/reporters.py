@@ -1,18 +1,20 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
-import os
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from datetime import datetime
 
 from django.db.models import BooleanField, Case, CharField, Q, Value, When
 
-from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset, map_choices
 from signals.apps.signals.models import Reporter
 
 
-def create_reporters_csv(location: str) -> str:
+def create_reporters_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `Reporter` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Reporter.objects.annotate(
@@ -42,10 +44,9 @@ def create_reporters_csv(location: str) -> str:
         _is_anonymized=map_choices('is_anonymized', [(True, 'True'), (False, 'False')]),
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'reporters.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'email', 'phone', 'is_anonymized', 'created_at', 'updated_at', 'extra_properties',
                            '_signal_id', ]
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'reporters', ordered_field_names, file_format)
@@ -1,27 +1,29 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 """
 Dump CSV of SIA tables matching the old, agreed-upon, format.
 """
 import logging
-import os
+from datetime import datetime
 
 from django.contrib.postgres.aggregates import StringAgg
 from django.db.models import CharField, F, Q, Value
 from django.db.models.functions import Cast, Coalesce
 
-from signals.apps.reporting.csv.utils import queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset
 from signals.apps.signals.models import Note, Signal, SignalDepartments
 from signals.apps.signals.workflow import AFGEHANDELD, GEANNULEERD
 
 logger = logging.getLogger(__name__)
 
 
-def create_signals_csv(location: str) -> str:
+def create_signals_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create the CSV file with all `Signal` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Signal.objects.annotate(
@@ -56,23 +58,26 @@ def create_signals_csv(location: str) -> str:
                                    Value('null', output_field=CharField()))
     ).order_by('created_at')
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'signals.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'signal_uuid', 'source', 'text', 'text_extra', 'incident_date_start',
                            'incident_date_end', 'created_at', 'updated_at', 'operational_date', 'expire_date', 'image',
                            'upload', 'extra_properties', 'category_assignment_id', 'location_id', 'reporter_id',
                            'status_id', 'priority', 'priority_created_at', 'parent', 'type', 'type_created_at',
                            'directing_departments_assignment_id', ]
-    reorder_csv(csv_file.name, ordered_field_names)
+    return export_queryset(queryset, location, 'signals', ordered_field_names, file_format)
 
-    return csv_file.name
 
-
-def create_ml_csv(location: str) -> str:
+def create_ml_csv(location: str, file_format: str = 'csv') -> str:
     """
     Create the CSV file with all categorized `Signal` objects for ML purposes.
 
+    Note: always a full export, the rows have no id to upsert them by and Signals that are reopened or moved to an
+    "Overig" category have to disappear from the file.
+
     :param location: Directory for saving the CSV file
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Signal.objects.filter(
@@ -88,19 +93,17 @@ def create_ml_csv(location: str) -> str:
         Sub=F('category_assignment__category__name'),
     ).order_by('created_at')
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'ml.csv'))
-
     ordered_field_names = ['Text', 'Main', 'Sub']
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'ml', ordered_field_names, file_format)
 
 
-def create_signals_assigned_user_csv(location: str) -> str:
+def create_signals_assigned_user_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create the CSV file with all `Signal - assigned user relation` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Signal.objects.annotate(
@@ -111,19 +114,21 @@ def create_signals_assigned_user_csv(location: str) -> str:
         assigned_at=F('user_assignment__created_at')
     ).exclude(user_assignment__user__isnull=True).exclude(user_assignment__user__email__exact='').order_by('created_at')
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'signals_assigned_user.csv'))
+    if since is not None:
+        queryset = queryset.filter(user_assignment__updated_at__gte=since)
 
     ordered_field_names = ['id', 'assigned_to', 'assigned_at']
-    reorder_csv(csv_file.name, ordered_field_names)
+    return export_queryset(queryset, location, 'signals_assigned_user', ordered_field_names, file_format)
 
-    return csv_file.name
 
-
-def create_signals_routing_departments_csv(location: str) -> str:
+def create_signals_routing_departments_csv(location: str, since: datetime | None = None,
+                                           file_format: str = 'csv') -> str:
     """
     Create the CSV file with all `Signal - department relation (filled by routing rules)` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = SignalDepartments.objects.values(
@@ -137,19 +142,20 @@ def create_signals_routing_departments_csv(location: str) -> str:
         '-created_at',
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'routing_departments.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'created_at', 'updated_at', '_signal_id', 'departments', ]
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'routing_departments', ordered_field_names, file_format)
 
 
-def create_signals_notes_csv(location: str) -> str:
+def create_signals_notes_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create the CSV file with all `Signal - notes relation` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Note.objects.values(
@@ -163,9 +169,8 @@ def create_signals_notes_csv(location: str) -> str:
         '-created_at',
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'notes.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'created_at', 'updated_at', '_signal_id', 'text']
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'notes', ordered_field_names, file_format)
@@ -1,20 +1,22 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Gemeente Amsterdam
-import os
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+from datetime import datetime
 
 from django.db.models import CharField, Value
 from django.db.models.functions import Cast, Coalesce
 
-from signals.apps.reporting.csv.utils import map_choices, queryset_to_csv_file, reorder_csv
+from signals.apps.reporting.csv.utils import export_queryset, map_choices
 from signals.apps.signals.models import Status
 from signals.apps.signals.workflow import STATUS_CHOICES
 
 
-def create_statuses_csv(location: str) -> str:
+def create_statuses_csv(location: str, since: datetime | None = None, file_format: str = 'csv') -> str:
     """
     Create CSV file with all `Status` objects.
 
     :param location: Directory for saving the CSV file
+    :param since: Only export the rows created or updated since then (delta export)
+    :param file_format: "csv" or "parquet"
     :returns: Path to CSV file
     """
     queryset = Status.objects.values(
@@ -32,10 +34,9 @@ def create_statuses_csv(location: str) -> str:
                                    Value('null', output_field=CharField()))
     )
 
-    csv_file = queryset_to_csv_file(queryset, os.path.join(location, 'statuses.csv'))
+    if since is not None:
+        queryset = queryset.filter(updated_at__gte=since)
 
     ordered_field_names = ['id', 'text', 'user', 'target_api', 'state_display', 'extern', 'created_at', 'updated_at',
                            'extra_properties', '_signal_id', 'state', ]
-    reorder_csv(csv_file.name, ordered_field_names)
-
-    return csv_file.name
+    return export_queryset(queryset, location, 'statuses', ordered_field_names, file_format)
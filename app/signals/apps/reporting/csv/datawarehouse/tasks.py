@@ -1,12 +1,22 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
 from typing import Callable
 
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from signals.apps.reporting.app_settings import DELTA_EXPORT_OVERLAP
 from signals.apps.reporting.csv.datawarehouse.categories import (
     create_category_assignments_csv,
     create_category_sla_csv
 )
+from signals.apps.reporting.csv.datawarehouse.deleted_signals import create_deleted_signals_csv
 from signals.apps.reporting.csv.datawarehouse.directing_departments import (
     create_directing_departments_csv
 )
@@ -22,10 +32,91 @@ from signals.apps.reporting.csv.datawarehouse.signals import (
 )
 from signals.apps.reporting.csv.datawarehouse.statusses import create_statuses_csv
 from signals.apps.reporting.csv.utils import rotate_zip_files, save_csv_files, zip_csv_files
+from signals.apps.reporting.models import DatawarehouseExportWatermark
 from signals.apps.reporting.services.clean_up_datawarehouse import DataWarehouseDiskCleaner
 from signals.apps.reporting.utils import _get_storage_backend
 from signals.celery import app
 
+DATAWAREHOUSE_CSV_FUNCS: list[Callable[[str], str]] = [
+    create_signals_csv,
+    create_ml_csv,
+    create_signals_assigned_user_csv,
+    create_locations_csv,
+    create_reporters_csv,
+    create_category_assignments_csv,
+    create_statuses_csv,
+    create_category_sla_csv,
+    create_directing_departments_csv,
+    create_signals_routing_departments_csv,
+    create_signals_notes_csv,
+    create_kto_feedback_csv,
+    create_deleted_signals_csv,
+]
+
+# Exported in full by the delta exports as well (the rows cannot be upserted by id)
+DATAWAREHOUSE_FULL_CSV_FUNCS: list[Callable[[str], str]] = [
+    create_ml_csv,
+]
+
+
+def _create_csv_file(func: Callable[[str], str], location: str) -> str | None:
+    try:
+        return func(location)
+    except EnvironmentError:
+        return None
+
+
+def _create_csv_file_in_thread(func: Callable[[str], str], location: str) -> str | None:
+    try:
+        return _create_csv_file(func, location)
+    finally:
+        # Every thread has its own database connection, which is not closed by the request/task cycle
+        connections.close_all()
+
+
+def _create_csv_files(funcs: list[Callable[[str], str]], location: str, workers: int | None = None) -> list[str | None]:
+    workers = settings.DWH_EXPORT_WORKERS if workers is None else workers
+    if workers <= 1:
+        return [_create_csv_file(func, location) for func in funcs]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='datawarehouse') as executor:
+        return list(executor.map(_create_csv_file_in_thread, funcs, [location] * len(funcs)))
+
+
+def create_csv_files(funcs: list[Callable[[str], str]], location: str, workers: int | None = None) -> list[str]:
+    """
+    Create the CSV files in the given location, in parallel over DWH_EXPORT_WORKERS database connections
+
+    :returns: list of csv files (in the order of the given functions)
+    """
+    return [csv_file for csv_file in _create_csv_files(funcs, location, workers) if csv_file]
+
+
+def create_delta_csv_files(funcs: list[Callable[..., str]], location: str, watermarks: dict[str, datetime],
+                           file_format: str = 'csv') -> dict[str, str]:
+    """
+    Create the CSV files with the rows created or updated since the watermark of each function (an export without a
+    watermark contains all rows), the files are prefixed with "delta_"
+
+    The watermarks overlap with DELTA_EXPORT_OVERLAP, to include the rows of transactions that were still running during
+    the previous export. Rows can therefore be exported twice, the DWH should upsert them by id.
+
+    :returns: the csv files by the name of the function that created them
+    """
+    delta_funcs = [
+        partial(func, since=watermarks[func.__name__] - DELTA_EXPORT_OVERLAP if func.__name__ in watermarks else None,
+                file_format=file_format)
+        for func in funcs
+    ]
+
+    csv_files = {}
+    for func, csv_file in zip(funcs, _create_csv_files(delta_funcs, location)):
+        if csv_file:
+            delta_csv_file = os.path.join(os.path.dirname(csv_file), f'delta_{os.path.basename(csv_file)}')
+            os.rename(csv_file, delta_csv_file)
+            csv_files[func.__name__] = delta_csv_file
+    return csv_files
+
 
 @app.task
 def save_csv_file_datawarehouse(func: Callable[[str], str], using: str = 'datawarehouse') -> list[str]:
@@ -34,42 +125,46 @@ def save_csv_file_datawarehouse(func: Callable[[str], str], using: str = 'datawa
 
     :returns: list of csv files
     """
-    csv_files = list()
     with tempfile.TemporaryDirectory() as tmp_dir:
-        try:
-            csv_files.append(func(tmp_dir))
-        except EnvironmentError:
-            pass
+        csv_files = create_csv_files([func], tmp_dir, workers=1)
 
         # Store the CSV files to the correct location
         return save_csv_files(csv_files=csv_files, using=using)
 
 
 @app.task
-def save_csv_files_datawarehouse(using: str = 'datawarehouse') -> list[str]:
+def save_csv_files_datawarehouse(using: str = 'datawarehouse', delta: bool = False) -> list[str]:
     """
     Create CSV files for Datawarehouse and save them on the storage backend.
 
+    In delta mode only the rows created or updated since the previous (successful) delta export are exported, and the
+    Signals deleted since then (except for DATAWAREHOUSE_FULL_CSV_FUNCS, these are always exported in full). The full
+    exports do not move the watermarks of the delta exports.
+
+    The files are written in the format configured for the storage backend (see EXPORT_FILE_FORMATS).
+
     :returns: list of csv files
     """
-    csv_files = list()
-    csv_files.extend(save_csv_file_datawarehouse(create_signals_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_ml_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_signals_assigned_user_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_locations_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_reporters_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_category_assignments_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_statuses_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_category_sla_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_directing_departments_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_signals_routing_departments_csv, using=using))
-    csv_files.extend(save_csv_file_datawarehouse(create_signals_notes_csv, using=using))
+    started_at = timezone.now()
+    file_format = settings.EXPORT_FILE_FORMATS.get(using, 'csv')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if not delta:
+            funcs = [partial(func, file_format=file_format) for func in DATAWAREHOUSE_CSV_FUNCS]
+            csv_files = create_csv_files(funcs, tmp_dir)
 
-    try:
-        csv_files.extend(save_csv_file_datawarehouse(create_kto_feedback_csv, using=using))
-    except EnvironmentError:
-        pass
-    return csv_files
+            # Store the CSV files to the correct location
+            return save_csv_files(csv_files=csv_files, using=using)
+
+        delta_funcs = [func for func in DATAWAREHOUSE_CSV_FUNCS if func not in DATAWAREHOUSE_FULL_CSV_FUNCS]
+        delta_csv_files = create_delta_csv_files(delta_funcs, tmp_dir, DatawarehouseExportWatermark.get_watermarks(),
+                                                 file_format)
+        full_csv_files = create_csv_files([partial(func, file_format=file_format)
+                                           for func in DATAWAREHOUSE_FULL_CSV_FUNCS], tmp_dir)
+        stored_csv_files = save_csv_files(csv_files=[*delta_csv_files.values(), *full_csv_files], using=using)
+
+        # Only move the watermarks when the files are stored
+        DatawarehouseExportWatermark.set_watermarks(list(delta_csv_files.keys()), started_at)
+        return stored_csv_files
 
 
 @app.task
@@ -83,13 +178,13 @@ def zip_csv_files_endpoint(files: list[str]) -> None:
 
 
 @app.task
-def save_and_zip_csv_files_endpoint(max_csv_amount: int = 30) -> None:
+def save_and_zip_csv_files_endpoint(max_csv_amount: int = 30, delta: bool = False) -> None:
     """
     Create zip file of generated csv files
 
     :returns:
     """
-    created_files = save_csv_files_datawarehouse(using='datawarehouse')
+    created_files = save_csv_files_datawarehouse(using='datawarehouse', delta=delta)
     zip_csv_files(files_to_zip=created_files, using='datawarehouse')
     rotate_zip_files(using='datawarehouse', max_csv_amount=max_csv_amount)
 
@@ -1,9 +1,7 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Gemeente Amsterdam
-import csv
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 import logging
 import os
-import shutil
 import zipfile
 from glob import glob
 from typing import TextIO
@@ -13,6 +11,7 @@ from django.db.models import Case, CharField, QuerySet, Value, When
 from django.utils import timezone
 from storages.backends.azure_storage import AzureStorage
 
+from signals.apps.reporting.parquet import queryset_to_parquet_file
 from signals.apps.reporting.utils import _get_storage_backend
 
 logger = logging.getLogger(__name__)
@@ -85,7 +84,23 @@ def save_csv_files(csv_files: list, using: str, path: str | None = None) -> list
     return stored_csv
 
 
-def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str) -> TextIO:
+def queryset_to_csv_sql(queryset: QuerySet, fields: list[str] | None = None) -> tuple[str, tuple]:
+    """
+    Returns the COPY statement (and its parameters) that exports the given queryset as CSV
+
+    Annotations prefixed with an underscore (used when the name clashes with a model field) are exported without the
+    underscore. When the fields are given the columns are exported in that order, so the file does not have to be
+    rewritten afterwards.
+    """
+    sql, params = queryset.query.sql_with_params()
+    sql = sql.replace('AS "_', 'AS "')
+    if fields:
+        columns = ', '.join(f'"export"."{field}"' for field in fields)
+        sql = f'SELECT {columns} FROM ({sql}) AS "export"'
+    return f"COPY ({sql}) TO STDOUT WITH (FORMAT CSV, HEADER, DELIMITER E',')", params
+
+
+def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str, fields: list[str] | None = None) -> TextIO:
     """
     Creates the CSV file based on the given queryset and stores it in the given csv file path
 
@@ -94,11 +109,10 @@ def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str) -> TextIO:
 
     :param queryset:
     :param csv_file_path:
+    :param fields: The columns of the CSV file, in order
     :return TextIO:
     """
-    sql, params = queryset.query.sql_with_params()
-    sql = f"COPY ({sql}) TO STDOUT WITH (FORMAT CSV, HEADER, DELIMITER E',')"
-    sql = sql.replace('AS "_', 'AS "')
+    sql, params = queryset_to_csv_sql(queryset, fields)
 
     with open(csv_file_path, 'w') as file:
         with connection.cursor() as cursor:
@@ -107,6 +121,25 @@ def queryset_to_csv_file(queryset: QuerySet, csv_file_path: str) -> TextIO:
     return file
 
 
+def export_queryset(queryset: QuerySet, location: str, name: str, fields: list[str], file_format: str = 'csv') -> str:
+    """
+    Exports the queryset as a CSV or Parquet file (named after the format) in the given location
+
+    :param queryset:
+    :param location: Directory for saving the file
+    :param name: The name of the file, without extension
+    :param fields: The columns of the file, in order
+    :param file_format: "csv" or "parquet"
+    :returns: Path to the file
+    """
+    file_path = os.path.join(location, f'{name}.{file_format}')
+    if file_format == 'parquet':
+        return queryset_to_parquet_file(queryset, file_path, fields)
+    if file_format == 'csv':
+        return queryset_to_csv_file(queryset, file_path, fields).name
+    raise ValueError(f'Unknown export file format: {file_format}')
+
+
 def map_choices(field_name: str, choices: list) -> Case:
     """
     Creates a mapping for Postgres with case and when statements
@@ -120,18 +153,3 @@ def map_choices(field_name: str, choices: list) -> Case:
           for value, representation in choices],
         output_field=CharField()
     )
-
-
-def reorder_csv(file_path, ordered_field_names, remove_leading_trailing_quotes=False):
-    reordered_file_path = f'{file_path[:-4]}_reordered.csv'
-    with open(file_path, 'r') as infile, open(reordered_file_path, 'a') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=ordered_field_names)
-        writer.writeheader()
-        for row in csv.DictReader(infile):
-            if remove_leading_trailing_quotes:
-                for k, v in row.items():
-                    row[k] = v.strip('"')
-            writer.writerow(row)
-
-    shutil.move(file_path, f'{file_path[:-4]}_original.csv')
-    shutil.move(reordered_file_path, file_path)
@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from signals.apps.reporting.models.datawarehouse import DatawarehouseExportWatermark
 from signals.apps.reporting.models.export import HorecaCSVExport
 from signals.apps.reporting.models.tdo import TDOSignal
 
 __all__ = [
+    'DatawarehouseExportWatermark',
     'HorecaCSVExport',
     'TDOSignal',
 ]
@@ -0,0 +1,31 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from datetime import datetime
+
+from django.contrib.gis.db import models
+
+
+class DatawarehouseExportWatermark(models.Model):
+    """
+    The moment of the last successful delta export of a datawarehouse CSV file, the next delta export of that file
+    contains the rows created or updated since then
+    """
+    class Meta:
+        ordering = ('name', )
+
+    # The name of the export (the function creating the CSV file)
+    name = models.CharField(max_length=255, unique=True)
+    exported_at = models.DateTimeField()
+
+    @classmethod
+    def get_watermarks(cls) -> dict[str, datetime]:
+        return dict(cls.objects.values_list('name', 'exported_at'))
+
+    @classmethod
+    def set_watermarks(cls, names: list[str], exported_at: datetime) -> None:
+        cls.objects.bulk_create(
+            [cls(name=name, exported_at=exported_at) for name in names],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=['exported_at'],
+        )
@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Write querysets as (typed and compressed) Parquet files
+
+The rows are read with a server-side cursor and written per row group, so a table never has to fit in memory.
+"""
+import json
+from typing import Any, Iterable
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Field, QuerySet
+
+PARQUET_ROW_GROUP_SIZE = 100_000
+PARQUET_COMPRESSION = 'zstd'
+
+ARROW_TYPES: dict[str, pa.DataType] = {
+    'AutoField': pa.int64(),
+    'BigAutoField': pa.int64(),
+    'BigIntegerField': pa.int64(),
+    'IntegerField': pa.int64(),
+    'PositiveBigIntegerField': pa.int64(),
+    'PositiveIntegerField': pa.int64(),
+    'PositiveSmallIntegerField': pa.int64(),
+    'SmallAutoField': pa.int64(),
+    'SmallIntegerField': pa.int64(),
+    'FloatField': pa.float64(),
+    'BooleanField': pa.bool_(),
+    'DateField': pa.date32(),
+    'DateTimeField': pa.timestamp('us', tz='UTC'),
+    'DurationField': pa.duration('us'),
+}
+
+
+def arrow_type(field: Field | None) -> pa.DataType:
+    """
+    The Arrow type of a model field or output field, everything that is not a number, boolean, date or time is written
+    as a string (JSON as JSON text, decimals and UUIDs in their text representation)
+    """
+    while field is not None and field.is_relation:
+        field = field.target_field
+    if field is None:
+        return pa.string()
+    return ARROW_TYPES.get(field.get_internal_type(), pa.string())
+
+
+def _to_string(value: Any) -> str | None:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def queryset_schema(queryset: QuerySet, fields: list[str]) -> tuple[pa.Schema, list[str]]:
+    """
+    Returns the Parquet schema of the given values queryset and the keys of the fields in the rows
+
+    Like the CSV exports, annotations prefixed with an underscore (used when the name clashes with a model field) are
+    written without the underscore.
+    """
+    query = queryset.query
+    selected = list(query.values_select) + list(query.annotation_select)
+
+    keys, arrow_fields = [], []
+    for name in fields:
+        key = name if name in selected else f'_{name}'
+        if key in query.annotation_select:
+            output_field = query.annotation_select[key].output_field
+        else:
+            try:
+                output_field = queryset.model._meta.get_field(key)
+            except FieldDoesNotExist:
+                output_field = None
+
+        keys.append(key)
+        arrow_fields.append(pa.field(name, arrow_type(output_field)))
+    return pa.schema(arrow_fields), keys
+
+
+def _record_batch(rows: list[dict[str, Any]], schema: pa.Schema, keys: list[str]) -> pa.RecordBatch:
+    columns = []
+    for key, field in zip(keys, schema):
+        values = [row[key] for row in rows]
+        if pa.types.is_string(field.type):
+            values = [_to_string(value) for value in values]
+        columns.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _batched(rows: Iterable[dict[str, Any]], size: int) -> Iterable[list[dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def queryset_to_parquet_file(queryset: QuerySet, parquet_file_path: str, fields: list[str],
+                             row_group_size: int = PARQUET_ROW_GROUP_SIZE) -> str:
+    """
+    Creates the Parquet file based on the given values queryset and stores it in the given file path
+
+    :param queryset: A values queryset
+    :param parquet_file_path:
+    :param fields: The columns of the Parquet file, in order
+    :param row_group_size: The number of rows per row group (and read from the database at once)
+    :return str:
+    """
+    schema, keys = queryset_schema(queryset, fields)
+    with pq.ParquetWriter(parquet_file_path, schema, compression=PARQUET_COMPRESSION) as writer:
+        for rows in _batched(queryset.iterator(chunk_size=row_group_size), row_group_size):
+            writer.write_batch(_record_batch(rows, schema, keys), row_group_size=row_group_size)
+    return parquet_file_path
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 """
 Periodic tasks for reporting
 """
@@ -12,11 +12,12 @@ logger = logging.getLogger(__name__)
 
 
 @app.task
-def task_save_csv_files_datawarehouse():
+def task_save_csv_files_datawarehouse(delta=False):
     """Celery task to save CSV files for Datawarehouse.
 
-    This task is scheduled in Celery beat to run periodically.
+    This task is scheduled in Celery beat to run periodically, with delta=True only the changes since the previous
+    delta export are saved.
 
     :returns:
     """
-    save_csv_files_datawarehouse()
+    save_csv_files_datawarehouse(delta=delta)
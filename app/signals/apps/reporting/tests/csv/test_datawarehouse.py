@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2023 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
 import csv
 import json
 import os
@@ -11,13 +11,17 @@ from os import path
 from unittest import mock
 
 import dateutil
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytz
 from django.core.files.storage import FileSystemStorage
-from django.test import override_settings, testcases
+from django.test import TransactionTestCase, override_settings, testcases
 from freezegun import freeze_time
 
 from signals.apps.feedback.factories import FeedbackFactory
 from signals.apps.reporting.csv import datawarehouse
+from signals.apps.reporting.csv.datawarehouse.tasks import DATAWAREHOUSE_CSV_FUNCS, create_csv_files
+from signals.apps.reporting.models import DatawarehouseExportWatermark
 from signals.apps.reporting.utils import _get_storage_backend
 from signals.apps.signals.factories import (
     CategoryFactory,
@@ -26,10 +30,11 @@ from signals.apps.signals.factories import (
     ServiceLevelObjectiveFactory,
     SignalFactory
 )
-from signals.apps.signals.models import SignalDepartments
+from signals.apps.signals.models import DeletedSignal, SignalDepartments
 from signals.apps.signals.workflow import AFGEHANDELD, GEANNULEERD, GEMELD
 
 
+@override_settings(DWH_EXPORT_WORKERS=1)
 class TestDatawarehouse(testcases.TestCase):
 
     def setUp(self):
@@ -212,6 +217,27 @@ class TestDatawarehouse(testcases.TestCase):
                 # noqa Disabled because the Postgres format is slightly different than the Python format, so we decided to comment these checks for now
                 # self.assertEqual(row['type_created_at'], str(signal.type_assignment.created_at))
 
+    def test_create_signals_parquet(self):
+        signal = SignalFactory.create()
+
+        parquet_file = datawarehouse.create_signals_csv(self.csv_tmp_dir, file_format='parquet')
+
+        self.assertEqual(path.join(self.csv_tmp_dir, 'signals.parquet'), parquet_file)
+
+        table = pq.read_table(parquet_file)
+        self.assertEqual(table.schema.names[:3], ['id', 'signal_uuid', 'source'])
+        self.assertEqual(table.schema.field('id').type, pa.int64())
+        self.assertEqual(table.schema.field('created_at').type, pa.timestamp('us', tz='UTC'))
+        self.assertEqual(table.schema.field('priority').type, pa.string())
+
+        rows = table.to_pylist()
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['id'], signal.id)
+        self.assertEqual(rows[0]['signal_uuid'], str(signal.uuid))
+        self.assertEqual(rows[0]['created_at'], signal.created_at)
+        self.assertEqual(rows[0]['status_id'], signal.status_id)
+        self.assertDictEqual(json.loads(rows[0]['extra_properties']), signal.extra_properties)
+
     def test_create_ml_csv(self):
         category = CategoryFactory.create(name='Sub', parent__name='Main')
         signal = SignalFactory.create(text='ML text', category_assignment__category=category, status__state=AFGEHANDELD)
@@ -269,6 +295,11 @@ class TestDatawarehouse(testcases.TestCase):
 
         with open(csv_file) as opened_csv_file:
             reader = csv.DictReader(opened_csv_file)
+            self.assertEqual(reader.fieldnames, [
+                'id', 'lat', 'lng', 'stadsdeel', 'buurt_code', 'address', 'address_text', 'created_at', 'updated_at',
+                'extra_properties', '_signal_id', 'address_street', 'address_number', 'address_postalcode',
+                'address_city', 'area_code', 'area_name',
+            ])
             for row in reader:
                 self.assertEqual(row['id'], str(location.id))
                 self.assertEqual(row['_signal_id'], str(location._signal_id))
@@ -417,6 +448,7 @@ class TestDatawarehouse(testcases.TestCase):
                 self.assertEqual(row['text'], str(notes.text))
 
 
+@override_settings(DWH_EXPORT_WORKERS=1)
 class TestFeedbackHandling(testcases.TestCase):
     """Test that KTO feedback is properly processed."""
 
@@ -481,3 +513,107 @@ class TestFeedbackHandling(testcases.TestCase):
                 self.assertEqual(row['text'], self.feedback_submitted.text)
 
             self.assertEqual(i, 0)
+
+
+class TestCreateCSVFiles(TransactionTestCase):
+    def setUp(self):
+        self.sequential_tmp_dir = tempfile.mkdtemp()
+        self.parallel_tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.sequential_tmp_dir)
+        shutil.rmtree(self.parallel_tmp_dir)
+
+    @mock.patch.dict('os.environ', {}, clear=True)
+    def test_parallel_export(self):
+        SignalFactory.create_batch(3)
+        NoteFactory.create_batch(2)
+
+        sequential_files = create_csv_files(DATAWAREHOUSE_CSV_FUNCS, self.sequential_tmp_dir, workers=1)
+        parallel_files = create_csv_files(DATAWAREHOUSE_CSV_FUNCS, self.parallel_tmp_dir, workers=4)
+
+        # The KTO feedback is not exported without the ENVIRONMENT env variable
+        self.assertEqual(len(parallel_files), len(DATAWAREHOUSE_CSV_FUNCS) - 1)
+        self.assertEqual([path.basename(file) for file in sequential_files],
+                         [path.basename(file) for file in parallel_files])
+
+        for sequential_file, parallel_file in zip(sequential_files, parallel_files):
+            with open(sequential_file) as sequential, open(parallel_file) as parallel:
+                self.assertEqual(sequential.read(), parallel.read())
+
+
+@override_settings(DWH_EXPORT_WORKERS=1)
+class TestDeltaDatawarehouse(testcases.TestCase):
+    def setUp(self):
+        self.file_backend_tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.file_backend_tmp_dir)
+
+    def _read_csv(self, day, file_name):
+        with open(path.join(self.file_backend_tmp_dir, f'2020/09/{day}', f'120000UTC_{file_name}')) as opened_csv_file:
+            return list(csv.DictReader(opened_csv_file))
+
+    @mock.patch.dict('os.environ', {}, clear=True)
+    @mock.patch('signals.apps.reporting.csv.utils._get_storage_backend')
+    def test_save_delta_csv_files_datawarehouse(self, mocked_get_storage_backend):
+        mocked_get_storage_backend.return_value = FileSystemStorage(location=self.file_backend_tmp_dir)
+
+        with freeze_time('2020-09-10T11:00:00+00:00'):
+            old_signal = SignalFactory.create()
+            deleted_signal = SignalFactory.create()
+            SignalFactory.create(text='ML text', status__state=AFGEHANDELD,
+                                 category_assignment__category=CategoryFactory.create(name='Sub', parent__name='Main'))
+
+        with freeze_time('2020-09-10T12:00:00+00:00'):
+            # Without watermarks all rows are exported
+            csv_files = datawarehouse.save_csv_files_datawarehouse(delta=True)
+            self.assertIn('120000UTC_delta_signals.csv', csv_files)
+            self.assertEqual(len(self._read_csv(10, 'delta_signals.csv')), 2)
+
+        watermark = DatawarehouseExportWatermark.objects.get(name='create_signals_csv')
+        self.assertEqual(watermark.exported_at.isoformat(), '2020-09-10T12:00:00+00:00')
+
+        with freeze_time('2020-09-11T12:00:00+00:00'):
+            new_signal = SignalFactory.create()
+            DeletedSignal.objects.create_from_signal(deleted_signal, action='manual', note='Test')
+            deleted_signal.delete()
+
+            datawarehouse.save_csv_files_datawarehouse(delta=True)
+
+        signal_rows = self._read_csv(11, 'delta_signals.csv')
+        self.assertEqual([row['id'] for row in signal_rows], [str(new_signal.id)])
+        self.assertNotIn(str(old_signal.id), [row['_signal_id'] for row in self._read_csv(11, 'delta_statuses.csv')])
+
+        deleted_rows = self._read_csv(11, 'delta_deleted_signals.csv')
+        self.assertEqual([row['signal_id'] for row in deleted_rows], [str(deleted_signal.id)])
+
+        # The ML file is always exported in full
+        self.assertFalse(path.exists(path.join(self.file_backend_tmp_dir, '2020/09/11', '120000UTC_delta_ml.csv')))
+        self.assertEqual([row['Text'] for row in self._read_csv(11, 'ml.csv')], ['ML text'])
+
+    @mock.patch.dict('os.environ', {}, clear=True)
+    @mock.patch('signals.apps.reporting.csv.utils._get_storage_backend')
+    @freeze_time('2020-09-10T12:00:00+00:00')
+    @override_settings(EXPORT_FILE_FORMATS={'datawarehouse': 'parquet'})
+    def test_save_parquet_files_datawarehouse(self, mocked_get_storage_backend):
+        mocked_get_storage_backend.return_value = FileSystemStorage(location=self.file_backend_tmp_dir)
+        SignalFactory.create_batch(3)
+
+        files = datawarehouse.save_csv_files_datawarehouse()
+
+        self.assertIn('120000UTC_signals.parquet', files)
+        self.assertIn('120000UTC_locations.parquet', files)
+        table = pq.read_table(path.join(self.file_backend_tmp_dir, '2020/09/10', '120000UTC_locations.parquet'))
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.schema.field('lat').type, pa.float64())
+
+    @mock.patch.dict('os.environ', {}, clear=True)
+    @mock.patch('signals.apps.reporting.csv.utils._get_storage_backend')
+    @freeze_time('2020-09-10T12:00:00+00:00')
+    def test_full_export_does_not_move_watermarks(self, mocked_get_storage_backend):
+        mocked_get_storage_backend.return_value = FileSystemStorage(location=self.file_backend_tmp_dir)
+
+        datawarehouse.save_csv_files_datawarehouse()
+
+        self.assertFalse(DatawarehouseExportWatermark.objects.exists())
@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import logging
 
 from django.db.models import Case, When
-from elasticsearch.helpers import bulk
+from django.utils import timezone
+from elasticsearch.helpers import bulk, parallel_bulk
 from elasticsearch_dsl import Document, Index, Search
 
+from signals.apps.search.settings import app_settings
+
 log = logging.getLogger(__name__)
 
 
@@ -47,33 +50,144 @@ class DocumentBase(Document):
         )
 
     @classmethod
-    def clear_index(cls, index=None):
-        index_instance = Index(cls._default_index(index))
-        if index_instance.exists():
-            index_instance.delete()
+    def clear_index(cls, index=None, using=None):
+        es = cls._get_connection(using)
+        name = cls._default_index(index)
+        if es.indices.exists_alias(name=name):
+            # An alias cannot be deleted as an index, delete the index(es) it points to
+            es.indices.delete(index=','.join(es.indices.get_alias(name=name)))
+        else:
+            index_instance = Index(name)
+            if index_instance.exists():
+                index_instance.delete()
+
+    def get_index_queryset(self):
+        """
+        The queryset used to (re)index the documents, only the relations needed by create_document should be fetched
+        """
+        return self.get_queryset()
+
+    @classmethod
+    def get_batch_context(cls, batch):
+        """
+        Keyword arguments for create_document that are fetched once for a batch of objects (instead of per object)
+        """
+        return {}
 
     @classmethod
-    def prepare_batch(cls, queryset):
-        for obj in queryset.iterator():
-            yield cls().create_document(obj).create_document_dict()
+    def iter_batches(cls, queryset, size):
+        """
+        Iterate over the queryset in batches ordered by the primary key
+
+        Every batch continues after the last primary key of the previous batch (keyset pagination), so unlike OFFSET
+        the database does not have to skip the rows that were already indexed and the batches do not get slower.
+        """
+        queryset = queryset.order_by('pk')
+        last_pk = None
+        while True:
+            batch = list(queryset.filter(pk__gt=last_pk)[:size] if last_pk is not None else queryset[:size])
+            if not batch:
+                return
+            yield batch
+            last_pk = batch[-1].pk
 
     @classmethod
-    def bulk(cls, queryset, size, using=None):
+    def prepare_batch(cls, batch, index=None):
+        context = cls.get_batch_context(batch)
+        for obj in batch:
+            action = cls().create_document(obj, **context).create_document_dict()
+            if index:
+                action['_index'] = index
+            yield action
+
+    @classmethod
+    def bulk(cls, queryset, size, using=None, index=None):
+        """
+        Index the queryset, the documents of a batch are sent to Elasticsearch by INDEX_THREAD_COUNT threads
+
+        The documents are created (and the database is queried) in the calling thread.
+        """
         es = cls._get_connection(using)
-        for start in range(0, queryset.count(), size):
-            end = start + size
-            bulk(
+        for batch in cls.iter_batches(queryset, size):
+            for ok, info in parallel_bulk(
                 client=es,
-                actions=cls.prepare_batch(queryset[start:end]),
-                chunk_size=size,
-            )
+                actions=list(cls.prepare_batch(batch, index=index)),
+                thread_count=app_settings.INDEX_THREAD_COUNT,
+                chunk_size=app_settings.INDEX_CHUNK_SIZE,
+                raise_on_error=False,
+            ):
+                if not ok:
+                    log.error(f'Failed to index document: {info}')
+
+    @classmethod
+    def index_batch(cls, batch, using=None):
+        """
+        Index a (small) batch of objects in one bulk request
+        """
+        success, errors = bulk(
+            client=cls._get_connection(using),
+            actions=cls.prepare_batch(batch),
+            chunk_size=max(len(batch), 1),
+            raise_on_error=False,
+        )
+        for error in errors:
+            log.error(f'Failed to index document: {error}')
+        return success
 
     @classmethod
-    def index_documents(cls, index=None, using=None, batch=1000, queryset=None):
-        qs = queryset.all() if queryset else cls().get_queryset()
+    def index_documents(cls, index=None, using=None, batch=None, queryset=None):
+        qs = cls().get_index_queryset()
+        if queryset is not None:
+            qs = qs.filter(pk__in=queryset.values('pk'))
 
         cls.init(index, using)
-        cls.bulk(qs, batch, using)
+        cls.bulk(qs, batch or app_settings.INDEX_BATCH_SIZE, using, index=index)
+
+    @classmethod
+    def reindex(cls, using=None, batch=None):
+        """
+        Rebuild the index without downtime
+
+        All documents are indexed in a new index, when done the alias (the name of the index) is moved to the new index
+        in one atomic action and the previous index is deleted. Searches keep using the previous index in the meantime.
+        Documents updated while reindexing are indexed again after the swap.
+        """
+        es = cls._get_connection(using)
+        alias = cls._default_index()
+        new_index = f'{alias}-{timezone.now():%Y%m%d%H%M%S%f}'
+        started_at = timezone.now()
+        log.info(f'Reindexing {alias} in {new_index}')
+
+        cls.init(new_index, using)
+        es.indices.put_settings(index=new_index, body={'index': {'refresh_interval': '-1'}})
+        cls.bulk(cls().get_index_queryset(), batch or app_settings.INDEX_BATCH_SIZE, using, index=new_index)
+        es.indices.put_settings(index=new_index, body={'index': {'refresh_interval': None}})
+        es.indices.refresh(index=new_index)
+
+        cls.swap_alias(alias, new_index, using)
+        cls.index_documents(using=using, batch=batch,
+                            queryset=cls().get_model().objects.filter(updated_at__gte=started_at))
+        return new_index
+
+    @classmethod
+    def swap_alias(cls, alias, new_index, using=None):
+        """
+        Point the alias to the new index and delete the index(es) it pointed to before
+        """
+        es = cls._get_connection(using)
+        old_indices = []
+        actions = []
+        if es.indices.exists_alias(name=alias):
+            old_indices = [index for index in es.indices.get_alias(name=alias) if index != new_index]
+            actions.extend({'remove': {'index': index, 'alias': alias}} for index in old_indices)
+        elif es.indices.exists(index=alias):
+            # An index created before aliases were used, it is replaced by the alias in the same action
+            actions.append({'remove_index': {'index': alias}})
+        actions.append({'add': {'index': new_index, 'alias': alias}})
+
+        es.indices.update_aliases(body={'actions': actions})
+        for index in old_indices:
+            es.indices.delete(index=index, ignore_unavailable=True)
 
     @classmethod
     def ping(cls, using=None):
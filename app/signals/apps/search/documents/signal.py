@@ -1,13 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import logging
+from collections import defaultdict
 
 from elasticsearch_dsl import Date, InnerDoc, Keyword, Nested, Object, Text
 from elasticsearch_dsl.query import Bool
 
 from signals.apps.search.documents.base import DocumentBase
 from signals.apps.search.settings import app_settings
-from signals.apps.signals.models import Signal
+from signals.apps.signals.models import CategoryDepartment, Signal
 
 log = logging.getLogger(__name__)
 
@@ -87,12 +88,45 @@ class SignalDocument(DocumentBase):
             '-updated_at'
         ).all()
 
+    def get_index_queryset(self):
+        return self.get_model().objects.select_related(
+            'category_assignment',
+            'category_assignment__category',
+            'category_assignment__category__parent',
+            'reporter',
+            'priority',
+            'type_assignment',
+        )
+
     @classmethod
-    def create_document(cls, obj):
+    def get_batch_context(cls, batch):
+        """
+        The departments of the categories of the signals in the batch, fetched in one query
+        """
+        category_ids = {obj.category_assignment.category_id for obj in batch if obj.category_assignment}
+        departments = defaultdict(list)
+        category_departments = CategoryDepartment.objects.filter(
+            category_id__in=category_ids
+        ).select_related('department').order_by('department__name')
+        for category_department in category_departments:
+            departments[category_department.category_id].append(category_department.department)
+        return {'departments': departments}
+
+    @classmethod
+    def create_document(cls, obj, departments=None):
+        """
+        :param departments: The departments per category id, when not given the departments of the category are used
+        """
         category_assignment = None
         if obj.category_assignment:
             category_assignment = obj.category_assignment
 
+        category_departments = []
+        if category_assignment and departments is not None:
+            category_departments = departments.get(category_assignment.category_id, [])
+        elif category_assignment:
+            category_departments = category_assignment.category.departments.all()
+
         return SignalDocument(
             meta=dict(
                 id=obj.id,
@@ -110,7 +144,7 @@ class SignalDocument(DocumentBase):
                         'code': department.code,
                         'name': department.name,
                         'is_intern': department.is_intern,
-                    } for department in category_assignment.category.departments.iterator()],
+                    } for department in category_departments],
                     'parent': {
                         'name': category_assignment.category.parent.name,
                         'slug': category_assignment.category.parent.slug,
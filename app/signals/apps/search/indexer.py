@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Coalesce the Elasticsearch updates of Signals and stop calling the cluster while it is unavailable
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
+
+from django.core.cache import cache
+from django.db import transaction
+from elasticsearch.exceptions import ConnectionError as ElasticsearchConnectionError
+
+from signals.apps.search.settings import app_settings
+
+log = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing service
+
+    After failure_threshold consecutive failures the circuit opens and calls are refused for reset_timeout seconds.
+    After that one call is let through (half-open), when it succeeds the circuit closes again, when it fails the circuit
+    opens for another reset_timeout seconds. Only the given errors count as failures.
+    """
+    def __init__(self, failure_threshold: Callable[[], int], reset_timeout: Callable[[], float],
+                 errors: tuple[type[Exception], ...] = (ElasticsearchConnectionError, )):
+        # The thresholds are callables, so the (overridable) settings are read when they are needed
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._errors = errors
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._half_open or time.monotonic() - self._opened_at < self._reset_timeout():
+                return False
+            self._half_open = True
+            return True
+
+    def check(self) -> None:
+        if not self.allow():
+            raise CircuitOpenError('Elastic cluster is unavailable, not calling it until the circuit closes')
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Raises CircuitOpenError when the circuit is open, otherwise records the outcome of the guarded block (any other
+        error, like a document that is not found, means the cluster did respond)
+        """
+        self.check()
+        try:
+            yield
+        except self._errors:
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        self.record_success()
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._half_open = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._half_open or self._failures >= self._failure_threshold():
+                self._opened_at = time.monotonic()
+            self._half_open = False
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+class CoalescingIndexer:
+    """
+    Queues the indexing of changed Signals, at most once per Signal per window
+
+    The first change of a Signal queues a task that runs after the window (a countdown), the changes made to the
+    Signal before that task runs are indexed by it. A queued Signal is marked in the (shared) cache, the task removes
+    the marks before it reads the Signals so later changes queue a new task. Nothing is kept in the memory of the
+    process, a queued task survives the process that queued it. The marks expire, so a task that is lost does not stop
+    the Signal from being indexed on its next change. With a window of 0 seconds every change is queued immediately.
+    """
+    cache_key_prefix = 'signals-search-index-pending'
+    mark_timeout = 300  # Seconds a mark is kept after the window, in case the queued task never runs
+
+    def __init__(self, queue: Callable[[list[int], float], None], window: Callable[[], float]):
+        self._queue = queue
+        self._window = window
+
+    def _cache_key(self, signal_id: int) -> str:
+        return f'{self.cache_key_prefix}-{signal_id}'
+
+    def add(self, signal_ids: Iterable[int]) -> None:
+        window = self._window()
+        signal_ids = sorted(set(signal_ids))
+        if window > 0:
+            signal_ids = [signal_id for signal_id in signal_ids
+                          if cache.add(self._cache_key(signal_id), True, timeout=window + self.mark_timeout)]
+
+        if signal_ids:
+            # Queued when the current transaction (if any) is committed, so the task reads the committed Signals
+            transaction.on_commit(lambda: self._queue_task(signal_ids, window))
+
+    def _queue_task(self, signal_ids: list[int], window: float) -> None:
+        try:
+            self._queue(signal_ids, max(window, 0))
+        except Exception:
+            log.exception(f'Failed to queue the Elasticsearch updates of {len(signal_ids)} signal(s)')
+            self.done(signal_ids)
+
+    def done(self, signal_ids: Iterable[int]) -> None:
+        """
+        Removes the marks of the given Signals, must be called before the Signals are read to be indexed
+        """
+        cache.delete_many([self._cache_key(signal_id) for signal_id in signal_ids])
+
+
+def _queue_task(signal_ids: list[int], countdown: float) -> None:
+    # Imported here, because the tasks use the circuit breaker of this module
+    from signals.apps.search.tasks import save_signals_to_elastic
+    save_signals_to_elastic.apply_async(kwargs={'signal_ids': signal_ids}, countdown=countdown)
+
+
+# One circuit breaker per process
+indexer = CoalescingIndexer(queue=_queue_task, window=lambda: app_settings.INDEX_DEBOUNCE_WINDOW)
+circuit_breaker = CircuitBreaker(failure_threshold=lambda: app_settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+                                 reset_timeout=lambda: app_settings.CIRCUIT_BREAKER_RESET_TIMEOUT)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from timeit import default_timer as timer
 
 from django.core.management import BaseCommand
@@ -16,7 +16,7 @@ class Command(BaseCommand):
         parser.add_argument('-c', '--clear-index', action='store_true', dest='_clear_index', help='Clear the index')
         parser.add_argument('-d', '--delete', action='store_true', dest='_clear_index', help='Delete the index, deprecated use --clear-index instead')  # noqa
         parser.add_argument('--dry-run', action='store_true', dest='_dry_run', help='Dry-run mode')
-        parser.add_argument('--index-all', action='store_true', dest='_index_documents', help='Index all Signals')
+        parser.add_argument('--index-all', action='store_true', dest='_index_documents', help='Index all Signals in a new index and swap the alias')  # noqa
         parser.add_argument('--init', action='store_true', dest='_init_index', help='Init the index')
         parser.add_argument('--signal-id', type=str, dest='signal_id', help='A specific signal that need re-indexing')
         parser.add_argument('--signal-ids', type=str, dest='signal_ids', help='A set of signals that need re-indexing')
@@ -73,9 +73,10 @@ class Command(BaseCommand):
             SignalDocument.init()
 
     def _index_documents(self):
-        self.stdout.write('* Index all Signals in bulk')
+        self.stdout.write('* Index all Signals in bulk in a new index')
         if not self._dry_run:
-            SignalDocument.index_documents()
+            index = SignalDocument.reindex()
+            self.stdout.write(f'* Alias {SignalDocument._default_index()} points to {index}')
 
     def _index_signal(self, signal_id):
         self.stdout.write(f'* Index Signal #{signal_id}')
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.conf import settings
 from django.test.signals import setting_changed
 
@@ -10,6 +10,12 @@ DEFAULTS = dict(
         INDEX='signals',
     ),
     TIMEOUT=10,
+    INDEX_BATCH_SIZE=2000,  # The number of objects read from the database at once when indexing
+    INDEX_CHUNK_SIZE=500,  # The number of documents per bulk request
+    INDEX_THREAD_COUNT=4,  # The number of bulk requests sent in parallel
+    INDEX_DEBOUNCE_WINDOW=2.0,  # A changed signal is indexed after this many seconds, together with its later changes
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD=3,  # The cluster is not called after this many consecutive failures...
+    CIRCUIT_BREAKER_RESET_TIMEOUT=30.0,  # ...until this many seconds have passed
 )
 
 
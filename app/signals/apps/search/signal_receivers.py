@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 -2024 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import logging
 
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from signals.apps.search.documents.status_message import StatusMessage as StatusMessageDocument
+from signals.apps.search.indexer import indexer
 from signals.apps.search.tasks import delete_from_elastic, save_to_elastic
 from signals.apps.search.transformers.status_message import transform
 from signals.apps.signals.managers import (
@@ -33,8 +34,8 @@ from signals.apps.signals.models.reporter import Reporter, reporter_anonymized
     dispatch_uid='search_add_to_elastic'
 )
 def add_to_elastic_handler(sender, signal_obj, **kwargs):
-    # Add to elastic
-    save_to_elastic.delay(signal_id=signal_obj.id)
+    # Add to elastic, the changes of a signal within the debounce window are indexed by one task
+    indexer.add([signal_obj.id])
 
 
 @receiver(post_save, sender=StatusMessageModel, dispatch_uid='status_message_post_save_receiver')
@@ -1,11 +1,13 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import logging
 
 from django.utils import timezone
 from elasticsearch import NotFoundError
+from elasticsearch.exceptions import ConnectionError as ElasticsearchConnectionError
 
 from signals.apps.search.documents.signal import SignalDocument
+from signals.apps.search.indexer import CircuitOpenError, circuit_breaker, indexer
 from signals.apps.signals.models import Signal
 from signals.celery import app
 
@@ -14,12 +16,26 @@ log = logging.getLogger(__name__)
 
 @app.task
 def save_to_elastic(signal_id):
-    if not SignalDocument.ping():
-        raise Exception('Elastic cluster is unreachable')
-
     signal = Signal.objects.get(id=signal_id)
     signal_document = SignalDocument.create_document(signal)
-    signal_document.save()
+    with circuit_breaker.guard():
+        signal_document.save()
+
+
+@app.task(autoretry_for=(CircuitOpenError, ElasticsearchConnectionError, ), max_retries=5, retry_backoff=30)
+def save_signals_to_elastic(signal_ids):
+    """
+    Index the given Signals in one bulk request, queued by the coalescing indexer
+    """
+    # Changes made from now on are not covered by this task, they must queue a new one
+    indexer.done(signal_ids)
+
+    batch = list(SignalDocument().get_index_queryset().filter(id__in=signal_ids).order_by('pk'))
+    if not batch:
+        return
+
+    with circuit_breaker.guard():
+        SignalDocument.index_batch(batch)
 
 
 @app.task
@@ -29,22 +45,20 @@ def rebuild_index():
     if not SignalDocument.ping():
         raise Exception('Elastic cluster is unreachable')
 
-    SignalDocument.index_documents()
-    log.info('rebuild_index - done!')
+    index = SignalDocument.reindex()
+    log.info(f'rebuild_index - done, {index} is in use!')
 
 
 @app.task
 def delete_from_elastic(signal):
-    if not SignalDocument.ping():
-        raise Exception('Elastic cluster is unreachable')
-
     if isinstance(signal, int):
         signal = Signal.objects.get(id=signal)
 
     signal_document = SignalDocument.create_document(signal)
 
     try:
-        signal_document.delete()
+        with circuit_breaker.guard():
+            signal_document.delete()
     except NotFoundError:
         log.warning(f'Signal {signal.id} not found in Elasticsearch')
 
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.test import TestCase
+
+from signals.apps.search.documents.signal import SignalDocument
+from signals.apps.signals.factories import CategoryFactory, DepartmentFactory, SignalFactory
+from signals.apps.signals.models import Signal
+
+
+class TestSignalDocument(TestCase):
+    def setUp(self):
+        self.departments = DepartmentFactory.create_batch(2)
+        self.category = CategoryFactory.create(departments=self.departments)
+        self.signals = SignalFactory.create_batch(5, category_assignment__category=self.category)
+
+    def test_iter_batches(self):
+        batches = list(SignalDocument.iter_batches(Signal.objects.order_by('-updated_at'), 2))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual([signal.pk for batch in batches for signal in batch],
+                         sorted(signal.pk for signal in self.signals))
+
+    def test_prepare_batch(self):
+        batch = list(SignalDocument().get_index_queryset().order_by('pk'))
+
+        # One query for the departments of all the categories in the batch
+        with self.assertNumQueries(1):
+            actions = list(SignalDocument.prepare_batch(batch, index='signals-new'))
+
+        self.assertEqual(len(actions), 5)
+        for action in actions:
+            self.assertEqual(action['_index'], 'signals-new')
+            self.assertEqual(sorted(department['code'] for department in
+                                    action['_source']['category_assignment']['category']['departments']),
+                             sorted(department.code for department in self.departments))
+
+        # The same document as when it is created for a single signal
+        self.assertEqual(actions[0]['_source'], SignalDocument.create_document(batch[0]).to_dict())
+
+    @mock.patch('signals.apps.search.documents.base.parallel_bulk', autospec=True)
+    @mock.patch.object(SignalDocument, '_get_connection')
+    def test_bulk(self, get_connection, parallel_bulk):
+        parallel_bulk.return_value = iter([])
+
+        SignalDocument.bulk(SignalDocument().get_index_queryset(), 2, index='signals-new')
+
+        self.assertEqual(parallel_bulk.call_count, 3)
+        indexed = [action['_id'] for call in parallel_bulk.call_args_list for action in call.kwargs['actions']]
+        self.assertEqual(indexed, sorted(signal.pk for signal in self.signals))
+
+
+class TestSwapAlias(TestCase):
+    @mock.patch.object(SignalDocument, '_get_connection')
+    def test_swap_alias(self, get_connection):
+        es = get_connection.return_value
+        es.indices.exists_alias.return_value = True
+        es.indices.get_alias.return_value = {'signals-1': {'aliases': {'signals': {}}}}
+
+        SignalDocument.swap_alias('signals', 'signals-2')
+
+        es.indices.update_aliases.assert_called_once_with(body={'actions': [
+            {'remove': {'index': 'signals-1', 'alias': 'signals'}},
+            {'add': {'index': 'signals-2', 'alias': 'signals'}},
+        ]})
+        es.indices.delete.assert_called_once_with(index='signals-1', ignore_unavailable=True)
+
+    @mock.patch.object(SignalDocument, '_get_connection')
+    def test_swap_alias_replaces_index(self, get_connection):
+        es = get_connection.return_value
+        es.indices.exists_alias.return_value = False
+        es.indices.exists.return_value = True
+
+        SignalDocument.swap_alias('signals', 'signals-2')
+
+        # The index without an alias is removed in the same atomic action
+        es.indices.update_aliases.assert_called_once_with(body={'actions': [
+            {'remove_index': {'index': 'signals'}},
+            {'add': {'index': 'signals-2', 'alias': 'signals'}},
+        ]})
+        es.indices.delete.assert_not_called()
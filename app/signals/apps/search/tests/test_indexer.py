@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from elasticsearch.exceptions import ConnectionError as ElasticsearchConnectionError
+
+from signals.apps.search.indexer import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CoalescingIndexer,
+    circuit_breaker,
+    indexer
+)
+from signals.apps.search.signal_receivers import add_to_elastic_handler
+from signals.apps.search.tasks import save_signals_to_elastic
+from signals.apps.signals.factories import SignalFactory
+
+
+class TestCoalescingIndexer(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_coalesce_within_window(self):
+        queue = mock.Mock()
+        indexer = CoalescingIndexer(queue=queue, window=lambda: 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            indexer.add([3, 1])
+            indexer.add([1, 2])
+        self.assertEqual(queue.call_args_list, [mock.call([1, 3], 2), mock.call([2], 2)])
+
+        # Queued Signals are not queued again until the task is running
+        indexer.add([1, 2, 3])
+        self.assertEqual(queue.call_count, 2)
+
+        indexer.done([1, 3])
+        with self.captureOnCommitCallbacks(execute=True):
+            indexer.add([1, 2, 3])
+        queue.assert_called_with([1, 3], 2)
+
+    def test_queued_on_commit(self):
+        queue = mock.Mock()
+        indexer = CoalescingIndexer(queue=queue, window=lambda: 2)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            indexer.add([1])
+        queue.assert_not_called()
+
+        callbacks[0]()
+        queue.assert_called_once_with([1], 2)
+
+    def test_without_window(self):
+        queue = mock.Mock()
+        indexer = CoalescingIndexer(queue=queue, window=lambda: 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            indexer.add([1])
+            indexer.add([1])
+        self.assertEqual(queue.call_args_list, [mock.call([1], 0), mock.call([1], 0)])
+
+    def test_queue_error(self):
+        queue = mock.Mock(side_effect=Exception('Broker unavailable'))
+        indexer = CoalescingIndexer(queue=queue, window=lambda: 2)
+
+        with self.assertLogs('signals.apps.search.indexer', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                indexer.add([1])
+
+        # The Signal is not marked as queued, so the next change queues it again
+        with self.captureOnCommitCallbacks(execute=True):
+            indexer.add([1])
+        self.assertEqual(queue.call_count, 2)
+
+
+class TestCircuitBreaker(SimpleTestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(failure_threshold=lambda: 2, reset_timeout=lambda: 0.1)
+
+    def _fail(self):
+        with self.assertRaises(ElasticsearchConnectionError):
+            with self.breaker.guard():
+                raise ElasticsearchConnectionError('N/A', 'Connection refused', None)
+
+    def test_open_after_failures(self):
+        self._fail()
+        self.assertTrue(self.breaker.allow())
+
+        self._fail()
+        self.assertFalse(self.breaker.allow())
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.check()
+
+    @mock.patch('signals.apps.search.indexer.time.monotonic')
+    def test_half_open(self, monotonic):
+        monotonic.return_value = 100.0
+        self._fail()
+        self._fail()
+        monotonic.return_value = 100.2
+
+        # One call is let through, when it fails the circuit opens again
+        self._fail()
+        self.assertFalse(self.breaker.allow())
+        monotonic.return_value = 100.4
+
+        # When it succeeds the circuit closes
+        with self.breaker.guard():
+            pass
+        self.assertTrue(self.breaker.allow())
+        self.assertTrue(self.breaker.allow())
+
+    def test_other_errors_do_not_count(self):
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                with self.breaker.guard():
+                    raise ValueError()
+        self.assertTrue(self.breaker.allow())
+
+
+class TestCoalescedIndexing(TestCase):
+    def setUp(self):
+        cache.clear()
+        circuit_breaker.reset()
+        self.signals = SignalFactory.create_batch(2)
+
+    def tearDown(self):
+        circuit_breaker.reset()
+
+    @override_settings(SEARCH={'INDEX_DEBOUNCE_WINDOW': 2})
+    @mock.patch('signals.apps.search.tasks.save_signals_to_elastic.apply_async')
+    def test_add_to_elastic_handler(self, apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            for signal in self.signals + self.signals:
+                add_to_elastic_handler(sender=None, signal_obj=signal)
+
+        self.assertEqual(apply_async.call_args_list, [
+            mock.call(kwargs={'signal_ids': [signal.pk]}, countdown=2) for signal in self.signals
+        ])
+
+    @mock.patch('signals.apps.search.documents.signal.SignalDocument.index_batch')
+    def test_save_signals_to_elastic(self, index_batch):
+        with mock.patch.object(indexer, 'done') as done:
+            save_signals_to_elastic(signal_ids=[signal.pk for signal in self.signals] + [0])
+        done.assert_called_once_with([signal.pk for signal in self.signals] + [0])
+
+        index_batch.assert_called_once()
+        self.assertEqual([signal.pk for signal in index_batch.call_args.args[0]],
+                         sorted(signal.pk for signal in self.signals))
+
+    @mock.patch('signals.apps.search.documents.signal.SignalDocument.index_batch')
+    def test_save_signals_to_elastic_circuit_open(self, index_batch):
+        index_batch.side_effect = ElasticsearchConnectionError('N/A', 'Connection refused', None)
+        signal_ids = [signal.pk for signal in self.signals]
+
+        for _ in range(3):
+            with self.assertRaises(ElasticsearchConnectionError):
+                save_signals_to_elastic.run(signal_ids=signal_ids)
+
+        # The cluster is not called while the circuit is open
+        with self.assertRaises(CircuitOpenError):
+            save_signals_to_elastic.run(signal_ids=signal_ids)
+        self.assertEqual(index_batch.call_count, 3)
@@ -0,0 +1,208 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import logging
+import time
+from dataclasses import asdict, dataclass
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from signals.apps.search.indexer import indexer
+from signals.apps.services.domain.dsl import CompiledRoutingRule, SignalDslService
+from signals.apps.services.domain.stored_signal_filter_counts import StoredSignalFilterCountService
+from signals.apps.signals import workflow
+from signals.apps.signals.models import Department, Signal, SignalDepartments, SignalUser
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+@dataclass
+class BulkRoutingReport:
+    processed: int = 0
+    routed: int = 0
+    unchanged: int = 0
+    no_match: int = 0
+    locked: int = 0
+    seconds: float = 0.0
+
+    @property
+    def signals_per_second(self) -> float:
+        return self.processed / self.seconds if self.seconds else 0.0
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), 'signals_per_second': round(self.signals_per_second, 1)}
+
+    def __str__(self) -> str:
+        return (f'Processed {self.processed} signals in {self.seconds:.1f}s ({self.signals_per_second:.1f}/s): '
+                f'{self.routed} routed, {self.unchanged} unchanged, {self.no_match} without a matching rule, '
+                f'{self.locked} skipped because they were locked')
+
+
+class BulkRoutingService:
+    """
+    Re-routes many Signals at once, for example the open Signals after the routing rules changed
+
+    The Signals are processed in chunks (in order of their primary key), every chunk in its own transaction. The
+    routing rules are compiled once and evaluated in memory. The new routing departments, user assignments and their
+    history are written with bulk inserts per chunk. Signals that are locked by another transaction are skipped
+    instead of waited for, Signals already routed as the matching rule dictates are left untouched.
+
+    Note: unlike the routing of a single Signal no Django signals are sent (their receivers would log the history and
+    send the mails per Signal). What the receivers do is done for the chunk instead: the history is logged in bulk, the
+    routed Signals are re-indexed and the stored filter counts are invalidated once the chunk is committed. Mails to
+    the newly assigned departments and users are only sent when asked for.
+    """
+    closed_states = (workflow.AFGEHANDELD, workflow.AFGEHANDELD_EXTERN, workflow.GEANNULEERD, workflow.GESPLITST, )
+
+    def __init__(self, chunk_size: int = 500, send_mail: bool = False):
+        self.chunk_size = chunk_size
+        self.send_mail = send_mail
+        self.dsl_service = SignalDslService()
+
+    @classmethod
+    def get_open_signals(cls) -> QuerySet[Signal]:
+        return Signal.objects.exclude(status__state__in=cls.closed_states)
+
+    def route(self, queryset: QuerySet[Signal] | None = None) -> BulkRoutingReport:
+        report = BulkRoutingReport()
+        started_at = time.monotonic()
+
+        routing_table = self.dsl_service.get_routing_table()
+        department_codes = dict(Department.objects.filter(
+            id__in={rule.department_id for rule in routing_table}
+        ).values_list('id', 'code'))
+        users = {user.email: user for user in User.objects.filter(
+            email__in={rule.user_email for rule in routing_table if rule.user_email}
+        )}
+
+        signal_ids = (self.get_open_signals() if queryset is None else queryset).order_by('pk').values_list(
+            'pk', flat=True
+        )
+
+        last_id = 0
+        while chunk_ids := list(signal_ids.filter(pk__gt=last_id)[:self.chunk_size]):
+            last_id = chunk_ids[-1]
+            self._route_chunk(chunk_ids, routing_table, department_codes, users, report)
+
+            report.seconds = time.monotonic() - started_at
+            logger.info(str(report))
+
+        report.seconds = time.monotonic() - started_at
+        return report
+
+    def _route_chunk(self, chunk_ids: list[int], routing_table: list[CompiledRoutingRule],
+                     department_codes: dict[int, str], users: dict[str, User], report: BulkRoutingReport) -> None:
+        from signals.apps.history.services import SignalLogService
+
+        with transaction.atomic():
+            signals = list(
+                Signal.objects.select_for_update(
+                    skip_locked=True,
+                    of=('self', ),
+                ).select_related(
+                    'category_assignment__category__parent',
+                    'location',
+                    'status',
+                    'routing_assignment',
+                    'user_assignment__user',
+                ).prefetch_related(
+                    'routing_assignment__departments',
+                ).filter(
+                    pk__in=chunk_ids
+                )
+            )
+            if len(signals) < len(chunk_ids):
+                # Signals deleted since the chunk was selected are not locked, only count the ones that still exist
+                report.locked += Signal.objects.filter(pk__in=chunk_ids).count() - len(signals)
+            report.processed += len(signals)
+
+            routed = []
+            for signal in signals:
+                try:
+                    ctx = self.dsl_service.context_func(signal)
+                except AssertionError:
+                    # Without a location or category a Signal cannot be routed
+                    report.no_match += 1
+                    continue
+
+                rule = self.dsl_service.find_routing_rule(ctx, routing_table)
+                if rule is None or (rule.user_email and rule.user_email not in users):
+                    report.no_match += 1
+                elif self._is_routed_by(signal, rule):
+                    report.unchanged += 1
+                else:
+                    routed.append((signal, rule))
+
+            if routed:
+                self._write(routed, department_codes, users, SignalLogService)
+            report.routed += len(routed)
+
+    @staticmethod
+    def _current_department_ids(signal: Signal) -> set[int]:
+        if signal.routing_assignment is None:
+            return set()
+        return {department.id for department in signal.routing_assignment.departments.all()}
+
+    def _is_routed_by(self, signal: Signal, rule: CompiledRoutingRule) -> bool:
+        if self._current_department_ids(signal) != {rule.department_id}:
+            return False
+        if rule.user_email is None:
+            return True
+        return (signal.user_assignment is not None and signal.user_assignment.user is not None
+                and signal.user_assignment.user.email == rule.user_email)
+
+    def _write(self, routed: list[tuple[Signal, CompiledRoutingRule]], department_codes: dict[int, str],
+               users: dict[str, User], log_service) -> None:
+        signal_departments = SignalDepartments.objects.bulk_create([
+            SignalDepartments(_signal=signal, relation_type=SignalDepartments.REL_ROUTING)
+            for signal, _ in routed
+        ])
+        SignalDepartments.departments.through.objects.bulk_create([
+            SignalDepartments.departments.through(signaldepartments_id=departments.pk, department_id=rule.department_id)
+            for departments, (_, rule) in zip(signal_departments, routed)
+        ])
+
+        user_assignments = SignalUser.objects.bulk_create([
+            SignalUser(_signal=signal, user=users[rule.user_email])
+            for signal, rule in routed if rule.user_email
+        ])
+        user_assignments_by_signal_id = {user_assignment._signal_id: user_assignment
+                                         for user_assignment in user_assignments}
+
+        now = timezone.now()
+        for (signal, rule), departments in zip(routed, signal_departments):
+            if rule.user_email:
+                signal.user_assignment = user_assignments_by_signal_id[signal.pk]
+            elif signal.user_assignment and self._current_department_ids(signal) - {rule.department_id}:
+                # Routed to other department(s), the assigned user is reset (same as routing a single Signal)
+                signal.user_assignment = None
+            signal.routing_assignment = departments
+            signal.updated_at = now
+        Signal.objects.bulk_update([signal for signal, _ in routed],
+                                   fields=['routing_assignment', 'user_assignment', 'updated_at'])
+
+        log_service.log_update_signal_departments_in_bulk([
+            (departments, department_codes.get(rule.department_id, ''))
+            for departments, (_, rule) in zip(signal_departments, routed)
+        ])
+        log_service.log_update_user_assignments_in_bulk(user_assignments)
+
+        indexer.add([signal.pk for signal, _ in routed])
+        transaction.on_commit(StoredSignalFilterCountService.invalidate)
+
+        if self.send_mail:
+            transaction.on_commit(lambda: self._send_mail(routed))
+
+    @staticmethod
+    def _send_mail(routed: list[tuple[Signal, CompiledRoutingRule]]) -> None:
+        from signals.apps.email_integrations import tasks
+
+        for signal, rule in routed:
+            tasks.send_mail_assigned_signal_departments.delay(signal_pk=signal.pk, department_pks=[rule.department_id])
+            if rule.user_email:
+                tasks.send_mail_assigned_signal_user.delay(signal_pk=signal.pk,
+                                                           user_pk=signal.user_assignment.user_id)
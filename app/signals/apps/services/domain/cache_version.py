@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import uuid
+
+from django.core.cache import cache
+
+
+class CacheVersion:
+    """
+    A random version shared by all processes through the cache
+
+    Anything derived from the database and kept in memory (or cached) remembers the version it was built for.
+    Replacing the version makes all of it stale at once, in every process.
+    """
+    def __init__(self, cache_key: str):
+        self.cache_key = cache_key
+
+    def get(self) -> str:
+        version = cache.get(self.cache_key)
+        if version is None:
+            # Never expires, a new random version makes sure nothing stale can be used
+            cache.add(self.cache_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(self.cache_key)
+        return version
+
+    def replace(self) -> None:
+        cache.set(self.cache_key, uuid.uuid4().hex, timeout=None)
@@ -1,23 +1,34 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2023 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+import threading
 import time
+from dataclasses import dataclass
+from functools import lru_cache
 
 from django.utils import timezone
 
 from signals.apps.dsl.evaluators.evaluator import Evaluator
 from signals.apps.dsl.ExpressionEvaluator import ExpressionEvaluator
+from signals.apps.services.domain.cache_version import CacheVersion
 from signals.apps.signals.managers import SignalManager
-from signals.apps.signals.models import Area, AreaType, RoutingExpression, Signal
+from signals.apps.signals.models import RoutingExpression, Signal
+from signals.apps.signals.utils.area_index import AreaIndex
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(code: str) -> Evaluator:
+    return DslService.compiler.compile(code)
 
 
 class DslService:
+    """
+    Compiles and evaluates expressions, the most recently used compiled expressions are kept (for example while
+    validating expressions through the API)
+    """
     compiler = ExpressionEvaluator()
-    _code_cache: dict[str, Evaluator] = {}
 
     def _compile(self, code: str) -> Evaluator:
-        if code not in self._code_cache:
-            self._code_cache[code] = self.compiler.compile(code)
-        return self._code_cache[code]
+        return _compile_expression(code)
 
     def evaluate(self, context, code: str):
         evaluator = self._compile(code)
@@ -33,21 +44,10 @@ class DslService:
 
 # maps signal object to context dictionary
 class SignalContext:
-    _areas = None
-
-    def _init_areas(self):
-        tmp = {}
-        for area_type in AreaType.objects.all():
-            tmp[area_type.name] = {
-                area.code: area.geometry for area in Area.objects.filter(_type=area_type).all()
-            }
-        return tmp
-
     @property
     def areas(self):
-        if not self._areas:
-            self._areas = self._init_areas()
-        return self._areas
+        # Shared (and kept up to date) prepared geometries of the areas, loaded per AreaType when used in a rule
+        return AreaIndex.areas_by_type_name()
 
     def __call__(self, signal: Signal):
 
@@ -86,57 +86,149 @@ class SignalContext:
         return tmp
 
 
+@dataclass(frozen=True)
+class CompiledRoutingRule:
+    department_id: int
+    user_email: str | None
+    evaluator: Evaluator
+
+
 class SignalDslService(DslService):
+    """
+    Routes Signals with the routing rules (RoutingExpression), compiled into a routing table that is kept per
+    process. All processes share one version of the routing table in the cache, the version is replaced whenever a
+    routing rule, expression or one of the users of the rules changes. The version is read at most once per
+    VERSION_CHECK_INTERVAL seconds, so routing a Signal normally runs no extra queries. As a safeguard for changes that
+    are not signalled the routing table is also rebuilt after MAX_AGE seconds.
+    """
+    VERSION_CHECK_INTERVAL = 1
+    MAX_AGE = 15 * 60
+
     context_func = SignalContext()
     signal_manager: SignalManager = SignalManager()
 
-    def process_routing_rules(self, signal):  # noqa C901
-        ctx = self.context_func(signal)
-        rules = RoutingExpression.objects.select_related('_expression', '_department')
-        for rule in rules.filter(is_active=True, _expression___type__name='routing').order_by('order'):
-            if rule._user and not rule._user.is_active:
-                # The user is no longer active so let's de activate the rule
-                rule.is_active = False
-                rule.save(update_fields=['is_active'])
-                continue  # Continue to the next rule
-
-            if (rule._department and rule._user
-                    and not rule._user.profile.departments.filter(id=rule._department.id).exists()):
-                # The user is no longer a member of the department so let's de activate the rule
-                rule.is_active = False
-                rule.save(update_fields=['is_active'])
-                continue  # Continue to the next rule
-
-            evaluator = None
+    routing_table_version = CacheVersion('signals-routing-table-version')
+    _routing_table_lock = threading.Lock()
+    _routing_table_checked_at = 0.0
+    # (version, built at, routing table)
+    _routing_table: tuple[str | None, float, list[CompiledRoutingRule]] = (None, 0.0, [])
+
+    @classmethod
+    def clear_routing_table(cls) -> None:
+        """
+        Forgets the routing table of this process (without replacing the shared version)
+        """
+        with cls._routing_table_lock:
+            SignalDslService._routing_table = (None, 0.0, [])
+
+    @classmethod
+    def invalidate_routing_table(cls) -> None:
+        cls.clear_routing_table()
+        cls.routing_table_version.replace()
+
+    def _build_routing_table(self) -> list[CompiledRoutingRule]:
+        """
+        Compiles all active routing rules, in order. Rules that can no longer be used (the user is no longer active
+        or no longer part of the department, or the expression does not compile) are deactivated.
+        """
+        from signals.apps.users.models import Profile
+
+        rules = list(
+            RoutingExpression.objects.select_related(
+                '_expression',
+                '_user',
+            ).filter(
+                is_active=True,
+                _expression___type__name='routing',
+            ).order_by(
+                'order'
+            )
+        )
+
+        memberships = set(
+            Profile.departments.through.objects.filter(
+                profile__user_id__in={rule._user_id for rule in rules if rule._user_id},
+            ).values_list(
+                'profile__user_id',
+                'department_id',
+            )
+        )
+
+        routing_table, deactivate_ids = [], []
+        for rule in rules:
+            if rule._user and (not rule._user.is_active or (rule._user_id, rule._department_id) not in memberships):
+                # The user is no longer active or no longer a member of the department
+                deactivate_ids.append(rule.pk)
+                continue
+
             try:
-                evaluator = self._compile(rule._expression.code)
+                evaluator = self.compiler.compile(rule._expression.code)
             except Exception:
                 # compilation failed, invalidate rule
-                rule.is_active = False
-                rule.save()
-
-            if evaluator and rule.is_active:
-                eval_result = False
-                try:
-                    eval_result = evaluator.evaluate(ctx)
-                except Exception:
-                    # ignore runtime errors
-                    pass
-                if eval_result:
-                    # assign relation to department
-                    data = {
-                        'routing_assignment': {
-                            'departments': [
-                                {
-                                    'id': rule._department.id
-                                }
-                            ]
-                        }
+                deactivate_ids.append(rule.pk)
+                continue
+
+            routing_table.append(CompiledRoutingRule(
+                department_id=rule._department_id,
+                user_email=rule._user.email if rule._user else None,
+                evaluator=evaluator,
+            ))
+
+        if deactivate_ids:
+            # An update does not send post_save, the rules are not part of the routing table that is being built
+            RoutingExpression.objects.filter(pk__in=deactivate_ids).update(is_active=False)
+
+        return routing_table
+
+    def get_routing_table(self) -> list[CompiledRoutingRule]:
+        now = time.monotonic()
+        table_version, built_at, routing_table = SignalDslService._routing_table
+        if (table_version is not None and now - built_at < self.MAX_AGE and
+                now - SignalDslService._routing_table_checked_at < self.VERSION_CHECK_INTERVAL):
+            return routing_table
+
+        version = self.routing_table_version.get()
+        with self._routing_table_lock:
+            table_version, built_at, routing_table = SignalDslService._routing_table
+            if table_version != version or now - built_at >= self.MAX_AGE:
+                routing_table = self._build_routing_table()
+                SignalDslService._routing_table = (version, time.monotonic(), routing_table)
+            SignalDslService._routing_table_checked_at = now
+            return routing_table
+
+    @staticmethod
+    def find_routing_rule(ctx: dict, routing_table: list[CompiledRoutingRule]) -> CompiledRoutingRule | None:
+        """
+        Returns the first rule of the routing table that matches the given context, or None
+        """
+        for rule in routing_table:
+            try:
+                if rule.evaluator.evaluate(ctx):
+                    return rule
+            except Exception:
+                # ignore runtime errors
+                pass
+        return None
+
+    def process_routing_rules(self, signal):
+        ctx = self.context_func(signal)
+        rule = self.find_routing_rule(ctx, self.get_routing_table())
+        if rule is None:
+            return False
+
+        # assign relation to department
+        data = {
+            'routing_assignment': {
+                'departments': [
+                    {
+                        'id': rule.department_id
                     }
+                ]
+            }
+        }
 
-                    if rule._user:
-                        data['user_assignment'] = {'user': {'email': rule._user.email}}
+        if rule.user_email:
+            data['user_assignment'] = {'user': {'email': rule.user_email}}
 
-                    self.signal_manager.update_multiple(data, signal)
-                    return True
-        return False
+        self.signal_manager.update_multiple(data, signal)
+        return True
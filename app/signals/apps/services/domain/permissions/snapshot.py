@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from signals.apps.services.domain.cache_version import CacheVersion
+
+
+@dataclass(frozen=True)
+class PermissionSnapshot:
+    """
+    The categories and departments that determine which signals a user can see
+    """
+    category_ids: frozenset[int]
+    department_ids: frozenset[int]
+
+
+class PermissionSnapshotService:
+    """
+    Caches a PermissionSnapshot per user
+
+    All snapshots share one version, the version is replaced whenever something
+    changes that could influence the permissions of a user (CategoryDepartment,
+    the departments of a Profile or the roles of a user). Replacing the version
+    makes all cached snapshots unreachable, they will expire by themselves.
+
+    Every process reads the version at most once per VERSION_CHECK_INTERVAL
+    seconds. The version is replaced before and again after the change is
+    committed. A snapshot built from data read in between (by another process)
+    is replaced by the second version, and a snapshot is never used longer than
+    MAX_AGE seconds.
+    """
+    MAX_AGE = 5 * 60
+    VERSION_CHECK_INTERVAL = 1
+
+    cache_key_prefix = 'signals-permission-snapshot'
+    cache_version = CacheVersion(f'{cache_key_prefix}-version')
+
+    _lock = threading.Lock()
+    _version: Optional[str] = None
+    _version_checked_at = 0.0
+
+    @staticmethod
+    def _build_snapshot(user) -> PermissionSnapshot:
+        from signals.apps.signals.models import CategoryDepartment
+
+        department_ids = frozenset(user.profile.departments.values_list('id', flat=True))
+        category_ids = frozenset(
+            CategoryDepartment.objects.filter(
+                Q(is_responsible=True) | Q(can_view=True),
+                department_id__in=department_ids,
+            ).values_list(
+                'category_id',
+                flat=True
+            )
+        ) if department_ids else frozenset()
+
+        return PermissionSnapshot(category_ids=category_ids, department_ids=department_ids)
+
+    @classmethod
+    def get_version(cls) -> str:
+        return cls.cache_version.get()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._version = None
+        cls.cache_version.replace()
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forgets the version known to this process (without replacing the shared version)
+        """
+        with cls._lock:
+            cls._version = None
+
+    @classmethod
+    def _check_version(cls) -> str:
+        now = time.monotonic()
+        with cls._lock:
+            version = cls._version
+            if version is not None and now - cls._version_checked_at < cls.VERSION_CHECK_INTERVAL:
+                return version
+
+        version = cls.get_version()
+        with cls._lock:
+            cls._version = version
+            cls._version_checked_at = now
+        return version
+
+    @classmethod
+    def get_snapshot(cls, user) -> PermissionSnapshot:
+        version = cls._check_version()
+
+        # The snapshot is also kept on the user instance, a user is loaded for every request
+        cached_version, snapshot, built_at = getattr(user, '_permission_snapshot', (None, None, 0.0))
+        if cached_version == version and time.monotonic() - built_at < cls.MAX_AGE:
+            return snapshot
+
+        cache_key = f'{cls.cache_key_prefix}-{version}-{user.pk}'
+        snapshot = cache.get(cache_key)
+        if snapshot is None:
+            snapshot = cls._build_snapshot(user)
+            cache.set(cache_key, snapshot, timeout=cls.MAX_AGE)
+
+        user._permission_snapshot = (version, snapshot, time.monotonic())
+        return snapshot
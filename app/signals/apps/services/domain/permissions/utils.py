@@ -1,26 +1,38 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2021 Gemeente Amsterdam
-from django.db.models import Q
-
-
-def make_permission_condition_for_user_by_category(user):
-    return Q(category_assignment__category_id__in=user.profile.departments.prefetch_related(
-        'categorydepartment_set'
-    ).filter(
-        Q(categorydepartment__is_responsible=True) |
-        Q(categorydepartment__can_view=True)
-    ).values_list(
-        'categorydepartment__category_id',
-        flat=True
-    ))
+# Copyright (C) 2021 - 2026 Gemeente Amsterdam
+from django.db.models import Exists, OuterRef, Q
+
+from signals.apps.services.domain.permissions.snapshot import (
+    PermissionSnapshot,
+    PermissionSnapshotService
+)
 
 
-def make_permission_condition_for_user_by_department_routing(user):
-    return Q(routing_assignment__departments__id__in=user.profile.departments.values_list('id', flat=True))
+def make_permission_condition_for_user_by_category(user, snapshot: PermissionSnapshot | None = None):
+    category_ids = (snapshot or PermissionSnapshotService.get_snapshot(user)).category_ids
+    return Q(category_assignment__category_id__in=sorted(category_ids))
+
+
+def make_permission_condition_for_user_by_department_routing(user, snapshot: PermissionSnapshot | None = None):
+    from signals.apps.signals.models import SignalDepartments
+
+    # An EXISTS instead of a join on the routing departments, so no duplicate Signals (and no distinct) are needed
+    department_ids = (snapshot or PermissionSnapshotService.get_snapshot(user)).department_ids
+    return Q(Exists(
+        SignalDepartments.departments.through.objects.filter(
+            signaldepartments_id=OuterRef('routing_assignment_id'),
+            department_id__in=sorted(department_ids),
+        )
+    ))
 
 
 def make_permission_condition_for_user(user):
+    snapshot = PermissionSnapshotService.get_snapshot(user)
+    if not snapshot.department_ids:
+        # Without departments a user cannot see any Signal via a category or the routing
+        return Q(pk__in=[])
+
     return (
-        make_permission_condition_for_user_by_category(user) |
-        make_permission_condition_for_user_by_department_routing(user)
+        make_permission_condition_for_user_by_category(user, snapshot) |
+        make_permission_condition_for_user_by_department_routing(user, snapshot)
     )
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import connection
+
+from signals.apps.signals.models.views.signal import PublicSignalGeographyFeature
+from signals.apps.signals.workflow import (
+    AFGEHANDELD,
+    AFGEHANDELD_EXTERN,
+    GEANNULEERD,
+    VERZOEK_TOT_HEROPENEN
+)
+
+TABLE = PublicSignalGeographyFeature._meta.db_table
+COLUMNS = ('id', 'uuid', 'geometry', 'state', 'parent_category_id', 'child_category_id',
+           'child_category_is_public_accessible', 'created_at', 'feature', )
+
+# The features of the Signals that are shown on the public map, see the "public_signals_geography_feature_collection"
+# migrations
+SELECT_FEATURES = '''
+  SELECT
+    "signals_signal"."id",
+    "signals_signal"."uuid",
+    "signals_location"."geometrie" AS geometry,
+    "signals_status"."state" AS state,
+    scp."id" as parent_category_id,
+    "signals_category"."id" as child_category_id,
+    "signals_category"."is_public_accessible" as child_category_is_public_accessible,
+    "signals_signal"."created_at",
+    JSONB_BUILD_OBJECT(
+      'type', 'Feature',
+      'geometry', st_asgeojson("signals_location"."geometrie")::jsonb,
+      'properties', JSONB_BUILD_OBJECT(
+      'category', JSONB_BUILD_OBJECT(
+        'name', CASE WHEN "signals_category"."public_name" = '' THEN "signals_category"."name" WHEN "signals_category"."public_name" IS NULL THEN "signals_category"."name" ELSE "signals_category"."public_name" END,
+        'slug', "signals_category"."slug",
+        'parent', JSONB_BUILD_OBJECT(
+          'name', CASE WHEN scp."public_name" = ''  THEN scp."name" WHEN scp."public_name" IS NULL THEN scp."name" ELSE scp."public_name" END,
+          'slug', scp."slug"
+        )
+      ),
+      'created_at', "signals_signal"."created_at"
+    )
+    ) AS "feature"
+  FROM "signals_signal"
+    LEFT OUTER JOIN "signals_status" ON ("signals_signal"."status_id" = "signals_status"."id")
+    LEFT OUTER JOIN "signals_categoryassignment" ON ("signals_signal"."category_assignment_id" = "signals_categoryassignment"."id")
+    LEFT OUTER JOIN "signals_category" ON ("signals_categoryassignment"."category_id" = "signals_category"."id")
+    INNER JOIN "signals_location" ON ("signals_signal"."location_id" = "signals_location"."id")
+    LEFT OUTER JOIN "signals_category" scp ON ("signals_category"."parent_id" = scp."id")
+  WHERE NOT ("signals_status"."state" IN %(hidden_states)s) AND ({source_condition})
+'''  # noqa
+
+# Upserts the features in scope that are missing or changed (unchanged rows are not written) and deletes the rows in
+# scope of the Signals that are no longer shown. Returns the number of rows written and deleted.
+SYNC_FEATURES = f'''
+WITH "source" AS ({SELECT_FEATURES}),
+"upserted" AS (
+  INSERT INTO "{TABLE}" ({", ".join(f'"{column}"' for column in COLUMNS)})
+  SELECT * FROM "source"
+  ON CONFLICT ("id") DO UPDATE SET {", ".join(f'"{column}" = EXCLUDED."{column}"' for column in COLUMNS[1:])}
+  WHERE ({", ".join(f'"{TABLE}"."{column}"' for column in COLUMNS[1:])})
+    IS DISTINCT FROM ({", ".join(f'EXCLUDED."{column}"' for column in COLUMNS[1:])})
+  RETURNING 1
+),
+"deleted" AS (
+  DELETE FROM "{TABLE}"
+  WHERE ({{table_condition}}) AND "{TABLE}"."id" NOT IN (SELECT "id" FROM "source")
+  RETURNING 1
+)
+SELECT (SELECT COUNT(*) FROM "upserted"), (SELECT COUNT(*) FROM "deleted")
+'''  # noqa
+
+
+class PublicSignalGeographyFeatureService:
+    """
+    Keeps the features of the public map ("public_signals_geography_feature_collection", used by the
+    public/signals/geography endpoint) up-to-date
+
+    The features of a Signal are synchronized whenever the Signal is created, or its status, location or category
+    changes (see the signal receivers). The reconciliation synchronizes all features, to repair drift.
+    """
+    hidden_states = (AFGEHANDELD, AFGEHANDELD_EXTERN, GEANNULEERD, VERZOEK_TOT_HEROPENEN, )
+
+    @classmethod
+    def _sync(cls, source_condition: str, table_condition: str, params: dict) -> tuple[int, int]:
+        query = SYNC_FEATURES.replace('{source_condition}', source_condition).replace(
+            '{table_condition}', table_condition
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(query, {'hidden_states': cls.hidden_states, **params})
+            upserted, deleted = cursor.fetchone()
+        return upserted, deleted
+
+    @classmethod
+    def sync_signals(cls, signal_ids: list[int]) -> tuple[int, int]:
+        """
+        Synchronize the features of the given Signals
+        """
+        if not signal_ids:
+            return 0, 0
+        return cls._sync('"signals_signal"."id" = ANY(%(signal_ids)s)',
+                         f'"{TABLE}"."id" = ANY(%(signal_ids)s)',
+                         {'signal_ids': list(signal_ids)})
+
+    @classmethod
+    def sync_category(cls, category_id: int) -> tuple[int, int]:
+        """
+        Synchronize the features of the Signals in the given (parent) category, the name, slug and public
+        accessibility of the category are part of the features
+        """
+        return cls._sync('"signals_category"."id" = %(category_id)s OR scp."id" = %(category_id)s',
+                         f'"{TABLE}"."child_category_id" = %(category_id)s '
+                         f'OR "{TABLE}"."parent_category_id" = %(category_id)s',
+                         {'category_id': category_id})
+
+    @classmethod
+    def reconcile(cls) -> tuple[int, int]:
+        """
+        Synchronize all features
+        """
+        return cls._sync('TRUE', 'TRUE', {})
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from signals.apps.services.domain.cache_version import CacheVersion
+from signals.apps.services.domain.permissions.signal import SignalPermissionService
+from signals.apps.services.domain.permissions.snapshot import PermissionSnapshotService
+
+
+class StoredSignalFilterCountService:
+    """
+    Counts the Signals matching the stored filters shown on the overview
+
+    The counts of all filters are determined in one query: the Signals a user can see are counted once per filter,
+    using a conditional count. Filters with the same options are counted once.
+
+    A count is cached per (filter options, permissions of the user), so users with the same permissions share their
+    counts. All counts share one version, which is replaced when a Signal changes in a way that could change the
+    outcome of a filter. The counts also expire after SIGNAL_FILTER_COUNTS_CACHE_TTL seconds, to pick up changes that
+    are not signalled (for example a deadline that passes).
+    """
+    cache_key_prefix = 'signals-stored-signal-filter-count'
+    cache_version = CacheVersion(f'{cache_key_prefix}-version')
+
+    @staticmethod
+    def _hash(value) -> str:
+        return hashlib.sha1(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _permission_key(cls, user) -> str:
+        if SignalPermissionService.has_permission(user, 'signals.sia_can_view_all_categories'):
+            return 'all'
+
+        snapshot = PermissionSnapshotService.get_snapshot(user)
+        return cls._hash([sorted(snapshot.category_ids), sorted(snapshot.department_ids)])
+
+    @staticmethod
+    def _filter_queryset(options):
+        from signals.apps.api.filters import SignalFilterSet
+        from signals.apps.signals.models import Signal
+
+        signal_filter = SignalFilterSet(data=options, queryset=Signal.objects.all())
+        if not signal_filter.is_valid():
+            return None  # For instance a filter on a category that no longer exists
+        return signal_filter.qs
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cls.cache_version.replace()
+
+    @classmethod
+    def _count(cls, user, options_by_key: dict) -> dict:
+        from signals.apps.signals.models import Signal
+
+        counts, aggregates = {}, {}
+        for options_key, options in options_by_key.items():
+            queryset = cls._filter_queryset(options)
+            if queryset is None:
+                counts[options_key] = None
+            else:
+                aggregates[options_key] = Count('pk', filter=Q(pk__in=queryset.values('pk')))
+
+        if aggregates:
+            # The permissions of the user are the predicate shared by all the counts
+            result = Signal.objects.filter_for_user(user).aggregate(
+                **{f'count_{i}': aggregate for i, aggregate in enumerate(aggregates.values())}
+            )
+            counts.update({
+                options_key: result[f'count_{i}'] for i, options_key in enumerate(aggregates)
+            })
+
+        return counts
+
+    @classmethod
+    def get_counts(cls, user, stored_filters) -> dict[int, int | None]:
+        """
+        The number of Signals the user can see per stored filter (None for a filter that is no longer valid)
+        """
+        stored_filters = list(stored_filters)
+        if not stored_filters:
+            return {}
+
+        prefix = f'{cls.cache_key_prefix}-{cls.cache_version.get()}-{cls._permission_key(user)}'
+        options_by_key = {
+            f'{prefix}-{cls._hash(stored_filter.options)}': stored_filter.options for stored_filter in stored_filters
+        }
+
+        counts = cache.get_many(list(options_by_key))
+        missing = {key: options for key, options in options_by_key.items() if key not in counts}
+        if missing:
+            computed = cls._count(user, missing)
+            cache.set_many({key: count for key, count in computed.items() if count is not None},
+                           timeout=settings.SIGNAL_FILTER_COUNTS_CACHE_TTL)
+            counts.update(computed)
+
+        return {
+            stored_filter.pk: counts[f'{prefix}-{cls._hash(stored_filter.options)}'] for stored_filter in stored_filters
+        }
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group
+from django.test import TestCase
+
+from signals.apps.services.domain.permissions.snapshot import (
+    PermissionSnapshot,
+    PermissionSnapshotService
+)
+from signals.apps.services.domain.permissions.utils import make_permission_condition_for_user
+from signals.apps.signals.factories import CategoryFactory, DepartmentFactory, SignalFactory
+from signals.apps.signals.factories.category_departments import CategoryDepartmentFactory
+from signals.apps.signals.models import Signal
+from signals.apps.users.factories import UserFactory
+
+
+class TestPermissionSnapshotService(TestCase):
+    def setUp(self):
+        self.user = UserFactory.create()
+        self.department = DepartmentFactory.create()
+        self.category = CategoryFactory.create()
+        CategoryDepartmentFactory.create(category=self.category, department=self.department,
+                                         is_responsible=True, can_view=True)
+
+        self.signal = SignalFactory.create(category_assignment__category=self.category)
+        self.other_signal = SignalFactory.create()
+
+    def test_snapshot(self):
+        snapshot = PermissionSnapshotService.get_snapshot(self.user)
+        self.assertEqual(snapshot.department_ids, frozenset())
+        self.assertEqual(snapshot.category_ids, frozenset())
+
+        self.user.profile.departments.add(self.department)
+
+        snapshot = PermissionSnapshotService.get_snapshot(self.user)
+        self.assertEqual(snapshot.department_ids, frozenset([self.department.id]))
+        self.assertEqual(snapshot.category_ids, frozenset([self.category.id]))
+
+    def test_snapshot_is_cached(self):
+        self.user.profile.departments.add(self.department)
+        snapshot = PermissionSnapshotService.get_snapshot(self.user)
+
+        with patch.object(PermissionSnapshotService, '_build_snapshot') as mocked_build_snapshot:
+            self.assertEqual(PermissionSnapshotService.get_snapshot(self.user), snapshot)
+
+            # Also for a fresh instance of the same user (every request loads the user)
+            self.user.refresh_from_db()
+            del self.user._permission_snapshot
+            self.assertEqual(PermissionSnapshotService.get_snapshot(self.user), snapshot)
+
+        mocked_build_snapshot.assert_not_called()
+
+    def test_invalidated_on_category_department_changes(self):
+        self.user.profile.departments.add(self.department)
+        other_category = CategoryFactory.create()
+
+        self.assertNotIn(other_category.id, PermissionSnapshotService.get_snapshot(self.user).category_ids)
+
+        CategoryDepartmentFactory.create(category=other_category, department=self.department,
+                                         is_responsible=False, can_view=True)
+        self.assertIn(other_category.id, PermissionSnapshotService.get_snapshot(self.user).category_ids)
+
+        self.department.categorydepartment_set.filter(category=other_category).delete()
+        self.assertNotIn(other_category.id, PermissionSnapshotService.get_snapshot(self.user).category_ids)
+
+    def test_invalidated_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.profile.departments.add(self.department)
+
+        # A snapshot built by another process before the commit, from the data before the change
+        version = PermissionSnapshotService.get_version()
+        PermissionSnapshotService.get_snapshot(self.user)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(version, PermissionSnapshotService.get_version())
+
+    @patch('signals.apps.services.domain.permissions.snapshot.cache')
+    def test_snapshot_expires(self, cache):
+        cache.get.return_value = None
+        PermissionSnapshotService.get_snapshot(self.user)
+
+        self.assertEqual(cache.set.call_args.kwargs['timeout'], PermissionSnapshotService.MAX_AGE)
+
+    @patch('signals.apps.services.domain.permissions.snapshot.time.monotonic')
+    def test_version_checked_once_per_interval(self, monotonic):
+        monotonic.return_value = 1000.0
+        PermissionSnapshotService.get_snapshot(self.user)
+
+        # Another process replaced the version, it is noticed after the interval
+        PermissionSnapshotService.cache_version.replace()
+        with self.assertNumQueries(0):
+            PermissionSnapshotService.get_snapshot(self.user)
+
+        monotonic.return_value = 1000.0 + PermissionSnapshotService.VERSION_CHECK_INTERVAL
+        snapshot = PermissionSnapshot(category_ids=frozenset(), department_ids=frozenset())
+        with patch.object(PermissionSnapshotService, '_build_snapshot', return_value=snapshot) as mocked_build_snapshot:
+            self.assertEqual(PermissionSnapshotService.get_snapshot(self.user), snapshot)
+        mocked_build_snapshot.assert_called_once()
+
+    @patch('signals.apps.services.domain.permissions.snapshot.time.monotonic')
+    def test_snapshot_on_user_max_age(self, monotonic):
+        monotonic.return_value = 1000.0
+        PermissionSnapshotService.get_snapshot(self.user)
+        version = PermissionSnapshotService.get_version()
+
+        # The same version, but the snapshot kept on the user instance is too old
+        monotonic.return_value = 1000.0 + PermissionSnapshotService.MAX_AGE
+        PermissionSnapshotService.get_snapshot(self.user)
+        self.assertEqual(version, PermissionSnapshotService.get_version())
+        self.assertEqual(self.user._permission_snapshot[2], monotonic.return_value)
+
+    def test_permission_condition_gets_snapshot_once(self):
+        self.user.profile.departments.add(self.department)
+        with patch.object(PermissionSnapshotService, 'get_snapshot',
+                          wraps=PermissionSnapshotService.get_snapshot) as mocked_get_snapshot:
+            make_permission_condition_for_user(self.user)
+        mocked_get_snapshot.assert_called_once_with(self.user)
+
+    def test_invalidated_on_role_changes(self):
+        version = PermissionSnapshotService.get_version()
+        self.user.groups.add(Group.objects.create(name='Test role'))
+        self.assertNotEqual(version, PermissionSnapshotService.get_version())
+
+    def test_filter_for_user(self):
+        self.assertEqual(Signal.objects.filter_for_user(self.user).count(), 0)
+
+        self.user.profile.departments.add(self.department)
+        self.assertEqual(list(Signal.objects.filter_for_user(self.user).values_list('id', flat=True)),
+                         [self.signal.id])
+
+    def test_filter_for_user_via_routing(self):
+        self.user.profile.departments.add(self.department)
+        Signal.actions.update_routing_departments({
+            'relation_type': 'routing',
+            'departments': [{'id': self.department.id}],
+        }, self.other_signal)
+
+        self.assertEqual(set(Signal.objects.filter_for_user(self.user).values_list('id', flat=True)),
+                         {self.signal.id, self.other_signal.id})
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Compare the "near" query of the signal context (the radius search) with the
+previous implementation that calculated the distance for every signal.
+
+Run this on a seeded database (for instance using "dummy_signals"), use
+"--explain" to show the query plans.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.gis.db.models.functions import Distance
+from django.core.management import BaseCommand
+
+from signals.apps.signals.models import Signal
+
+
+class Command(BaseCommand):
+    default_samples = 25
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=self.default_samples,
+                            help=f'Number of signals to run the radius search for. Default {self.default_samples}.')
+        parser.add_argument('--radius', type=int, default=settings.SIGNAL_API_CONTEXT_GEOGRAPHY_RADIUS,
+                            help='Radius in meters.')
+        parser.add_argument('--explain', action='store_true', help='Show the query plan of both queries.')
+
+    def _distance_queryset(self, geometrie, radius):
+        return Signal.objects.annotate(
+            distance_from_point=Distance('location__geometrie', geometrie),
+        ).filter(
+            distance_from_point__lte=radius,
+        )
+
+    def _near_queryset(self, geometrie, radius):
+        return Signal.objects.near(geometrie, radius)
+
+    def _benchmark(self, name, get_queryset, geometries, radius):
+        start = time.perf_counter()
+        total = 0
+        for geometrie in geometries:
+            total += get_queryset(geometrie, radius).count()
+        duration = time.perf_counter() - start
+
+        self.stdout.write(f'{name}: {len(geometries)} queries, {total} signals found, '
+                          f'{duration * 1000 / len(geometries):.2f} ms per query')
+
+    def handle(self, *args, **options):
+        radius = options['radius']
+        geometries = list(
+            Signal.objects.filter(
+                location__isnull=False
+            ).order_by('?').values_list('location__geometrie', flat=True)[:options['samples']]
+        )
+        if not geometries:
+            self.stderr.write('No signals with a location found, seed the database first (see "dummy_signals")')
+            return
+
+        if options['explain']:
+            self.stdout.write('Distance annotation:')
+            self.stdout.write(self._distance_queryset(geometries[0], radius).explain(analyze=True))
+            self.stdout.write('Bounding box and ST_DWithin:')
+            self.stdout.write(self._near_queryset(geometries[0], radius).explain(analyze=True))
+
+        self._benchmark('Distance annotation', self._distance_queryset, geometries, radius)
+        self._benchmark('Bounding box and ST_DWithin', self._near_queryset, geometries, radius)
@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Compare the requests per second on the public create endpoint for the throttle implementations (the request history
+of the SimpleRateThrottle and the sliding window counter) in combination with several cache backends.
+
+With the database cache (also as the shared cache of the layered cache) the sliding window counter keeps its counters
+in the ThrottleCounter table, with the other caches in the cache.
+
+The requests are made in-process and all changes (signals, throttle counters and cached values in the database) are
+rolled back afterwards. Address validation is skipped. Run this against a database with at least one active
+(sub) category. The layered cache uses CACHE_SHARED_BACKEND and CACHE_SHARED_LOCATION as the shared cache (the
+database cache when not set).
+"""
+import os
+import time
+from collections import Counter
+from unittest.mock import patch
+
+from django.core.management import BaseCommand
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework.throttling import SimpleRateThrottle
+
+from signals.apps.api.validation.address.base import AddressValidationUnavailableException
+from signals.apps.api.views.signals.public.signals import PublicSignalViewSet
+from signals.apps.signals.models import Category
+from signals.throttling import PostOnlyNoUserRateThrottle
+
+DATABASE_CACHE = {
+    'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+    'LOCATION': 'signals_cache',
+}
+CACHE_CONFIGURATIONS = {
+    'database': {
+        'default': DATABASE_CACHE,
+    },
+    'local-memory': {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'benchmark-public-create',
+        },
+    },
+    'layered': {
+        'default': {
+            'BACKEND': 'signals.cache.LayeredCache',
+            'OPTIONS': {'SHARED_CACHE': 'shared'},
+        },
+        'shared': {
+            'BACKEND': os.getenv('CACHE_SHARED_BACKEND', DATABASE_CACHE['BACKEND']),
+            'LOCATION': os.getenv('CACHE_SHARED_LOCATION', DATABASE_CACHE['LOCATION']),
+        },
+    },
+}
+
+# High enough to never deny a request, the cost of keeping count is what is measured
+BENCHMARK_RATE = '1000000/hour'
+
+
+class SlidingWindowThrottle(PostOnlyNoUserRateThrottle):
+    rate = BENCHMARK_RATE
+
+
+class HistoryThrottle(PostOnlyNoUserRateThrottle):
+    rate = BENCHMARK_RATE
+
+    def allow_request(self, request, view):
+        return request.method != 'POST' or SimpleRateThrottle.allow_request(self, request, view)
+
+    def wait(self):
+        return SimpleRateThrottle.wait(self)
+
+
+THROTTLES = {
+    'history': HistoryThrottle,
+    'sliding-window': SlidingWindowThrottle,
+}
+
+
+class Command(BaseCommand):
+    endpoint = '/signals/v1/public/signals/'
+    default_requests = 200
+    default_clients = 16
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=self.default_requests,
+                            help=f'Number of requests per combination. Default {self.default_requests}.')
+        parser.add_argument('--clients', type=int, default=self.default_clients,
+                            help=f'Number of different client IP addresses. Default {self.default_clients}.')
+        parser.add_argument('--caches', nargs='+', choices=CACHE_CONFIGURATIONS.keys(),
+                            default=list(CACHE_CONFIGURATIONS.keys()), help='Cache configurations to compare.')
+        parser.add_argument('--throttles', nargs='+', choices=THROTTLES.keys(), default=list(THROTTLES.keys()),
+                            help='Throttle implementations to compare.')
+
+    def _get_payload(self, category):
+        return {
+            'text': 'Benchmark',
+            'location': {
+                'geometrie': {'type': 'Point', 'coordinates': [4.90022563, 52.36768424]},
+                'address': {'openbare_ruimte': 'Amstel', 'huisnummer': 1, 'postcode': '1011PN',
+                            'woonplaats': 'Amsterdam'},
+            },
+            'category': {
+                'sub_category': f'/signals/v1/public/terms/categories/{category.parent.slug}/sub_categories/'
+                                f'{category.slug}'
+            },
+            'reporter': {'email': 'melder@example.com'},
+            'incident_date_start': '2026-01-01T12:00:00Z',
+        }
+
+    def _benchmark(self, name, payload, n_requests, n_clients):
+        client = APIClient()
+        status_codes = Counter()
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for i in range(n_requests):
+                response = client.post(self.endpoint, payload, format='json', secure=True,
+                                       REMOTE_ADDR=f'10.0.0.{i % n_clients + 1}')
+                status_codes[response.status_code] += 1
+            duration = time.perf_counter() - start
+
+        self.stdout.write(f'{name}: {n_requests / duration:.1f} requests per second, '
+                          f'{len(queries) / n_requests:.1f} queries per request, '
+                          f'status codes {dict(status_codes)}')
+
+    def handle(self, *args, **options):
+        category = Category.objects.filter(parent__isnull=False, is_active=True).select_related('parent').first()
+        if category is None:
+            self.stderr.write('No active sub category found, seed the database first (see "dummy_categories")')
+            return
+
+        payload = self._get_payload(category)
+        for cache_name in options['caches']:
+            for throttle_name in options['throttles']:
+                with transaction.atomic(), \
+                        override_settings(CACHES=CACHE_CONFIGURATIONS[cache_name], ALLOWED_HOSTS=['testserver']), \
+                        patch.object(PublicSignalViewSet, 'throttle_classes', (THROTTLES[throttle_name], )), \
+                        patch('signals.apps.api.validation.address.base.BaseAddressValidation.validate_address',
+                              side_effect=AddressValidationUnavailableException):
+                    self._benchmark(f'{cache_name} cache, {throttle_name} throttle', payload,
+                                    options['requests'], options['clients'])
+                    transaction.set_rollback(True)
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Compare the session writes and the requests per second on the private signal list with the SessionLoginMiddleware
+that logs in on every request (the previous implementation) and the one that only logs in once per token.
+
+The requests are made in-process with a token for the given user (the token itself is not validated), all changes
+are rolled back afterwards.
+"""
+import time
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from signals.apps.api.middleware import SessionLoginMiddleware
+from signals.auth.backend import JWTAuthBackend
+
+User = get_user_model()
+
+
+class LoginOnEveryRequestMiddleware(SessionLoginMiddleware):
+    def has_valid_session(self, request, fingerprint):
+        return False
+
+
+MIDDLEWARES = {
+    'login-on-every-request': f'{__name__}.LoginOnEveryRequestMiddleware',
+    'login-once-per-token': 'signals.apps.api.middleware.SessionLoginMiddleware',
+}
+
+
+class Command(BaseCommand):
+    endpoint = '/signals/v1/private/signals/'
+    default_requests = 100
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=self.default_requests,
+                            help=f'Number of requests per middleware. Default {self.default_requests}.')
+        parser.add_argument('--user', type=str, default=settings.TEST_LOGIN,
+                            help=f'Username of the user making the requests. Default {settings.TEST_LOGIN}.')
+
+    @staticmethod
+    def _is_session_write(sql):
+        sql = sql.lstrip().upper()
+        return 'DJANGO_SESSION' in sql and sql.startswith(('INSERT', 'UPDATE', 'DELETE'))
+
+    def _benchmark(self, name, n_requests):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION='Bearer benchmark-token')
+
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for _ in range(n_requests):
+                client.get(self.endpoint, secure=True)
+            duration = time.perf_counter() - start
+
+        session_writes = len([query for query in queries if self._is_session_write(query['sql'])])
+        self.stdout.write(f'{name}: {n_requests / duration:.1f} requests per second, '
+                          f'{len(queries) / n_requests:.1f} queries and {session_writes / n_requests:.2f} session '
+                          f'writes per request ({session_writes} in total)')
+
+    def handle(self, *args, **options):
+        try:
+            user = User.objects.get(username__iexact=options['user'], is_active=True)
+        except User.DoesNotExist:
+            raise CommandError(f'No active user {options["user"]}')
+
+        middleware = [name for name in settings.MIDDLEWARE if not name.endswith('SessionLoginMiddleware')]
+        for name, path in MIDDLEWARES.items():
+            with transaction.atomic(), \
+                    override_settings(MIDDLEWARE=[*middleware, path], ALLOWED_HOSTS=['testserver']), \
+                    patch.object(JWTAuthBackend, 'authenticate', return_value=(user, 'benchmark-token')):
+                self._benchmark(name, options['requests'])
+                transaction.set_rollback(True)
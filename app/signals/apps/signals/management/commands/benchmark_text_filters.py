@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Compare the queries of the "address_text" and "note_keyword" filters of the signal list: the previous join on the
+notes plus DISTINCT, the EXISTS subquery (served by the trigram indexes) and the full-text search mode.
+
+Run this on a seeded database (for instance using "dummy_signals"), "--seed-notes" adds Dutch notes to the signals.
+The keywords are taken from the existing addresses and notes. Use "--explain" to show the query plans.
+"""
+import time
+
+from django.core.management import BaseCommand
+from django.db.models import Exists, OuterRef
+from faker import Faker
+
+from signals.apps.signals.models import Location, Note, Signal
+from signals.apps.signals.models.functions.text_search import full_text_condition
+
+
+class Command(BaseCommand):
+    default_samples = 25
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=self.default_samples,
+                            help=f'Number of keywords to filter on. Default {self.default_samples}.')
+        parser.add_argument('--explain', action='store_true', help='Show the query plan of every query.')
+        parser.add_argument('--seed-notes', type=int, default=0,
+                            help='Number of (random Dutch) notes to add to every signal before the benchmark.')
+
+    def _seed_notes(self, per_signal):
+        fake = Faker('nl_NL')
+        notes = [
+            Note(_signal_id=signal_id, text=fake.paragraph(nb_sentences=3), created_by='benchmark@example.com')
+            for signal_id in Signal.objects.values_list('id', flat=True).iterator()
+            for _ in range(per_signal)
+        ]
+        Note.objects.bulk_create(notes, batch_size=1000)
+        self.stdout.write(f'Added {len(notes)} note(s)')
+
+    @staticmethod
+    def _keywords(queryset, field_name, samples):
+        """
+        The longest word of random texts
+        """
+        texts = queryset.exclude(**{f'{field_name}__isnull': True}).order_by('?').values_list(field_name, flat=True)
+        return [max(text.split(), key=len) for text in texts[:samples] if text.split()]
+
+    @staticmethod
+    def _notes_join(keyword):
+        return Signal.objects.filter(notes__text__icontains=keyword).distinct()
+
+    @staticmethod
+    def _notes_exists(keyword):
+        return Signal.objects.filter(Exists(Note.objects.filter(_signal_id=OuterRef('pk'), text__icontains=keyword)))
+
+    @staticmethod
+    def _notes_full_text(keyword):
+        return Signal.objects.filter(Exists(Note.objects.filter(_signal_id=OuterRef('pk')).filter(
+            full_text_condition('text', keyword)
+        )))
+
+    @staticmethod
+    def _address_contains(keyword):
+        return Signal.objects.filter(location__address_text__icontains=keyword)
+
+    @staticmethod
+    def _address_full_text(keyword):
+        return Signal.objects.filter(full_text_condition('location__address_text', keyword))
+
+    def _benchmark(self, name, get_queryset, keywords, explain):
+        if explain:
+            self.stdout.write(f'{name}:')
+            self.stdout.write(get_queryset(keywords[0]).explain(analyze=True))
+
+        start = time.perf_counter()
+        total = 0
+        for keyword in keywords:
+            total += get_queryset(keyword).count()
+        duration = time.perf_counter() - start
+
+        self.stdout.write(f'{name}: {len(keywords)} queries, {total} signals found, '
+                          f'{duration * 1000 / len(keywords):.2f} ms per query')
+
+    def handle(self, *args, **options):
+        if options['seed_notes'] > 0:
+            self._seed_notes(options['seed_notes'])
+
+        note_keywords = self._keywords(Note.objects.all(), 'text', options['samples'])
+        address_keywords = self._keywords(Location.objects.all(), 'address_text', options['samples'])
+        if not note_keywords and not address_keywords:
+            self.stderr.write('No notes or addresses found, seed the database first (see "dummy_signals")')
+            return
+
+        if note_keywords:
+            self._benchmark('Notes, join and DISTINCT', self._notes_join, note_keywords, options['explain'])
+            self._benchmark('Notes, EXISTS', self._notes_exists, note_keywords, options['explain'])
+            self._benchmark('Notes, EXISTS full-text', self._notes_full_text, note_keywords, options['explain'])
+
+        if address_keywords:
+            self._benchmark('Address, contains', self._address_contains, address_keywords, options['explain'])
+            self._benchmark('Address, full-text', self._address_full_text, address_keywords, options['explain'])
@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Re-route all open Signals with the current routing rules, for example after the rules or the areas they use changed.
+
+The Signals are routed in chunks with bulk writes, see BulkRoutingService. Mails to the newly assigned departments
+and users are only sent when --send-mail is given.
+"""
+from django.core.management import BaseCommand
+
+from signals.apps.services.domain.bulk_routing import BulkRoutingService
+from signals.apps.signals.tasks import apply_routing_in_bulk
+
+
+class Command(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='Number of Signals routed per transaction.')
+        parser.add_argument('--send-mail', action='store_true', default=False,
+                            help='Send mails to the newly assigned departments and users.')
+        parser.add_argument('--async', action='store_true', default=False, dest='run_async',
+                            help='Route the Signals in a Celery task.')
+
+    def handle(self, *args, **options):
+        if options['run_async']:
+            apply_routing_in_bulk.delay(chunk_size=options['chunk_size'], send_mail=options['send_mail'])
+            self.stdout.write('Bulk routing task scheduled')
+            return
+
+        self.stdout.write('Re-routing open Signals ...')
+        report = BulkRoutingService(chunk_size=options['chunk_size'], send_mail=options['send_mail']).route()
+
+        self.stdout.write(f'Processed {report.processed} Signals in {report.seconds:.1f} seconds '
+                          f'({report.signals_per_second:.1f} Signals/second).')
+        self.stdout.write(f'Routed: {report.routed}, unchanged: {report.unchanged}, '
+                          f'no matching rule: {report.no_match}, skipped (locked): {report.locked}')
+        self.stdout.write('Done!')
@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('signals', '0201_alter_area_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ThrottleCounter',
+            fields=[
+                ('key', models.CharField(max_length=255, primary_key=True, serialize=False)),
+                ('current_window', models.BigIntegerField()),
+                ('current_count', models.PositiveIntegerField(default=0)),
+                ('previous_count', models.PositiveIntegerField(default=0)),
+                ('expires', models.FloatField(db_index=True)),
+            ],
+        ),
+    ]
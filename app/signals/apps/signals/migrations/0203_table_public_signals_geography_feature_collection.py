@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import migrations
+
+select_features = '''
+  SELECT
+    "signals_signal"."id",
+    "signals_signal"."uuid",
+    "signals_location"."geometrie" AS geometry,
+    "signals_status"."state" AS state,
+    scp."id" as parent_category_id,
+    "signals_category"."id" as child_category_id,
+    "signals_category"."is_public_accessible" as child_category_is_public_accessible,
+    "signals_signal"."created_at",
+    JSONB_BUILD_OBJECT(
+      'type', 'Feature',
+      'geometry', st_asgeojson("signals_location"."geometrie")::jsonb,
+      'properties', JSONB_BUILD_OBJECT(
+      'category', JSONB_BUILD_OBJECT(
+        'name', CASE WHEN "signals_category"."public_name" = '' THEN "signals_category"."name" WHEN "signals_category"."public_name" IS NULL THEN "signals_category"."name" ELSE "signals_category"."public_name" END,
+        'slug', "signals_category"."slug",
+        'parent', JSONB_BUILD_OBJECT(
+          'name', CASE WHEN scp."public_name" = ''  THEN scp."name" WHEN scp."public_name" IS NULL THEN scp."name" ELSE scp."public_name" END,
+          'slug', scp."slug"
+        )
+      ),
+      'created_at', "signals_signal"."created_at"
+    )
+    ) AS "feature"
+  FROM "signals_signal"
+    lEFT OUTER JOIN "signals_status" ON ("signals_signal"."status_id" = "signals_status"."id")
+    LEFT OUTER JOIN "signals_categoryassignment" ON ("signals_signal"."category_assignment_id" = "signals_categoryassignment"."id")
+    LEFT OUTER JOIN "signals_category" ON ("signals_categoryassignment"."category_id" = "signals_category"."id")
+    INNER JOIN "signals_location" ON ("signals_signal"."location_id" = "signals_location"."id")
+    LEFT OUTER JOIN "signals_category" scp ON ("signals_category"."parent_id" = scp."id")
+  WHERE NOT ("signals_status"."state" IN ('o', 'done external', 'a', 'reopen requested'))
+'''  # noqa
+
+create_table = f'''
+DROP MATERIALIZED VIEW IF EXISTS "public_signals_geography_feature_collection";
+
+CREATE TABLE "public_signals_geography_feature_collection" (
+  "id" bigint NOT NULL PRIMARY KEY,
+  "uuid" uuid NOT NULL,
+  "geometry" geometry(Point, 4326) NOT NULL,
+  "state" varchar(36) NOT NULL,
+  "parent_category_id" bigint NULL,
+  "child_category_id" bigint NULL,
+  "child_category_is_public_accessible" boolean NULL,
+  "created_at" timestamp with time zone NOT NULL,
+  "feature" jsonb NOT NULL
+);
+
+INSERT INTO "public_signals_geography_feature_collection" (
+  "id", "uuid", "geometry", "state", "parent_category_id", "child_category_id", "child_category_is_public_accessible",
+  "created_at", "feature"
+)
+{select_features};
+
+CREATE INDEX psgfc_geometry_id ON "public_signals_geography_feature_collection" USING GIST ("geometry");
+CREATE INDEX psgfc_state_key ON "public_signals_geography_feature_collection" ("state");
+CREATE INDEX psgfc_parent_category_id ON "public_signals_geography_feature_collection" ("parent_category_id");
+CREATE INDEX psgfc_child_category_id ON "public_signals_geography_feature_collection" ("child_category_id");
+'''
+
+drop_table = f'''
+DROP TABLE IF EXISTS "public_signals_geography_feature_collection";
+
+CREATE MATERIALIZED VIEW "public_signals_geography_feature_collection" AS
+{select_features};
+
+CREATE UNIQUE INDEX psgfc_id_uniq ON "public_signals_geography_feature_collection" ("id");
+CREATE INDEX psgfc_geometry_id ON "public_signals_geography_feature_collection" USING GIST ("geometry");
+CREATE INDEX psgfc_state_key ON "public_signals_geography_feature_collection" ("state");
+'''
+
+REFRESH_TASK = ('signals.apps.signals.tasks.refresh_database_view.'
+                'refresh_materialized_view_public_signals_geography_feature_collection')
+RECONCILE_TASK = ('signals.apps.signals.tasks.refresh_database_view.'
+                  'reconcile_public_signals_geography_feature_collection')
+
+
+def replace_refresh_task_with_reconcile_task(apps, schema_editor):
+    """
+    The table is kept up-to-date when signals change, the periodic full refresh (every 30 minutes) is replaced by a
+    nightly reconciliation that only writes the rows that drifted
+    """
+    CrontabSchedule = apps.get_model('django_celery_beat', 'CrontabSchedule')
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+
+    crontab, _ = CrontabSchedule.objects.get_or_create(minute='15', hour='3')
+    PeriodicTask.objects.filter(task=REFRESH_TASK).update(
+        task=RECONCILE_TASK,
+        name='Reconcile "public_signals_geography_feature_collection"',
+        crontab=crontab,
+    )
+
+
+def restore_refresh_task(apps, schema_editor):
+    CrontabSchedule = apps.get_model('django_celery_beat', 'CrontabSchedule')
+    PeriodicTask = apps.get_model('django_celery_beat', 'PeriodicTask')
+
+    crontab, _ = CrontabSchedule.objects.get_or_create(minute='*/30', hour='*/1')
+    PeriodicTask.objects.filter(task=RECONCILE_TASK).update(
+        task=REFRESH_TASK,
+        name='Refresh materialized view "public_signals_geography_feature_collection"',
+        crontab=crontab,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('signals', '0202_throttle_counter'),
+    ]
+
+    operations = [
+        # Replace the materialized view with a table (with the same name and columns), and a rollback option
+        migrations.RunSQL(create_table, reverse_sql=drop_table),
+        # Replace the periodic refresh with the reconciliation, and a rollback option
+        migrations.RunPython(replace_refresh_task_with_reconcile_task, reverse_code=restore_refresh_task),
+    ]
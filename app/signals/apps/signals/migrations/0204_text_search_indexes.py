@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Trigram indexes for the "icontains" filters on the address and the notes of a Signal (address_text and
+    note_keyword) and full-text indexes (Dutch) for their full-text search mode
+
+    The indexes are created concurrently, so the locations and notes can still be written while they are built.
+    """
+    atomic = False
+
+    dependencies = [
+        ('signals', '0203_table_public_signals_geography_feature_collection'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast('address_text', output_field=models.TextField())
+                    ),
+                    name='gin_trgm_ops'
+                ),
+                name='signals_loc_address_trgm'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='location',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector('address_text', config='dutch'),
+                name='signals_loc_address_fts'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='note',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper(
+                        django.db.models.functions.comparison.Cast('text', output_field=models.TextField())
+                    ),
+                    name='gin_trgm_ops'
+                ),
+                name='signals_note_text_trgm'
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='note',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.SearchVector('text', config='dutch'),
+                name='signals_note_text_fts'
+            ),
+        ),
+    ]
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from signals.apps.signals.models.area import Area, AreaType
 from signals.apps.signals.models.attachment import Attachment
 from signals.apps.signals.models.buurt import Buurt
@@ -39,6 +39,7 @@ from signals.apps.signals.models.status import Status
 from signals.apps.signals.models.status_message import StatusMessage, StatusMessageCategory
 from signals.apps.signals.models.status_message_template import StatusMessageTemplate
 from signals.apps.signals.models.stored_signal_filter import StoredSignalFilter
+from signals.apps.signals.models.throttle_counter import ThrottleCounter
 from signals.apps.signals.models.type import Type
 
 # Satisfy Flake8 (otherwise complaints about unused imports):
@@ -80,6 +81,7 @@ __all__ = [
     'Status',
     'StatusMessageTemplate',
     'StoredSignalFilter',
+    'ThrottleCounter',
     'Type',
     'RoutingExpression',
     'DeletedSignal',
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import math
+
+from django.contrib.gis.db.models import PointField
+from django.contrib.gis.geos import GEOSGeometry, Polygon
+from django.db.models import BooleanField, F, Func, Q, Value
+from django.db.models.functions import Cast
+
+# Smallest number of meters per degree of latitude (at the equator), using the
+# smallest value makes sure the bounding box is never too small.
+METERS_PER_DEGREE = 110_574
+
+
+class DWithin(Func):
+    """
+    ST_DWithin on geography casts, the distance is given in meters
+
+    Note that the geography cast on the column cannot use the GiST index on the
+    geometry column, always combine it with a bounding box prefilter (see
+    `proximity_condition`).
+    """
+    function = 'ST_DWithin'
+    output_field = BooleanField()
+
+    def __init__(self, expression, geometrie, distance, **extra):
+        geography = PointField(geography=True, srid=geometrie.srid)
+        super().__init__(
+            Cast(expression, output_field=geography),
+            Cast(Value(geometrie, output_field=PointField(srid=geometrie.srid)), output_field=geography),
+            Value(distance),
+            **extra
+        )
+
+
+def bbox_around(geometrie: GEOSGeometry, distance: int | float) -> Polygon:
+    """
+    Returns a bounding box (in WGS84 degrees) that contains every point within
+    the given distance (in meters) of the given point
+    """
+    delta_lat = distance / METERS_PER_DEGREE
+    delta_lon = distance / (METERS_PER_DEGREE * max(math.cos(math.radians(abs(geometrie.y) + delta_lat)), 0.01))
+
+    bbox = Polygon.from_bbox((
+        geometrie.x - delta_lon,
+        geometrie.y - delta_lat,
+        geometrie.x + delta_lon,
+        geometrie.y + delta_lat,
+    ))
+    bbox.srid = geometrie.srid
+    return bbox
+
+
+def proximity_condition(field_name: str, geometrie: GEOSGeometry, distance: int | float) -> Q:
+    """
+    Index friendly "within distance (in meters)" condition for the given
+    geometry field
+
+    The bounding box overlap (&&) can be answered by the GiST index on the
+    geometry column, the exact ST_DWithin check on the geography cast is only
+    performed for the rows that pass the bounding box.
+    """
+    return Q(**{f'{field_name}__bboverlaps': bbox_around(geometrie, distance)}) & Q(
+        DWithin(F(field_name), geometrie, distance)
+    )
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+"""
+Index friendly text search conditions, the expressions of the conditions and of the indexes are built by the same
+functions so the indexes can be used
+"""
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchQuery, SearchVector, SearchVectorExact
+from django.db.models import TextField
+from django.db.models.functions import Cast, Upper
+
+TEXT_SEARCH_CONFIG = 'dutch'
+
+
+def search_vector(field_name: str) -> SearchVector:
+    return SearchVector(field_name, config=TEXT_SEARCH_CONFIG)
+
+
+def search_query(value: str) -> SearchQuery:
+    """
+    A query in the syntax of web search engines: words (stemmed), "quoted phrases", OR and -excluded words
+    """
+    return SearchQuery(value, config=TEXT_SEARCH_CONFIG, search_type='websearch')
+
+
+def full_text_condition(field_name: str, value: str) -> SearchVectorExact:
+    """
+    Full-text search condition (to_tsvector(...) @@ websearch_to_tsquery(...)) for the given text field, can be
+    answered by the index created with `full_text_index`
+    """
+    return SearchVectorExact(search_vector(field_name), search_query(value))
+
+
+def full_text_index(field_name: str, name: str) -> GinIndex:
+    return GinIndex(search_vector(field_name), name=name)
+
+
+def trigram_index(field_name: str, name: str) -> GinIndex:
+    """
+    pg_trgm index for "icontains" lookups on the given text field
+
+    Django (on PostgreSQL) translates icontains to UPPER("field"::text) LIKE UPPER('%value%'), a leading wildcard
+    cannot use a B-tree index but a trigram index on the same expression can.
+    """
+    return GinIndex(OpClass(Upper(Cast(field_name, output_field=TextField())), name='gin_trgm_ops'), name=name)
@@ -1,12 +1,14 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2025 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import copy
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.gis.db import models
 from django.contrib.gis.gdal import CoordTransform, SpatialReference
 
+from signals.apps.signals.models.functions.text_search import full_text_index, trigram_index
 from signals.apps.signals.models.mixins import CreatedUpdatedModel
+from signals.apps.signals.querysets import LocationQuerySet
 from signals.apps.signals.utils.location import AddressFormatter
 
 STADSDEEL_CENTRUM = 'A'
@@ -74,6 +76,14 @@ class Location(CreatedUpdatedModel):
 
     history_log = GenericRelation('history.Log', object_id_field='object_pk')
 
+    objects = LocationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            trigram_index('address_text', name='signals_loc_address_trgm'),
+            full_text_index('address_text', name='signals_loc_address_fts'),
+        ]
+
     @property
     def short_address_text(self):
         # openbare_ruimte huisnummerhuiletter-huisnummer_toevoeging
@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.gis.db import models
 
+from signals.apps.signals.models.functions.text_search import full_text_index, trigram_index
 from signals.apps.signals.models.mixins import CreatedUpdatedModel
 
 
@@ -21,4 +22,6 @@ class Note(CreatedUpdatedModel):
         ordering = ('-created_at',)
         indexes = [
             models.Index(fields=['created_at']),
+            trigram_index('text', name='signals_note_text_trgm'),
+            full_text_index('text', name='signals_note_text_fts'),
         ]
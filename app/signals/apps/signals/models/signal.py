@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2023 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam, Vereniging van Nederlandse Gemeenten
 
 import uuid
 
@@ -171,6 +171,10 @@ class Signal(CreatedUpdatedModel):
         if not settings.FEATURE_FLAGS.get('REPORTER_MAIL_CONTACT_FEEDBACK_ALLOWS_CONTACT_ENABLED', True):
             return True
 
+        if hasattr(self, 'feedback_allows_contact'):
+            # Annotated (see SignalQuerySet.annotate_feedback_allows_contact)
+            return self.feedback_allows_contact
+
         feedback_qs = self.feedback.filter(submitted_at__isnull=False)
         if not feedback_qs.exists():
             return True
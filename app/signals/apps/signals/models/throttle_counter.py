@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.db import models
+from django.db import connection
+
+
+class ThrottleCounterManager(models.Manager):
+    def count_request(self, key: str, window: int, expires: float) -> tuple[int, int]:
+        """
+        Counts a request of the client with the key in the window, returns the (current, previous) count
+
+        The counter is created, moved to the window and increased in one statement, so concurrent requests of the same
+        client are all counted. When the counter was last used in the window before, its count becomes the previous
+        count. When it was last used before that, the previous count is 0.
+        """
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(f"""
+                INSERT INTO {table} AS counter (key, current_window, current_count, previous_count, expires)
+                VALUES (%(key)s, %(window)s, 1, 0, %(expires)s)
+                ON CONFLICT (key) DO UPDATE SET
+                    current_count = CASE
+                        WHEN counter.current_window >= EXCLUDED.current_window THEN counter.current_count + 1
+                        ELSE 1
+                    END,
+                    previous_count = CASE
+                        WHEN counter.current_window >= EXCLUDED.current_window THEN counter.previous_count
+                        WHEN counter.current_window = EXCLUDED.current_window - 1 THEN counter.current_count
+                        ELSE 0
+                    END,
+                    current_window = GREATEST(counter.current_window, EXCLUDED.current_window),
+                    expires = GREATEST(counter.expires, EXCLUDED.expires)
+                RETURNING current_count, previous_count
+            """, {'key': key, 'window': window, 'expires': expires})
+            return cursor.fetchone()
+
+    def uncount_request(self, key: str, window: int) -> None:
+        self.filter(key=key, current_window=window, current_count__gt=0).update(
+            current_count=models.F('current_count') - 1
+        )
+
+    def delete_expired(self, now: float) -> None:
+        self.filter(expires__lt=now).delete()
+
+
+class ThrottleCounter(models.Model):
+    """
+    The number of requests of a client in the current and the previous window of a SlidingWindowRateThrottle (see
+    signals.throttling), used instead of counters in the cache when the cache is the database cache
+
+    The timestamps (current_window and expires) are in the time of the throttle timer.
+    """
+    key = models.CharField(max_length=255, primary_key=True)
+    current_window = models.BigIntegerField()
+    current_count = models.PositiveIntegerField(default=0)
+    previous_count = models.PositiveIntegerField(default=0)
+    expires = models.FloatField(db_index=True)
+
+    objects = ThrottleCounterManager()
@@ -1,26 +1,28 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2022 Gemeente Amsterdam
+# Copyright (C) 2022 - 2026 Gemeente Amsterdam
 from django.contrib.gis.db import models
 
 
 class PublicSignalGeographyFeature(models.Model):
     """
-    A materialized view is used to query information for the public geography endpoint
+    A table, kept up-to-date by the PublicSignalGeographyFeatureService, is used to query information for the public
+    geography endpoint
 
-    Migration:
+    Migrations:
         api/app/signals/apps/signals/migrations/0164_materialized_view_public_signals_geography_feature_collection.py
+        api/app/signals/apps/signals/migrations/0203_table_public_signals_geography_feature_collection.py
     """
     id = models.BigIntegerField(primary_key=True)
     uuid = models.UUIDField()
     geometry = models.PointField()
     state = models.CharField(max_length=36)
-    child_category_id = models.BigIntegerField()
-    child_category_is_public_accessible = models.BooleanField()
-    parent_category_id = models.BigIntegerField()
+    child_category_id = models.BigIntegerField(null=True)
+    child_category_is_public_accessible = models.BooleanField(null=True)
+    parent_category_id = models.BigIntegerField(null=True)
     created_at = models.DateTimeField()
     feature = models.JSONField()
 
-    # No changes to this database view please!
+    # No changes through the ORM please, see the PublicSignalGeographyFeatureService
     def save(self, *args, **kwargs):
         raise NotImplementedError
 
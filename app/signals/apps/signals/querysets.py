@@ -1,9 +1,19 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
-from django.db.models import Count, F, Max, QuerySet
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
+from django.db.models import Count, F, Max, OuterRef, QuerySet, Subquery, Value
+from django.db.models.functions import Coalesce
 
 from signals.apps.services.domain.permissions.signal import SignalPermissionService
 from signals.apps.services.domain.permissions.utils import make_permission_condition_for_user
+from signals.apps.signals.models.functions.dwithin import proximity_condition
+
+
+class LocationQuerySet(QuerySet):
+    def near(self, geometrie, radius):
+        """
+        Locations within the given radius (in meters) of the given point
+        """
+        return self.filter(proximity_condition('geometrie', geometrie, radius))
 
 
 class SignalQuerySet(QuerySet):
@@ -16,6 +26,30 @@ class SignalQuerySet(QuerySet):
 
         return self.all()
 
+    def near(self, geometrie, radius):
+        """
+        Signals with a (current) location within the given radius (in meters) of the given point
+        """
+        return self.filter(proximity_condition('location__geometrie', geometrie, radius))
+
+    def annotate_feedback_allows_contact(self):
+        """
+        Annotate the outcome of Signal.allows_contact (the latest submitted feedback decides, no feedback allows
+        contact), so serializing a list of Signals does not query the feedback of every Signal
+        """
+        from signals.apps.feedback.models import Feedback
+
+        latest_allows_contact = Feedback.objects.filter(
+            _signal_id=OuterRef('pk'),
+            submitted_at__isnull=False,
+        ).order_by(
+            '-submitted_at'
+        ).values(
+            'allows_contact'
+        )[:1]
+
+        return self.annotate(feedback_allows_contact=Coalesce(Subquery(latest_allows_contact), Value(True)))
+
     def filter_reporter(self, email=None, phone=None):
         if not email and not phone:
             raise Exception('')
@@ -1,17 +1,42 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
 from signals.apps.history.services.signal_log import signal_update_requested
+from signals.apps.services.domain.dsl import SignalDslService
+from signals.apps.services.domain.permissions.snapshot import PermissionSnapshotService
+from signals.apps.services.domain.public_signal_geography import PublicSignalGeographyFeatureService
+from signals.apps.services.domain.stored_signal_filter_counts import StoredSignalFilterCountService
 from signals.apps.signals import tasks
 from signals.apps.signals.managers import (
+    add_attachment,
+    create_child,
     create_initial,
+    create_note,
     update_category_assignment,
     update_location,
-    update_status
+    update_priority,
+    update_reporter,
+    update_signal_departments,
+    update_status,
+    update_type,
+    update_user_assignment
 )
+from signals.apps.signals.models.area import Area, AreaType
+from signals.apps.signals.models.category import Category
+from signals.apps.signals.models.category_departments import CategoryDepartment
+from signals.apps.signals.models.expression import Expression, ExpressionType
+from signals.apps.signals.models.routing_expression import RoutingExpression
 from signals.apps.signals.models.signal import Signal
+from signals.apps.signals.utils.area_index import AreaIndex
+from signals.apps.users.models import Profile
+
+User = get_user_model()
 
 
 @receiver(create_initial, dispatch_uid='signals_create_initial')
@@ -44,3 +69,102 @@ def update_status_handler(sender, signal_obj, status, prev_status, *args, **kwar
 @receiver(signal_update_requested, dispatch_uid='signals_update_requested')
 def signal_update_updated_at(sender, signal_instance: Signal, **kwargs) -> None:
     signal_instance.save(update_fields=['updated_at'])
+
+
+@receiver(post_save, sender=CategoryDepartment, dispatch_uid='permission_snapshot_category_department_saved')
+@receiver(post_delete, sender=CategoryDepartment, dispatch_uid='permission_snapshot_category_department_deleted')
+@receiver(m2m_changed, sender=CategoryDepartment, dispatch_uid='permission_snapshot_category_departments_changed')
+@receiver(m2m_changed, sender=Profile.departments.through, dispatch_uid='permission_snapshot_profile_departments')
+@receiver(m2m_changed, sender=User.groups.through, dispatch_uid='permission_snapshot_user_groups')
+@receiver(m2m_changed, sender=User.user_permissions.through, dispatch_uid='permission_snapshot_user_permissions')
+@receiver(m2m_changed, sender=Group.permissions.through, dispatch_uid='permission_snapshot_group_permissions')
+def permission_snapshot_invalidation_handler(sender, **kwargs):
+    """
+    Changes to the category departments, the departments of a user or the roles of a user invalidate the cached
+    permission snapshots (used by the "filter_for_user" of the SignalQuerySet), again when the transaction is committed
+    so other processes cannot keep snapshots built from the data before the commit
+    """
+    action = kwargs.get('action')
+    if action is None or action.startswith('post_'):
+        PermissionSnapshotService.invalidate()
+        transaction.on_commit(PermissionSnapshotService.invalidate)
+
+
+@receiver(post_save, sender=Area, dispatch_uid='area_index_area_saved')
+@receiver(post_delete, sender=Area, dispatch_uid='area_index_area_deleted')
+@receiver(post_save, sender=AreaType, dispatch_uid='area_index_area_type_saved')
+@receiver(post_delete, sender=AreaType, dispatch_uid='area_index_area_type_deleted')
+def area_index_invalidation_handler(sender, **kwargs):
+    """
+    Changes to the areas invalidate the in-process area indexes (used to determine the area of a location), again when
+    the transaction is committed so other processes cannot keep indexes built from the data before the commit
+    """
+    AreaIndex.invalidate()
+    transaction.on_commit(AreaIndex.invalidate)
+
+
+@receiver(post_save, sender=RoutingExpression, dispatch_uid='routing_table_routing_expression_saved')
+@receiver(post_delete, sender=RoutingExpression, dispatch_uid='routing_table_routing_expression_deleted')
+@receiver(post_save, sender=Expression, dispatch_uid='routing_table_expression_saved')
+@receiver(post_delete, sender=Expression, dispatch_uid='routing_table_expression_deleted')
+@receiver(post_save, sender=ExpressionType, dispatch_uid='routing_table_expression_type_saved')
+@receiver(post_save, sender=User, dispatch_uid='routing_table_user_saved')
+@receiver(m2m_changed, sender=Profile.departments.through, dispatch_uid='routing_table_profile_departments')
+def routing_table_invalidation_handler(sender, **kwargs):
+    """
+    Changes to the routing rules, their expressions or the users of the rules invalidate the compiled routing tables,
+    again when the transaction is committed so other processes cannot keep tables built from the data before the commit
+    """
+    if sender is User and kwargs.get('update_fields') == frozenset({'last_login'}):
+        return  # Logging in does not change the routing
+
+    action = kwargs.get('action')
+    if action is None or action.startswith('post_'):
+        SignalDslService.invalidate_routing_table()
+        transaction.on_commit(SignalDslService.invalidate_routing_table)
+
+
+@receiver(create_initial, dispatch_uid='public_signal_geography_create_initial')
+@receiver(update_status, dispatch_uid='public_signal_geography_update_status')
+@receiver(update_location, dispatch_uid='public_signal_geography_update_location')
+@receiver(update_category_assignment, dispatch_uid='public_signal_geography_update_category_assignment')
+def public_signal_geography_signal_handler(sender, signal_obj, **kwargs):
+    """
+    Keep the feature of the Signal on the public map up-to-date
+    """
+    PublicSignalGeographyFeatureService.sync_signals([signal_obj.pk])
+
+
+@receiver(post_delete, sender=Signal, dispatch_uid='public_signal_geography_signal_deleted')
+def public_signal_geography_signal_deleted_handler(sender, instance, **kwargs):
+    PublicSignalGeographyFeatureService.sync_signals([instance.pk])
+
+
+@receiver(post_save, sender=Category, dispatch_uid='public_signal_geography_category_saved')
+def public_signal_geography_category_saved_handler(sender, instance, created, **kwargs):
+    """
+    The (public) name, slug and public accessibility of the category are part of the features on the public map
+    """
+    if not created:
+        PublicSignalGeographyFeatureService.sync_category(instance.pk)
+
+
+@receiver(create_initial, dispatch_uid='stored_signal_filter_counts_create_initial')
+@receiver(create_child, dispatch_uid='stored_signal_filter_counts_create_child')
+@receiver(add_attachment, dispatch_uid='stored_signal_filter_counts_add_attachment')
+@receiver(update_location, dispatch_uid='stored_signal_filter_counts_update_location')
+@receiver(update_status, dispatch_uid='stored_signal_filter_counts_update_status')
+@receiver(update_category_assignment, dispatch_uid='stored_signal_filter_counts_update_category_assignment')
+@receiver(update_reporter, dispatch_uid='stored_signal_filter_counts_update_reporter')
+@receiver(update_priority, dispatch_uid='stored_signal_filter_counts_update_priority')
+@receiver(create_note, dispatch_uid='stored_signal_filter_counts_create_note')
+@receiver(update_type, dispatch_uid='stored_signal_filter_counts_update_type')
+@receiver(update_user_assignment, dispatch_uid='stored_signal_filter_counts_update_user_assignment')
+@receiver(update_signal_departments, dispatch_uid='stored_signal_filter_counts_update_signal_departments')
+@receiver(post_delete, sender=Signal, dispatch_uid='stored_signal_filter_counts_signal_deleted')
+def stored_signal_filter_counts_invalidation_handler(sender, **kwargs):
+    """
+    Any change to a Signal can change the outcome of the stored filters, so the cached counts are invalidated once the
+    change is committed (counts computed by other processes before the commit would otherwise be cached again)
+    """
+    transaction.on_commit(StoredSignalFilterCountService.invalidate)
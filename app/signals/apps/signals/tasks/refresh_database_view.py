@@ -1,25 +1,28 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import logging
 
-from django.db import connection
-
+from signals.apps.services.domain.public_signal_geography import PublicSignalGeographyFeatureService
 from signals.celery import app
 
 log = logging.getLogger(__name__)
 
 
 @app.task
-def refresh_materialized_view_public_signals_geography_feature_collection():
+def reconcile_public_signals_geography_feature_collection():
     """
-    A task to refresh the materialized view that contains the data for the public/v1/signals/geography endpoint
+    A task to repair drift in the table that contains the data for the public/v1/signals/geography endpoint, the
+    table is kept up-to-date when signals change
     """
-    refresh_query = 'REFRESH MATERIALIZED VIEW CONCURRENTLY "public_signals_geography_feature_collection";'
+    upserted, deleted = PublicSignalGeographyFeatureService.reconcile()
+    if upserted or deleted:
+        log.warning(f'Reconciled the public signals geography features: {upserted} upserted, {deleted} deleted')
 
-    cursor = connection.cursor()
-    try:
-        cursor.execute(refresh_query)
-    except Exception as e:
-        log.error(f'Failed to execute the query: {refresh_query}', exc_info=e)
-    finally:
-        cursor.close()
+
+@app.task
+def refresh_materialized_view_public_signals_geography_feature_collection():
+    """
+    Deprecated, the materialized view was replaced by a table that is kept up-to-date. Kept for periodic tasks that
+    were not migrated.
+    """
+    reconcile_public_signals_geography_feature_collection()
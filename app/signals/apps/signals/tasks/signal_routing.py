@@ -1,9 +1,10 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2023 Gemeente Amsterdam
+# Copyright (C) 2023 - 2026 Gemeente Amsterdam
 import logging
 
 from django.db.utils import OperationalError
 
+from signals.apps.services.domain.bulk_routing import BulkRoutingService
 from signals.apps.services.domain.dsl import SignalDslService
 from signals.apps.signals.models.signal import Signal
 from signals.celery import app
@@ -16,3 +17,13 @@ log = logging.getLogger(__name__)
 def apply_routing(signal_id):
     signal = Signal.objects.get(pk=signal_id)
     SignalDslService().process_routing_rules(signal)
+
+
+@app.task
+def apply_routing_in_bulk(chunk_size=500, send_mail=False):
+    """
+    Re-route all open Signals with the current routing rules
+    """
+    report = BulkRoutingService(chunk_size=chunk_size, send_mail=send_mail).route()
+    log.info(f'Bulk routing done. {report}')
+    return report.as_dict()
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.test import TestCase
+
+from signals.apps.signals.factories import AreaFactory, AreaTypeFactory
+from signals.apps.signals.utils.area_index import AreaIndex
+from signals.apps.signals.utils.location import _get_area
+
+
+class TestAreaIndex(TestCase):
+    def setUp(self):
+        self.area_type = AreaTypeFactory.create(code='test-area-type')
+        self.other_area_type = AreaTypeFactory.create(code='other-area-type')
+
+        self.west = AreaFactory.create(code='west', _type=self.area_type, geometry=MultiPolygon(
+            [Polygon.from_bbox((4.80, 52.30, 4.90, 52.40))]
+        ))
+        self.east = AreaFactory.create(code='east', _type=self.area_type, geometry=MultiPolygon(
+            [Polygon.from_bbox((4.90, 52.30, 5.00, 52.40))]
+        ))
+        self.other = AreaFactory.create(code='other', _type=self.other_area_type, geometry=MultiPolygon(
+            [Polygon.from_bbox((4.80, 52.30, 5.00, 52.40))]
+        ))
+
+    def test_find(self):
+        self.assertEqual(_get_area(Point(4.85, 52.35, srid=4326), 'test-area-type'), self.west)
+        self.assertEqual(_get_area(Point(4.95, 52.35, srid=4326), 'test-area-type'), self.east)
+        self.assertEqual(_get_area(Point(4.95, 52.35, srid=4326), 'other-area-type'), self.other)
+        self.assertIsNone(_get_area(Point(5.05, 52.35, srid=4326), 'test-area-type'))
+        self.assertIsNone(_get_area(Point(4.85, 52.35, srid=4326), 'unknown-area-type'))
+
+    def test_find_without_area_type(self):
+        # Same as the database, the first Area in the ordering of the Area model (by AreaType code, then code)
+        self.assertEqual(_get_area(Point(4.95, 52.35, srid=4326)), self.other)
+
+    def test_no_queries_for_lookups(self):
+        point = Point(4.85, 52.35, srid=4326)
+        _get_area(point, 'test-area-type')
+
+        with self.assertNumQueries(0):  # The version of the index was read less than a second ago
+            self.assertEqual(_get_area(point, 'test-area-type'), self.west)
+
+    @mock.patch('signals.apps.signals.utils.area_index.time.monotonic')
+    def test_version_checked_once_per_interval(self, monotonic):
+        point = Point(4.85, 52.35, srid=4326)
+        monotonic.return_value = 1000.0
+        _get_area(point, 'test-area-type')
+
+        # Another process replaced the version, it is noticed after the interval
+        AreaIndex.cache_version.replace()
+        with self.assertNumQueries(0):
+            _get_area(point, 'test-area-type')
+
+        monotonic.return_value = 1000.0 + AreaIndex.VERSION_CHECK_INTERVAL
+        with self.assertNumQueries(2):  # The version, and the areas to rebuild the index
+            self.assertEqual(_get_area(point, 'test-area-type'), self.west)
+
+    def test_rebuilt_when_areas_change(self):
+        point = Point(4.85, 52.35, srid=4326)
+        self.assertEqual(_get_area(point, 'test-area-type'), self.west)
+
+        self.west.delete()
+        self.assertIsNone(_get_area(point, 'test-area-type'))
+
+        self.east.geometry = MultiPolygon([Polygon.from_bbox((4.80, 52.30, 5.00, 52.40))])
+        self.east.save()
+        self.assertEqual(_get_area(point, 'test-area-type'), self.east)
+
+    def test_invalidate(self):
+        version = AreaIndex.get_version()
+        AreaIndex.invalidate()
+        self.assertNotEqual(version, AreaIndex.get_version())
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from unittest import mock
+
+from django.contrib.gis import geos
+from django.core.management import call_command
+from django.test import TestCase
+
+from signals.apps.history.models import Log
+from signals.apps.services.domain.bulk_routing import BulkRoutingReport, BulkRoutingService
+from signals.apps.services.domain.stored_signal_filter_counts import StoredSignalFilterCountService
+from signals.apps.signals.factories import (
+    AreaFactory,
+    DepartmentFactory,
+    ExpressionFactory,
+    ExpressionTypeFactory,
+    RoutingExpressionFactory,
+    SignalFactory
+)
+from signals.apps.signals.models import Signal
+from signals.apps.signals.workflow import AFGEHANDELD, AFGEHANDELD_EXTERN
+from signals.apps.users.factories import UserFactory
+
+
+class TestBulkRouting(TestCase):
+    def setUp(self):
+        geometry = geos.MultiPolygon([geos.Polygon.from_bbox([4.877157, 52.357204, 4.929686, 52.385239])], srid=4326)
+        self.area = AreaFactory.create(geometry=geometry, name='centrum', code='centrum', _type__name='gebied',
+                                       _type__code='stadsdeel')
+
+        self.department = DepartmentFactory.create()
+        self.user = UserFactory.create()
+        self.user.profile.departments.add(self.department)
+
+        expression = ExpressionFactory.create(
+            _type=ExpressionTypeFactory.create(name='routing'),
+            name='centrum',
+            code=f'location in areas."{self.area._type.name}"."{self.area.code}"'
+        )
+        RoutingExpressionFactory.create(_expression=expression, _department=self.department, _user=self.user,
+                                        is_active=True, order=1)
+
+        self.inside = SignalFactory.create_batch(5, location__geometrie=geos.Point(4.88, 52.36))
+        self.outside = SignalFactory.create_batch(2, location__geometrie=geos.Point(1.0, 1.0))
+        self.closed = SignalFactory.create(location__geometrie=geos.Point(4.88, 52.36), status__state=AFGEHANDELD)
+        self.closed_extern = SignalFactory.create(location__geometrie=geos.Point(4.88, 52.36),
+                                                  status__state=AFGEHANDELD_EXTERN)
+
+    def test_route(self):
+        report = BulkRoutingService(chunk_size=2).route()
+
+        self.assertEqual(report.processed, 7)
+        self.assertEqual(report.routed, 5)
+        self.assertEqual(report.no_match, 2)
+        self.assertEqual(report.unchanged, 0)
+        self.assertEqual(report.locked, 0)
+
+        for signal in self.inside:
+            signal.refresh_from_db()
+            self.assertEqual(list(signal.routing_assignment.departments.all()), [self.department])
+            self.assertEqual(signal.user_assignment.user, self.user)
+            self.assertEqual(Log.objects.filter(_signal=signal, extra=self.department.code).count(), 1)
+            self.assertEqual(Log.objects.filter(_signal=signal, extra=self.user.email).count(), 1)
+
+        for signal in [*self.outside, self.closed, self.closed_extern]:
+            signal.refresh_from_db()
+            self.assertIsNone(signal.routing_assignment)
+
+    def test_route_reindexes_and_invalidates_counts(self):
+        with mock.patch('signals.apps.services.domain.bulk_routing.indexer') as mocked_indexer, \
+                mock.patch.object(StoredSignalFilterCountService, 'invalidate') as mocked_invalidate, \
+                self.captureOnCommitCallbacks(execute=True):
+            BulkRoutingService(chunk_size=10).route()
+
+        mocked_indexer.add.assert_called_once_with([signal.pk for signal in self.inside])
+        mocked_invalidate.assert_called_once_with()
+
+    def test_deleted_signals_are_not_counted_as_locked(self):
+        service = BulkRoutingService()
+        chunk_ids = [signal.pk for signal in self.inside]
+        Signal.objects.filter(pk=chunk_ids[0]).delete()
+
+        report = BulkRoutingReport()
+        service._route_chunk(chunk_ids, service.dsl_service.get_routing_table(), {}, {self.user.email: self.user},
+                             report)
+
+        self.assertEqual(report.processed, 4)
+        self.assertEqual(report.routed, 4)
+        self.assertEqual(report.locked, 0)
+
+    def test_route_again(self):
+        BulkRoutingService().route()
+        report = BulkRoutingService().route()
+
+        self.assertEqual(report.routed, 0)
+        self.assertEqual(report.unchanged, 5)
+        self.assertEqual(Log.objects.filter(extra=self.department.code).count(), 5)
+
+    def test_command(self):
+        call_command('reroute_signals', '--chunk-size', '3')
+
+        for signal in self.inside:
+            signal.refresh_from_db()
+            self.assertEqual(list(signal.routing_assignment.departments.all()), [self.department])
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.db import connection
+from django.test import TestCase
+
+from signals.apps.services.domain.public_signal_geography import PublicSignalGeographyFeatureService
+from signals.apps.signals.factories import CategoryFactory, SignalFactoryValidLocation
+from signals.apps.signals.models import Signal
+from signals.apps.signals.models.views.signal import PublicSignalGeographyFeature
+from signals.apps.signals.workflow import GEANNULEERD
+
+
+class TestPublicSignalGeographyFeatureService(TestCase):
+    def setUp(self):
+        self.category = CategoryFactory.create(public_name='Publieke naam', is_public_accessible=True)
+        self.signal = SignalFactoryValidLocation.create(category_assignment__category=self.category)
+        self.other_signal = SignalFactoryValidLocation.create(category_assignment__category=self.category)
+
+    def test_sync_signals(self):
+        self.assertEqual(PublicSignalGeographyFeatureService.sync_signals([self.signal.pk]), (1, 0))
+        self.assertEqual(PublicSignalGeographyFeatureService.sync_signals([self.signal.pk]), (0, 0))  # Unchanged
+
+        feature = PublicSignalGeographyFeature.objects.get(pk=self.signal.pk)
+        self.assertEqual(feature.child_category_id, self.category.pk)
+        self.assertEqual(feature.feature['properties']['category']['name'], 'Publieke naam')
+        self.assertFalse(PublicSignalGeographyFeature.objects.filter(pk=self.other_signal.pk).exists())
+
+        Signal.actions.update_status({'state': GEANNULEERD, 'text': 'Geannuleerd'}, self.signal)
+        self.assertEqual(PublicSignalGeographyFeatureService.sync_signals([self.signal.pk]), (0, 1))
+        self.assertFalse(PublicSignalGeographyFeature.objects.filter(pk=self.signal.pk).exists())
+
+    def test_category_changes(self):
+        PublicSignalGeographyFeatureService.reconcile()
+
+        self.category.public_name = 'Andere publieke naam'
+        self.category.save()  # The features of the category are synchronized when it is saved
+
+        for feature in PublicSignalGeographyFeature.objects.all():
+            self.assertEqual(feature.feature['properties']['category']['name'], 'Andere publieke naam')
+
+    def test_signal_deleted(self):
+        PublicSignalGeographyFeatureService.reconcile()
+
+        self.signal.delete()
+        self.assertEqual(list(PublicSignalGeographyFeature.objects.values_list('pk', flat=True)),
+                         [self.other_signal.pk])
+
+    def test_reconcile(self):
+        self.assertEqual(PublicSignalGeographyFeatureService.reconcile(), (2, 0))
+        self.assertEqual(PublicSignalGeographyFeatureService.reconcile(), (0, 0))
+
+        # Drift
+        with connection.cursor() as cursor:
+            cursor.execute(f'UPDATE "{PublicSignalGeographyFeature._meta.db_table}" SET "state" = %s WHERE "id" = %s',
+                           ['drift', self.signal.pk])
+            cursor.execute(f'INSERT INTO "{PublicSignalGeographyFeature._meta.db_table}" '
+                           'SELECT 0, "uuid", "geometry", "state", "parent_category_id", "child_category_id", '
+                           '"child_category_is_public_accessible", "created_at", "feature" '
+                           f'FROM "{PublicSignalGeographyFeature._meta.db_table}" WHERE "id" = %s',
+                           [self.other_signal.pk])
+
+        self.assertEqual(PublicSignalGeographyFeatureService.reconcile(), (1, 1))
+        self.assertEqual(PublicSignalGeographyFeature.objects.get(pk=self.signal.pk).state, self.signal.status.state)
+        self.assertFalse(PublicSignalGeographyFeature.objects.filter(pk=0).exists())
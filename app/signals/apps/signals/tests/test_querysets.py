@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from django.contrib.gis.geos import Point
+from django.test import TestCase
+
+from signals.apps.signals.factories import SignalFactory
+from signals.apps.signals.models import Location, Signal
+from signals.apps.signals.models.functions.dwithin import bbox_around
+from signals.apps.signals.tests.valid_locations import ARENA, STADHUIS
+
+
+class TestNearQuerySet(TestCase):
+    def setUp(self):
+        self.stadhuis_point = Point(STADHUIS['lon'], STADHUIS['lat'], srid=4326)
+
+        # Roughly 40 meters north and 80 meters east of the stadhuis
+        self.signal_40m = SignalFactory.create(location__geometrie=Point(STADHUIS['lon'], STADHUIS['lat'] + 0.00036))
+        self.signal_80m = SignalFactory.create(location__geometrie=Point(STADHUIS['lon'] + 0.00118, STADHUIS['lat']))
+        self.signal_arena = SignalFactory.create(location__geometrie=Point(ARENA['lon'], ARENA['lat']))
+
+    def test_signals_near(self):
+        self.assertEqual(set(Signal.objects.near(self.stadhuis_point, 50).values_list('id', flat=True)),
+                         {self.signal_40m.id})
+        self.assertEqual(set(Signal.objects.near(self.stadhuis_point, 100).values_list('id', flat=True)),
+                         {self.signal_40m.id, self.signal_80m.id})
+        self.assertFalse(Signal.objects.near(self.stadhuis_point, 10).exists())
+
+    def test_locations_near(self):
+        self.assertEqual(set(Location.objects.near(self.stadhuis_point, 50).values_list('id', flat=True)),
+                         {self.signal_40m.location.id})
+
+    def test_bbox_around_contains_radius(self):
+        bbox = bbox_around(self.stadhuis_point, 100)
+        self.assertEqual(bbox.srid, 4326)
+        self.assertTrue(bbox.contains(self.signal_40m.location.geometrie))
+        self.assertTrue(bbox.contains(self.signal_80m.location.geometrie))
+        self.assertFalse(bbox.contains(self.signal_arena.location.geometrie))
+
+    def test_near_uses_bounding_box(self):
+        sql = str(Signal.objects.near(self.stadhuis_point, 50).query)
+        self.assertIn('&&', sql)
+        self.assertIn('ST_DWithin', sql)
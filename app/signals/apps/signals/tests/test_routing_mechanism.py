@@ -1,8 +1,11 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2021 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Vereniging van Nederlandse Gemeenten, Gemeente Amsterdam
+from unittest.mock import patch
+
 from django.contrib.gis import geos
 from django.test import TestCase
 
+from signals.apps.dsl.prepared_geometry import PreparedMultiPolygon
 from signals.apps.services.domain.dsl import SignalContext, SignalDslService
 from signals.apps.signals.factories import (
     AreaFactory,
@@ -180,3 +183,71 @@ class TestRoutingMechanism(TestCase):
         self.assertTrue("value 3.1" in ctx['key3_list'])
         self.assertTrue("value 3.2" in ctx['key3_list'])
         self.assertEqual(ctx['key4'], "value 4")
+
+    def test_context_areas(self):
+        areas = SignalContext().areas
+        self.assertIsInstance(areas['gebied']['centrum'], PreparedMultiPolygon)
+        self.assertTrue(areas['gebied']['centrum'].contains(geos.Point(4.88, 52.36)))
+        self.assertFalse(areas['gebied']['centrum'].contains(geos.Point(1.0, 1.0)))
+        with self.assertRaises(KeyError):
+            areas['unknown']
+
+        # Areas added (or changed) later are picked up by the next context
+        AreaFactory.create(
+            geometry=geos.MultiPolygon([geos.Polygon.from_bbox([4.929686, 52.357204, 4.97, 52.385239])], srid=4326),
+            name='oost',
+            code='oost',
+            _type=self.area._type)
+
+        areas = SignalContext().areas
+        self.assertEqual(set(areas['gebied'].keys()), {'centrum', 'oost'})
+
+    def test_routing_table_is_cached(self):
+        routing_table = self.dsl_service.get_routing_table()
+        self.assertEqual(len(routing_table), 1)
+        self.assertEqual(routing_table[0].department_id, self.department.id)
+
+        with patch.object(SignalDslService, '_build_routing_table') as mocked_build_routing_table:
+            self.assertIs(SignalDslService().get_routing_table(), routing_table)
+        mocked_build_routing_table.assert_not_called()
+
+    @patch('signals.apps.services.domain.dsl.time.monotonic')
+    def test_routing_table_version_checked_once_per_interval(self, monotonic):
+        monotonic.return_value = 1000.0
+        routing_table = self.dsl_service.get_routing_table()
+
+        # Another process replaced the version, it is noticed after the interval
+        SignalDslService.routing_table_version.replace()
+        with self.assertNumQueries(0):
+            self.assertIs(self.dsl_service.get_routing_table(), routing_table)
+
+        monotonic.return_value = 1000.0 + SignalDslService.VERSION_CHECK_INTERVAL
+        self.assertIsNot(self.dsl_service.get_routing_table(), routing_table)
+
+    @patch('signals.apps.services.domain.dsl.time.monotonic')
+    def test_routing_table_max_age(self, monotonic):
+        monotonic.return_value = 1000.0
+        routing_table = self.dsl_service.get_routing_table()
+
+        monotonic.return_value = 1000.0 + SignalDslService.MAX_AGE
+        self.assertIsNot(self.dsl_service.get_routing_table(), routing_table)
+
+    def test_routing_table_invalidated_on_changes(self):
+        self.assertEqual(len(self.dsl_service.get_routing_table()), 1)
+
+        other_expression = ExpressionFactory.create(
+            _type=self.exp_routing_type,
+            name="test other",
+            code='stadsdeel == "B"'
+        )
+        RoutingExpressionFactory.create(
+            _expression=other_expression,
+            _department=self.department,
+            is_active=True,
+            order=1
+        )
+        self.assertEqual(len(self.dsl_service.get_routing_table()), 2)
+
+        other_expression.routing_department.is_active = False
+        other_expression.routing_department.save()
+        self.assertEqual(len(self.dsl_service.get_routing_table()), 1)
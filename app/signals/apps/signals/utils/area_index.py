@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import threading
+import time
+from bisect import bisect_right
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+from django.contrib.gis.geos import GEOSGeometry
+
+from signals.apps.dsl.prepared_geometry import PreparedMultiPolygon
+from signals.apps.services.domain.cache_version import CacheVersion
+from signals.apps.signals.models import Area, AreaType
+
+
+@dataclass(frozen=True)
+class _IndexedArea:
+    geometry: PreparedMultiPolygon
+    area: Area
+
+
+class _AreaTypeIndex:
+    """
+    The prepared geometries of the Areas of one AreaType (or of all Areas), sorted on the minimum x of their extent
+    so a point is only tested against the Areas that can contain it
+    """
+    def __init__(self, areas: list[Area]):
+        # The position in the given list is kept, so a lookup returns the same Area as Area.objects...first() would
+        self.entries = sorted(
+            (_IndexedArea(geometry=PreparedMultiPolygon(area.geometry), area=area) for area in areas),
+            key=lambda entry: entry.geometry.extent[0]
+        )
+        self.min_xs = [entry.geometry.extent[0] for entry in self.entries]
+        self.order = {area.pk: position for position, area in enumerate(areas)}
+        self.srid = areas[0].geometry.srid if areas else None
+
+    def find(self, geometry: GEOSGeometry) -> Optional[Area]:
+        if self.srid and geometry.srid and geometry.srid != self.srid:
+            geometry = geometry.transform(self.srid, clone=True)
+
+        found = None
+        for entry in self.entries[:bisect_right(self.min_xs, geometry.extent[0])]:
+            if not entry.geometry.contains(geometry):
+                continue
+            if found is None or self.order[entry.area.pk] < self.order[found.pk]:
+                found = entry.area
+        return found
+
+
+class _AreasByTypeName(Mapping):
+    """
+    The "areas" of the routing DSL context, {AreaType name: {Area code: PreparedMultiPolygon}}. The Areas of an
+    AreaType are loaded the first time the AreaType is used in a rule.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded: dict[str, Optional[dict[str, PreparedMultiPolygon]]] = {}
+
+    def _load(self, name: str) -> Optional[dict[str, PreparedMultiPolygon]]:
+        areas = {area.code: PreparedMultiPolygon(area.geometry) for area in Area.objects.filter(_type__name=name)}
+        if not areas and not AreaType.objects.filter(name=name).exists():
+            return None  # Unknown AreaType
+        return areas
+
+    def __getitem__(self, name: str) -> dict[str, PreparedMultiPolygon]:
+        if name not in self._loaded:
+            with self._lock:
+                if name not in self._loaded:
+                    self._loaded[name] = self._load(name)
+
+        areas = self._loaded[name]
+        if areas is None:
+            raise KeyError(name)
+        return areas
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(AreaType.objects.values_list('name', flat=True).distinct())
+
+    def __len__(self) -> int:
+        return AreaType.objects.values_list('name', flat=True).distinct().count()
+
+
+class AreaIndex:
+    """
+    In-process spatial indexes of the Area geometries, used to determine the Area (and stadsdeel) of a location and
+    to evaluate "location in areas..." in routing rules without querying the database
+
+    The indexes are built on first use. All processes share one version in the cache, the version is replaced
+    whenever an Area or AreaType changes or areas are loaded (load_areas), after which every process rebuilds its
+    indexes. The version is read at most once per VERSION_CHECK_INTERVAL seconds, so most lookups do not query at all.
+    """
+    VERSION_CHECK_INTERVAL = 1
+
+    cache_version = CacheVersion('signals-area-index-version')
+
+    _lock = threading.Lock()
+    _version: Optional[str] = None
+    _version_checked_at = 0.0
+    _indexes: dict[Optional[str], _AreaTypeIndex] = {}
+    _areas_by_type_name = _AreasByTypeName()
+
+    @classmethod
+    def get_version(cls) -> str:
+        return cls.cache_version.get()
+
+    @classmethod
+    def _reset(cls, version: Optional[str] = None) -> None:
+        cls._version = version
+        cls._indexes = {}
+        cls._areas_by_type_name = _AreasByTypeName()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._reset()
+        cls.cache_version.replace()
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forgets the indexes of this process (without replacing the shared version)
+        """
+        with cls._lock:
+            cls._reset()
+
+    @classmethod
+    def _check_version(cls) -> None:
+        now = time.monotonic()
+        if cls._version is not None and now - cls._version_checked_at < cls.VERSION_CHECK_INTERVAL:
+            return
+
+        # Read outside of the lock, other threads can keep using the indexes meanwhile
+        version = cls.get_version()
+        with cls._lock:
+            if cls._version != version:
+                cls._reset(version)
+            cls._version_checked_at = now
+
+    @staticmethod
+    def _build(area_type: Optional[str]) -> _AreaTypeIndex:
+        areas = Area.objects.select_related('_type')
+        if area_type:
+            areas = areas.filter(_type__code=area_type)
+        return _AreaTypeIndex(list(areas))
+
+    @classmethod
+    def find(cls, geometry: GEOSGeometry, area_type: Optional[str] = None) -> Optional[Area]:
+        """
+        Returns the first Area (of the given AreaType code) that contains the geometry, or None
+        """
+        cls._check_version()
+        with cls._lock:
+            if area_type not in cls._indexes:
+                cls._indexes[area_type] = cls._build(area_type)
+            index = cls._indexes[area_type]
+
+        return index.find(geometry)
+
+    @classmethod
+    def areas_by_type_name(cls) -> Mapping[str, dict[str, PreparedMultiPolygon]]:
+        """
+        Returns the "areas" of the routing DSL context, {AreaType name: {Area code: PreparedMultiPolygon}}
+        """
+        cls._check_version()
+        with cls._lock:
+            return cls._areas_by_type_name
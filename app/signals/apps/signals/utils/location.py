@@ -1,13 +1,13 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2020 - 2025 Gemeente Amsterdam
+# Copyright (C) 2020 - 2026 Gemeente Amsterdam
 import re
 from typing import Optional
 
 from django.conf import settings
 from django.contrib.gis.db.models import PointField
-from django.db.models import Q
 
 from signals.apps.signals.models import Area
+from signals.apps.signals.utils.area_index import AreaIndex
 
 
 def _get_area(geometry: PointField, area_type: Optional[str] = None) -> Optional[Area]:
@@ -15,16 +15,13 @@ def _get_area(geometry: PointField, area_type: Optional[str] = None) -> Optional
     Returns the first Area found based on the given
     Retrieves the Area based on the geometry and area type, returns None is the Area is not found
 
+    The Area is looked up in the in-process AreaIndex, no database query is needed
+
     :param geometry:
     :param area_type:
     :return: Area or None
     """
-    query = Q(geometry__contains=geometry)
-    if area_type:
-        query &= Q(_type__code=area_type)
-
-    areas = Area.objects.filter(query)
-    return areas.first() if areas.exists() else None
+    return AreaIndex.find(geometry=geometry, area_type=area_type)
 
 
 def _get_stadsdeel_code(geometry: PointField, default: Optional[str] = None) -> Optional[str]:
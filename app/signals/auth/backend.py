@@ -1,7 +1,12 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2025 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from typing import override
 
+import jwt
 from django.conf import settings
 from django.contrib.auth.models import User
 from mozilla_django_oidc.contrib.drf import OIDCAuthentication
@@ -9,9 +14,75 @@ from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.request import Request
 
 
+class TokenCache:
+    """
+    Bounded in-memory cache of verified access tokens to the id of the resolved user
+
+    The tokens are stored as a hash, an entry expires after OIDC_TOKEN_CACHE_TTL seconds but never after the "exp" of
+    the token. When the cache is full the least recently used entry is removed.
+    """
+    def __init__(self):
+        self._entries: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> int | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            user_id, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return user_id
+
+    def set(self, token: str, user_id: int, expires_at: float | None = None) -> None:
+        ttl_expires_at = time.time() + settings.OIDC_TOKEN_CACHE_TTL
+        expires_at = ttl_expires_at if expires_at is None else min(expires_at, ttl_expires_at)
+        if expires_at <= time.time():
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.OIDC_TOKEN_CACHE_MAX_SIZE:
+                self._entries.popitem(last=False)
+
+    def delete(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def get_token_expiry(access_token: str) -> float | None:
+    """
+    Returns the "exp" claim of a (verified) JWT access token, None for an opaque token
+    """
+    try:
+        expires_at = jwt.decode(access_token, options={'verify_signature': False}).get('exp')
+    except jwt.InvalidTokenError:
+        return None
+    return float(expires_at) if isinstance(expires_at, (int, float)) else None
+
+
 class JWTAuthBackend(OIDCAuthentication):
     www_authenticate_realm = "signals"
 
+    # The authentication class is instantiated for every request, the cache is shared by all instances in the process
+    token_cache = TokenCache()
+
     @override
     def authenticate(self, request: Request) -> tuple[User, str]:
         if settings.SIGNALS_AUTH.get("ALWAYS_OK", False):
@@ -22,6 +93,10 @@ class JWTAuthBackend(OIDCAuthentication):
 
             return user, ""
 
+        cached = self.authenticate_cached_token(request)
+        if cached is not None:
+            return cached
+
         user, access_token = super().authenticate(request)
 
         if user is None:
@@ -33,4 +108,23 @@ class JWTAuthBackend(OIDCAuthentication):
         if user.is_active is False:
             raise AuthenticationFailed("User is inactive")
 
+        self.token_cache.set(access_token, user.pk, get_token_expiry(access_token))
+
+        return user, access_token
+
+    def authenticate_cached_token(self, request: Request) -> tuple[User, str] | None:
+        """
+        Authenticate with an access token that was verified before, the token is not verified again (and the user
+        info is not requested again) until the cache entry expires
+        """
+        access_token = self.get_access_token(request)
+        user_id = self.token_cache.get(access_token) if access_token else None
+        if user_id is None:
+            return None
+
+        user = User.objects.filter(pk=user_id).first()
+        if user is None or user.is_active is False:
+            self.token_cache.delete(access_token)
+            raise AuthenticationFailed("User is inactive")
+
         return user, access_token
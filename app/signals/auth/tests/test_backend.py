@@ -1,15 +1,18 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2025 Gemeente Amsterdam
-from unittest.mock import Mock
+# Copyright (C) 2025 - 2026 Gemeente Amsterdam
+import time
+from unittest.mock import Mock, patch
 
+import jwt
 import pytest
 from django.contrib.auth.backends import BaseBackend
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
 
 from signals.apps.users.factories import SuperUserFactory
-from signals.auth.backend import JWTAuthBackend
+from signals.auth.backend import JWTAuthBackend, TokenCache
 
 
 class TestJWTAuthBackend(TestCase):
@@ -35,3 +38,64 @@ class TestJWTAuthBackend(TestCase):
 
         with pytest.raises(AuthenticationFailed):
             self.backend.authenticate(Mock(Request))
+
+
+@override_settings(SIGNALS_AUTH={'ALWAYS_OK': False}, OIDC_TOKEN_CACHE_TTL=300, OIDC_TOKEN_CACHE_MAX_SIZE=2)
+class TestJWTAuthBackendTokenCache(TestCase):
+    def setUp(self):
+        JWTAuthBackend.token_cache.clear()
+        self.user = SuperUserFactory.create()
+        self.oidc_backend = Mock()
+        self.oidc_backend.get_or_create_user.return_value = self.user
+        self.backend = JWTAuthBackend(backend=self.oidc_backend)
+
+    def _request(self, token):
+        return Request(APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Bearer {token}'))
+
+    def test_verified_token_is_cached(self) -> None:
+        token = jwt.encode({'exp': int(time.time()) + 3600}, 'secret', algorithm='HS256')
+
+        for _ in range(3):
+            user, access_token = self.backend.authenticate(self._request(token))
+            assert user == self.user
+            assert access_token == token
+
+        self.oidc_backend.get_or_create_user.assert_called_once_with(token, None, None)
+
+    def test_cached_token_of_inactive_user(self) -> None:
+        token = jwt.encode({'exp': int(time.time()) + 3600}, 'secret', algorithm='HS256')
+        self.backend.authenticate(self._request(token))
+
+        self.user.is_active = False
+        self.user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            self.backend.authenticate(self._request(token))
+        assert JWTAuthBackend.token_cache.get(token) is None
+
+    def test_cache_expires_at_token_exp(self) -> None:
+        now = time.time()
+        token = jwt.encode({'exp': int(now) + 10}, 'secret', algorithm='HS256')
+        self.backend.authenticate(self._request(token))
+
+        with patch('signals.auth.backend.time.time', return_value=now + 11):
+            self.backend.authenticate(self._request(token))
+
+        assert self.oidc_backend.get_or_create_user.call_count == 2
+
+    def test_cache_is_bounded(self) -> None:
+        cache = TokenCache()
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1  # "b" is now the least recently used entry
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_expired_token_is_not_cached(self) -> None:
+        cache = TokenCache()
+        cache.set('token', 1, time.time() - 1)
+
+        assert cache.get('token') is None
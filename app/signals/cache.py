@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+from functools import cached_property
+from typing import Any
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, BaseCache, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+_MISSING = object()
+
+
+class LayeredCache(BaseCache):
+    """
+    A local-memory cache in every process in front of a cache shared by all processes
+
+    Reads are served from local memory when possible, otherwise from the shared cache (and kept in local memory for
+    at most LOCAL_TIMEOUT seconds). Writes go to both. Counters (incr/decr) always go to the shared cache, so they are
+    as atomic as the shared cache makes them (Redis, Memcached, not the database cache).
+
+    A value changed by another process can be seen up to LOCAL_TIMEOUT seconds late, keep it short.
+
+    Options:
+    - SHARED_CACHE: the alias of the shared cache in settings.CACHES (default "shared")
+    - LOCAL_TIMEOUT: the number of seconds a value is kept in local memory (default 5)
+    - LOCAL_MAX_ENTRIES: the number of values kept in local memory (default 1000)
+    """
+    def __init__(self, location: str, params: dict[str, Any]):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._shared_alias = options.get('SHARED_CACHE', 'shared')
+        self._local_timeout = int(options.get('LOCAL_TIMEOUT', 5))
+        self._local = LocMemCache(f'signals-layered-cache-{location}', {
+            'TIMEOUT': self._local_timeout,
+            'OPTIONS': {'MAX_ENTRIES': int(options.get('LOCAL_MAX_ENTRIES', 1000))},
+        })
+
+    @cached_property
+    def _shared(self) -> BaseCache:
+        return caches[self._shared_alias]
+
+    def _get_local_timeout(self, timeout: float | None | object) -> float:
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return self._local_timeout
+        return min(timeout, self._local_timeout)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self._shared.add(key, value, timeout, version)
+        if added:
+            self._local.set(key, value, self._get_local_timeout(timeout), version)
+        return added
+
+    def get(self, key, default=None, version=None):
+        value = self._local.get(key, _MISSING, version)
+        if value is _MISSING:
+            value = self._shared.get(key, _MISSING, version)
+            if value is _MISSING:
+                return default
+            self._local.set(key, value, self._local_timeout, version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._shared.set(key, value, timeout, version)
+        self._local.set(key, value, self._get_local_timeout(timeout), version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self._local.delete(key, version)
+        return self._shared.touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        self._local.delete(key, version)
+        return self._shared.delete(key, version)
+
+    def has_key(self, key, version=None):
+        return self._local.has_key(key, version) or self._shared.has_key(key, version)
+
+    def incr(self, key, delta=1, version=None):
+        self._local.delete(key, version)
+        return self._shared.incr(key, delta, version)
+
+    def decr(self, key, delta=1, version=None):
+        self._local.delete(key, version)
+        return self._shared.decr(key, delta, version)
+
+    def get_many(self, keys, version=None):
+        found = self._local.get_many(keys, version)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            shared = self._shared.get_many(missing, version)
+            self._local.set_many(shared, self._local_timeout, version)
+            found.update(shared)
+        return found
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self._shared.set_many(data, timeout, version)
+        self._local.set_many(data, self._get_local_timeout(timeout), version)
+        return failed
+
+    def delete_many(self, keys, version=None):
+        self._local.delete_many(keys, version)
+        self._shared.delete_many(keys, version)
+
+    def clear(self):
+        self._local.clear()
+        self._shared.clear()
+
+    def close(self, **kwargs):
+        self._shared.close(**kwargs)
+
+
+def uses_database_cache(alias: str = DEFAULT_CACHE_ALIAS) -> bool:
+    """
+    Whether the values of the cache are stored in the database cache (itself or as the shared cache of a LayeredCache)
+    """
+    backend = caches[alias]
+    if isinstance(backend, LayeredCache):
+        backend = backend._shared
+    return isinstance(backend, DatabaseCache)
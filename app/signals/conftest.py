@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: MPL-2.0
+# Copyright (C) 2026 Gemeente Amsterdam
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_in_process_caches():
+    """
+    The in-process caches only check their version once per interval, data rolled back at the end of the previous test
+    (without signalling a change) must not be found in the next test
+    """
+    from signals.apps.email_integrations.renderers.email_template_renderer import (
+        EmailTemplateRenderer
+    )
+    from signals.apps.services.domain.dsl import SignalDslService
+    from signals.apps.services.domain.permissions.snapshot import PermissionSnapshotService
+    from signals.apps.signals.utils.area_index import AreaIndex
+
+    AreaIndex.clear()
+    SignalDslService.clear_routing_table()
+    PermissionSnapshotService.clear()
+    EmailTemplateRenderer.clear()
+    yield
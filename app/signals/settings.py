@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2024 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
 import json
 import os
 from typing import Any, Callable
@@ -173,6 +173,12 @@ OIDC_OP_ISSUER: str | None = os.getenv("OIDC_OP_ISSUER")
 OIDC_TRUSTED_AUDIENCES: list[str] = json.loads(os.getenv("OIDC_TRUSTED_AUDIENCES", '[]'))
 OIDC_VERIFY_AUDIENCE: bool = os.getenv('OIDC_VERIFY_AUDIENCE', True) in TRUE_VALUES
 OIDC_USE_NONCE: bool = os.getenv('OIDC_USE_NONCE', True) in TRUE_VALUES
+# The signing keys of the OP (JWKS) are kept in memory, they are fetched again
+# when a token is signed by an unknown key
+OIDC_JWKS_CACHE_TTL: int = int(os.getenv('OIDC_JWKS_CACHE_TTL', 3600))
+# Verified access tokens are mapped to the user for at most this many seconds (and never beyond the "exp" of the token)
+OIDC_TOKEN_CACHE_TTL: int = int(os.getenv('OIDC_TOKEN_CACHE_TTL', 300))
+OIDC_TOKEN_CACHE_MAX_SIZE: int = int(os.getenv('OIDC_TOKEN_CACHE_MAX_SIZE', 1024))
 
 AUTHENTICATION_BACKENDS: list[str] = [
     'signals.admin.oidc.backends.AuthenticationBackend',
@@ -224,7 +230,7 @@ DATABASES: dict[str, dict[str, str | int | None]] = {
 }
 
 # Django cache settings
-CACHES: dict[str, dict[str, str | int]] = {
+CACHES: dict[str, dict[str, Any]] = {
     'default': {
         'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
         'LOCATION': 'signals_cache',
@@ -232,6 +238,31 @@ CACHES: dict[str, dict[str, str | int]] = {
     }
 }
 
+# Optionally keep a short-lived copy of cached values in the memory of every process, in front of a cache shared by
+# all processes. The shared cache defaults to the database cache, point it to a networked cache to take the cache
+# load off the database, for example (requires the redis package, which is not part of the requirements):
+# CACHE_SHARED_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_SHARED_LOCATION=redis://redis:6379/0
+# With the database cache the throttles keep their counters in the ThrottleCounter table (one query per request),
+# with any other cache they keep them in the cache.
+CACHE_LAYERED: bool = os.getenv('CACHE_LAYERED', False) in TRUE_VALUES
+if CACHE_LAYERED:
+    CACHES['shared'] = {
+        'BACKEND': os.getenv('CACHE_SHARED_BACKEND', 'django.core.cache.backends.db.DatabaseCache'),
+        'LOCATION': os.getenv('CACHE_SHARED_LOCATION', 'signals_cache'),
+        'TIMEOUT': os.getenv('CACHE_TIMEOUT', 3900),
+    }
+    CACHES['default'] = {
+        'BACKEND': 'signals.cache.LayeredCache',
+        'OPTIONS': {
+            'SHARED_CACHE': 'shared',
+            'LOCAL_TIMEOUT': int(os.getenv('CACHE_LOCAL_TIMEOUT', 5)),
+        },
+    }
+
+# Sessions are stored in the database by default, use "django.contrib.sessions.backends.cached_db" to read them from
+# the cache
+SESSION_ENGINE: str = os.getenv('SESSION_ENGINE', 'django.contrib.sessions.backends.db')
+
 # Django security settings
 SECURE_SSL_REDIRECT: bool = os.getenv('SECURE_SSL_REDIRECT', True) in TRUE_VALUES
 SECURE_REDIRECT_EXEMPT: list[str] = [r'^status/', ]  # Allow health checks on localhost.
@@ -295,6 +326,12 @@ FILE_UPLOAD_PERMISSIONS: None = None
 
 # Object store - Datawarehouse (DWH)
 DWH_MEDIA_ROOT: str | None = os.getenv('DWH_MEDIA_ROOT')
+# The number of CSV files that are exported in parallel (every export uses its own database connection)
+DWH_EXPORT_WORKERS: int = int(os.getenv('DWH_EXPORT_WORKERS', 4))
+# The file format of the exports per storage target, "csv" or "parquet" (typed and compressed columns)
+EXPORT_FILE_FORMATS: dict[str, str] = {
+    'datawarehouse': os.getenv('DWH_EXPORT_FILE_FORMAT', 'csv'),
+}
 
 SIGNALS_AUTH: dict[str, str | bool | list[str] | None] = {
     'USER_ID_FIELDS': os.getenv('USER_ID_FIELDS', 'email').split(','),
@@ -419,7 +456,7 @@ FRONTEND_URL: str | None = os.getenv('FRONTEND_URL', None)
 ML_TOOL_ENDPOINT: str = os.getenv('SIGNALS_ML_TOOL_ENDPOINT', 'https://api.data.amsterdam.nl/signals_mltool')  # noqa
 
 # Search settings
-SEARCH: dict[str, int | dict[str, str]] = {
+SEARCH: dict[str, int | float | dict[str, str]] = {
     'PAGE_SIZE': 500,
     'CONNECTION': {
         'HOST': os.getenv('ELASTICSEARCH_HOST', 'elastic-index.service.consul:9200'),
@@ -427,6 +464,12 @@ SEARCH: dict[str, int | dict[str, str]] = {
         'STATUS_MESSAGE_INDEX': os.getenv('ELASTICSEARCH_STATUS_MESSAGE_INDEX', 'status_messages'),
     },
     'TIMEOUT': int(os.getenv('ELASTICSEARCH_TIMEOUT', 10)),
+    'INDEX_BATCH_SIZE': int(os.getenv('ELASTICSEARCH_INDEX_BATCH_SIZE', 2000)),
+    'INDEX_CHUNK_SIZE': int(os.getenv('ELASTICSEARCH_INDEX_CHUNK_SIZE', 500)),
+    'INDEX_THREAD_COUNT': int(os.getenv('ELASTICSEARCH_INDEX_THREAD_COUNT', 4)),
+    'INDEX_DEBOUNCE_WINDOW': float(os.getenv('ELASTICSEARCH_INDEX_DEBOUNCE_WINDOW', 2.0)),
+    'CIRCUIT_BREAKER_FAILURE_THRESHOLD': int(os.getenv('ELASTICSEARCH_CIRCUIT_BREAKER_FAILURE_THRESHOLD', 3)),
+    'CIRCUIT_BREAKER_RESET_TIMEOUT': float(os.getenv('ELASTICSEARCH_CIRCUIT_BREAKER_RESET_TIMEOUT', 30.0)),
 }
 
 API_DETERMINE_STADSDEEL_ENABLED_AREA_TYPE: str = 'sia-stadsdeel'
@@ -518,6 +561,24 @@ SIGNALS_API_GEO_PAGINATE_BY: int = int(os.getenv(
     'SIGNALS_API_GEO_PAGINATE_BY', '4000'
 ))
 
+# Below this zoom level the public geography endpoint returns clusters (when a zoom level is given)
+SIGNALS_API_GEO_CLUSTER_BELOW_ZOOM: int = int(os.getenv(
+    'SIGNALS_API_GEO_CLUSTER_BELOW_ZOOM', '14'
+))
+SIGNALS_API_GEO_CLUSTER_SIZE_PIXELS: int = int(os.getenv(
+    'SIGNALS_API_GEO_CLUSTER_SIZE_PIXELS', '64'
+))  # The size of a (square) cluster on the map
+
+# The number of seconds the vector tiles of the geography endpoints may be cached
+SIGNALS_API_MVT_MAX_AGE: int = int(os.getenv(
+    'SIGNALS_API_MVT_MAX_AGE', '60'
+))
+
+# The number of seconds the counts of the stored signal filters on the overview are cached
+SIGNAL_FILTER_COUNTS_CACHE_TTL: int = int(os.getenv(
+    'SIGNAL_FILTER_COUNTS_CACHE_TTL', '60'
+))
+
 TEST_LOGIN: str = os.getenv('TEST_LOGIN', 'signals.admin@example.com')
 
 # Feature Flags
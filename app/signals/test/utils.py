@@ -1,8 +1,10 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2019 - 2021 Gemeente Amsterdam
+# Copyright (C) 2019 - 2026 Gemeente Amsterdam
 import json
 
 from django.contrib.auth.models import Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from jsonschema import validate
 from rest_framework.test import APITestCase
 
@@ -116,3 +118,26 @@ class SignalsBaseApiTestCase(SuperUserMixin, SimpleUserMixin, APITestCase):
     def load_json_schema(filename: str):
         with open(filename) as f:
             return json.load(f)
+
+    def assertQueryCountPerPageSize(self, url: str, page_sizes: tuple = (1, 10), expected: int = None,
+                                    params: dict = None) -> int:
+        """ Requests url once for every page size and asserts that all pages cost the same number of
+        queries (optionally exactly the expected number), so the number of queries does not grow with
+        the number of rows on a page. The first request is not counted, it warms up the caches (for
+        example the permissions of the authenticated user). Returns the number of queries per page. """
+        params = params or {}
+        self.assertEqual(self.client.get(url, params).status_code, 200)
+
+        query_counts = {}
+        for page_size in page_sizes:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, {**params, 'page_size': page_size})
+            self.assertEqual(response.status_code, 200)
+            query_counts[page_size] = len(context.captured_queries)
+
+        self.assertEqual(len(set(query_counts.values())), 1,
+                         f'Number of queries per page size differs: {query_counts}')
+        query_count = query_counts[page_sizes[0]]
+        if expected is not None:
+            self.assertEqual(query_count, expected)
+        return query_count
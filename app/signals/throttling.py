@@ -1,15 +1,120 @@
 # SPDX-License-Identifier: MPL-2.0
-# Copyright (C) 2018 - 2023 Gemeente Amsterdam
+# Copyright (C) 2018 - 2026 Gemeente Amsterdam
 import logging
+import random
 
 from rest_framework.request import Request
 from rest_framework.throttling import SimpleRateThrottle
 from rest_framework.views import APIView
 
+from signals.cache import uses_database_cache
+
 logger = logging.getLogger('django')
 
 
-class PostOnlyNoUserRateThrottle(SimpleRateThrottle):
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    Limits the rate of API calls with a sliding window counter.
+
+    Instead of the request history (read, changed and written back on every request by the SimpleRateThrottle) two
+    counters are kept per client: one for the current and one for the previous fixed window of the throttle duration.
+    The number of requests in the sliding window is estimated from the current count and the part of the previous
+    count that still falls within the sliding window.
+
+    With the database cache, in which an incr is a read and a write, the counters are kept in a ThrottleCounter that is
+    counted and read with one atomic statement. With any other cache they are kept in the cache and updated with an
+    (atomic) cache.incr, a networked cache that increments atomically (Redis, Memcached) is recommended.
+    """
+    # About one in cull_frequency new windows deletes the expired ThrottleCounters
+    cull_frequency = 100
+
+    def _get_counter_key(self, window: int) -> str:
+        return f'{self.key}:{window}'
+
+    def _incr(self, key: str) -> int:
+        try:
+            return self.cache.incr(key)
+        except ValueError:
+            # First request of this window, the counter is kept until the end of the next window
+            if self.cache.add(key, 1, self.duration * 2):
+                return 1
+            return self.cache.incr(key)
+
+    def _count_request_in_cache(self, window: int) -> tuple[int, int]:
+        return self._incr(self._get_counter_key(window)), self.cache.get(self._get_counter_key(window - 1), 0)
+
+    def _uncount_request_in_cache(self, window: int) -> int:
+        try:
+            return self.cache.decr(self._get_counter_key(window))
+        except ValueError:
+            return 0
+
+    def _count_request_in_database(self, window: int) -> tuple[int, int]:
+        from signals.apps.signals.models import ThrottleCounter
+
+        current_count, previous_count = ThrottleCounter.objects.count_request(
+            self.key, window, expires=(window + 2) * self.duration
+        )
+        if current_count == 1 and random.randrange(self.cull_frequency) == 0:
+            ThrottleCounter.objects.delete_expired(self.now)
+        return current_count, previous_count
+
+    def _uncount_request_in_database(self, window: int) -> int:
+        from signals.apps.signals.models import ThrottleCounter
+
+        ThrottleCounter.objects.uncount_request(self.key, window)
+        return max(self.current_count - 1, 0)
+
+    def _estimate(self) -> float:
+        return self.previous_count * (self.duration - self.elapsed) / self.duration + self.current_count
+
+    def allow_request(self, request: Request, view: APIView) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.elapsed = self.now - window * self.duration
+
+        in_database = uses_database_cache()
+        if in_database:
+            self.current_count, self.previous_count = self._count_request_in_database(window)
+        else:
+            self.current_count, self.previous_count = self._count_request_in_cache(window)
+        if self._estimate() <= self.num_requests:
+            return True
+
+        # Denied requests are not counted
+        if in_database:
+            self.current_count = self._uncount_request_in_database(window)
+        else:
+            self.current_count = self._uncount_request_in_cache(window)
+        return False
+
+    def wait(self) -> float | None:
+        """
+        Returns the number of seconds until the next request fits within the rate again
+        """
+        if self.num_requests == 0:
+            return None
+
+        available = self.num_requests - 1 - self.current_count
+        if available >= 0:
+            if not self.previous_count:
+                return 0
+            # Within the current window, once enough of the previous window fell out of the sliding window
+            return max(self.duration * (1 - available / self.previous_count) - self.elapsed, 0)
+
+        # In the next window, in which the current count becomes the previous count
+        available = self.num_requests - 1
+        return self.duration - self.elapsed + self.duration * (1 - available / self.current_count)
+
+
+class PostOnlyNoUserRateThrottle(SlidingWindowRateThrottle):
     """Limits the rate of API calls that does not look at the user.
     The IP address of the request will be used as the unique cache key."""
     scope: str = 'nouser'